@@ -8,6 +8,8 @@ Provides automated code review with:
 - Automated fix suggestions
 """
 
+import json
+import os
 import subprocess
 from dataclasses import dataclass, field
 from enum import Enum
@@ -15,6 +17,28 @@ from pathlib import Path
 from typing import Any
 
 
+# Seconds allowed for one analysis tool run, plus a little per file in a batch
+ANALYSIS_TIMEOUT = 30
+ANALYSIS_TIMEOUT_PER_FILE = 1
+
+# Files passed to one analysis tool invocation (keeps command lines short)
+ANALYSIS_BATCH_FILES = 200
+
+
+class _BatchError(Exception):
+    """An analysis tool failed a multi-file run as a whole."""
+
+
+def _path_key(path: str | Path) -> str:
+    """Normalized form of path for matching tool output to inputs."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _batch_timeout(file_paths: list[Path]) -> int:
+    """Timeout for one tool run over file_paths."""
+    return ANALYSIS_TIMEOUT + ANALYSIS_TIMEOUT_PER_FILE * (len(file_paths) - 1)
+
+
 class Severity(Enum):
     """Issue severity levels."""
     INFO = "info"
@@ -83,18 +107,34 @@ class StaticAnalyzer:
 
     def _run_mypy(self, file_path: Path) -> list[CodeIssue]:
         """Run mypy type checker."""
+        return self._run_mypy_batch([file_path]).get(_path_key(file_path), [])
+
+    def _run_mypy_batch(self, file_paths: list[Path]) -> dict[str, list[CodeIssue]]:
+        """
+        Run mypy once over several files, grouping issues by file.
+
+        Returns issues keyed by _path_key. Issues in files outside the
+        batch (e.g. followed imports) are dropped.
+
+        Raises:
+            _BatchError: If mypy refused the batch as a whole, e.g. two
+                files map to the same module name
+        """
         if not self.available_tools.get("mypy"):
-            return []
+            return {}
 
-        issues = []
+        by_file: dict[str, list[CodeIssue]] = {_path_key(p): [] for p in file_paths}
+        names = {_path_key(p): str(p) for p in file_paths}
         try:
             result = subprocess.run(
-                ["mypy", "--no-error-summary", str(file_path)],
+                ["mypy", "--no-error-summary", "--show-absolute-path", *map(str, file_paths)],
                 capture_output=True,
                 text=True,
-                timeout=30,
+                timeout=_batch_timeout(file_paths),
                 check=False
             )
+            if result.returncode == 2 and len(file_paths) > 1:
+                raise _BatchError("mypy rejected the batch")
 
             # Parse mypy output
             for line in result.stdout.splitlines():
@@ -103,13 +143,16 @@ class StaticAnalyzer:
 
                 parts = line.split(":", 3)
                 if len(parts) >= 4:
+                    key = _path_key(parts[0])
+                    if key not in by_file:
+                        continue
                     try:
                         line_num = int(parts[1])
                         severity = Severity.ERROR if "error:" in line else Severity.WARNING
                         message = parts[3].strip()
 
-                        issues.append(CodeIssue(
-                            file=str(file_path),
+                        by_file[key].append(CodeIssue(
+                            file=names[key],
                             line=line_num,
                             column=None,
                             severity=severity,
@@ -123,65 +166,85 @@ class StaticAnalyzer:
         except subprocess.TimeoutExpired:
             pass
 
-        return issues
+        return by_file
 
     def _run_ruff(self, file_path: Path) -> list[CodeIssue]:
         """Run ruff linter."""
+        return self._run_ruff_batch([file_path]).get(_path_key(file_path), [])
+
+    def _run_ruff_batch(self, file_paths: list[Path]) -> dict[str, list[CodeIssue]]:
+        """Run ruff once over several files, grouping issues by file."""
         if not self.available_tools.get("ruff"):
-            return []
+            return {}
 
-        issues = []
+        by_file: dict[str, list[CodeIssue]] = {_path_key(p): [] for p in file_paths}
+        names = {_path_key(p): str(p) for p in file_paths}
         try:
             result = subprocess.run(
-                ["ruff", "check", str(file_path), "--output-format=text"],
+                ["ruff", "check", *map(str, file_paths), "--output-format=json"],
                 capture_output=True,
                 text=True,
-                timeout=30,
+                timeout=_batch_timeout(file_paths),
                 check=False
             )
+            diagnostics = json.loads(result.stdout or "[]")
+        except (subprocess.TimeoutExpired, json.JSONDecodeError):
+            return by_file
 
-            # Parse ruff output: file.py:10:5: E501 Line too long
-            for line in result.stdout.splitlines():
-                if not line.strip() or ":" not in line:
+        for diagnostic in diagnostics:
+            try:
+                key = _path_key(diagnostic["filename"])
+                if key not in by_file:
                     continue
+                location = diagnostic.get("location") or {}
+                # Syntax errors carry no rule code
+                code = diagnostic.get("code") or "syntax-error"
+
+                # Determine severity based on code
+                if code.startswith("E") or code.startswith("F") or code == "syntax-error":
+                    severity = Severity.ERROR
+                else:
+                    severity = Severity.WARNING
+
+                by_file[key].append(CodeIssue(
+                    file=names[key],
+                    line=location.get("row"),
+                    column=location.get("column"),
+                    severity=severity,
+                    code=code,
+                    message=diagnostic["message"],
+                    tool="ruff"
+                ))
+            except (KeyError, TypeError, AttributeError):
+                continue
 
-                parts = line.split(":", 4)
-                if len(parts) >= 4:
-                    try:
-                        line_num = int(parts[1])
-                        col_num = int(parts[2]) if parts[2].strip().isdigit() else None
-
-                        # Extract code and message
-                        rest = parts[3].strip()
-                        code_and_msg = rest.split(None, 1)
-                        code = code_and_msg[0] if code_and_msg else "ruff"
-                        message = code_and_msg[1] if len(code_and_msg) > 1 else rest
-
-                        # Determine severity based on code
-                        if code.startswith("E") or code.startswith("F"):
-                            severity = Severity.ERROR
-                        else:
-                            severity = Severity.WARNING
-
-                        issues.append(CodeIssue(
-                            file=str(file_path),
-                            line=line_num,
-                            column=col_num,
-                            severity=severity,
-                            code=code,
-                            message=message,
-                            tool="ruff"
-                        ))
-                    except (ValueError, IndexError):
-                        continue
+        return by_file
 
-        except subprocess.TimeoutExpired:
-            pass
+    def _build_result(self, all_issues: list[CodeIssue]) -> ReviewResult:
+        """Wrap one file's issues in a ReviewResult with a summary."""
+        issue_counts: dict[Severity, int] = {}
+        for issue in all_issues:
+            issue_counts[issue.severity] = issue_counts.get(issue.severity, 0) + 1
 
-        return issues
+        summary_parts = []
+        if issue_counts:
+            summary_parts.append(f"Found {len(all_issues)} issues:")
+            for severity, count in sorted(issue_counts.items(), key=lambda x: x[0].value):
+                summary_parts.append(f"  {severity.value}: {count}")
+        else:
+            summary_parts.append("No issues found!")
 
-    def analyze_file(self, file_path: Path) -> ReviewResult:
-        """Run all available static analysis tools on a file."""
+        tools_used = [t for t, available in self.available_tools.items() if available]
+        summary_parts.append(f"Tools: {', '.join(tools_used) if tools_used else 'none available'}")
+
+        return ReviewResult(
+            success=True,
+            issues=all_issues,
+            summary="\n".join(summary_parts)
+        )
+
+    def _check_file(self, file_path: Path) -> ReviewResult | None:
+        """Return a failed result if file_path cannot be analyzed."""
         if not file_path.exists():
             return ReviewResult(
                 success=False,
@@ -193,6 +256,13 @@ class StaticAnalyzer:
                 success=False,
                 summary=f"Not a Python file: {file_path}"
             )
+        return None
+
+    def analyze_file(self, file_path: Path) -> ReviewResult:
+        """Run all available static analysis tools on a file."""
+        failure = self._check_file(file_path)
+        if failure is not None:
+            return failure
 
         all_issues = []
 
@@ -203,27 +273,43 @@ class StaticAnalyzer:
         if self.available_tools.get("ruff"):
             all_issues.extend(self._run_ruff(file_path))
 
-        # Generate summary
-        issue_counts = {}
-        for issue in all_issues:
-            issue_counts[issue.severity] = issue_counts.get(issue.severity, 0) + 1
-
-        summary_parts = []
-        if issue_counts:
-            summary_parts.append(f"Found {len(all_issues)} issues:")
-            for severity, count in sorted(issue_counts.items(), key=lambda x: x[0].value):
-                summary_parts.append(f"  {severity.value}: {count}")
-        else:
-            summary_parts.append("No issues found!")
-
-        tools_used = [t for t, available in self.available_tools.items() if available]
-        summary_parts.append(f"Tools: {', '.join(tools_used) if tools_used else 'none available'}")
-
-        return ReviewResult(
-            success=True,
-            issues=all_issues,
-            summary="\n".join(summary_parts)
-        )
+        return self._build_result(all_issues)
+
+    def analyze_files(self, file_paths: list[Path]) -> dict[str, ReviewResult]:
+        """
+        Run all available static analysis tools on several files.
+
+        Each tool is started once per batch of files rather than once
+        per file, so tool startup is paid a handful of times in total.
+        Results are keyed by str(path) and match analyze_file's.
+        """
+        results: dict[str, ReviewResult] = {}
+        valid = []
+        for file_path in file_paths:
+            failure = self._check_file(file_path)
+            if failure is not None:
+                results[str(file_path)] = failure
+            else:
+                valid.append(file_path)
+
+        issues: dict[str, list[CodeIssue]] = {_path_key(p): [] for p in valid}
+        for start in range(0, len(valid), ANALYSIS_BATCH_FILES):
+            batch = valid[start:start + ANALYSIS_BATCH_FILES]
+            if self.available_tools.get("mypy"):
+                try:
+                    mypy_issues = self._run_mypy_batch(batch)
+                except _BatchError:
+                    mypy_issues = {_path_key(p): self._run_mypy(p) for p in batch}
+                for key, found in mypy_issues.items():
+                    issues[key].extend(found)
+
+            if self.available_tools.get("ruff"):
+                for key, found in self._run_ruff_batch(batch).items():
+                    issues[key].extend(found)
+
+        for file_path in valid:
+            results[str(file_path)] = self._build_result(issues[_path_key(file_path)])
+        return results
 
 
 class CodeReviewer:
@@ -243,21 +329,22 @@ class CodeReviewer:
         pattern: str = "*.py"
     ) -> dict[str, ReviewResult]:
         """Review all Python files in a directory."""
-        results = {}
-
         if recursive:
             files = directory.rglob(pattern)
         else:
             files = directory.glob(pattern)
 
-        for file_path in files:
-            # Skip common directories
-            if any(part in file_path.parts for part in ["__pycache__", ".venv", "venv", "node_modules"]):
-                continue
-
-            results[str(file_path)] = self.review_file(file_path)
-
-        return results
+        # Skip common directories
+        skipped = ("__pycache__", ".venv", "venv", "node_modules")
+        file_paths = [
+            file_path for file_path in files
+            if not any(part in file_path.parts for part in skipped)
+        ]
+        return self.review_paths(file_paths)
+
+    def review_paths(self, file_paths: list[Path]) -> dict[str, ReviewResult]:
+        """Review several files, running each tool once over all of them."""
+        return self.analyzer.analyze_files(file_paths)
 
     def format_issues(self, result: ReviewResult) -> str:
         """Format review issues for display."""
@@ -15,6 +15,7 @@ from src.tools import (
     CodeSearchTool,
     GitTool,
     ListDirectoryTool,
+    PathPolicy,
     PythonExecTool,
     ReadFileTool,
     ShellTool,
@@ -54,7 +55,7 @@ class SessionManager:
         """Set up the tool registry with all available tools."""
         registry = ToolRegistry()
         # Allow working dir and /tmp for uploaded files
-        allowed_paths = [working_dir, Path("/tmp")]
+        allowed_paths = PathPolicy([working_dir, Path("/tmp")])
 
         registry.register(ReadFileTool(allowed_paths=allowed_paths))
         registry.register(WriteFileTool(allowed_paths=allowed_paths))
@@ -18,6 +18,7 @@ from src.tools import (
     CodeSearchTool,
     GitTool,
     ListDirectoryTool,
+    PathPolicy,
     ReadFileTool,
     ShellTool,
     StrReplaceTool,
@@ -63,7 +64,7 @@ def setup_tools(working_dir: Path) -> ToolRegistry:
     registry = ToolRegistry()
 
     # Filesystem tools - restricted to working directory
-    allowed_paths = [working_dir]
+    allowed_paths = PathPolicy([working_dir])
     registry.register(ReadFileTool(allowed_paths=allowed_paths))
     registry.register(WriteFileTool(allowed_paths=allowed_paths))
     registry.register(ListDirectoryTool(allowed_paths=allowed_paths))
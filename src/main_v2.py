@@ -26,6 +26,7 @@ from src.tools import (
     CodeSearchTool,
     GitTool,
     ListDirectoryTool,
+    PathPolicy,
     ReadFileTool,
     ShellTool,
     StrReplaceTool,
@@ -76,7 +77,7 @@ def setup_tools(working_dir: Path) -> ToolRegistry:
     """Set up the tool registry with all available tools."""
     registry = ToolRegistry()
 
-    allowed_paths = [working_dir]
+    allowed_paths = PathPolicy([working_dir])
     registry.register(ReadFileTool(allowed_paths=allowed_paths))
     registry.register(WriteFileTool(allowed_paths=allowed_paths))
     registry.register(ListDirectoryTool(allowed_paths=allowed_paths))
@@ -1,6 +1,6 @@
 """Tools package for the Sovereign Agent."""
 
-from .base import BaseTool, ToolRegistry, ToolResult
+from .base import BaseTool, PathPolicy, ToolRegistry, ToolResult
 from .editor import StrReplaceTool
 from .filesystem import ListDirectoryTool, ReadFileTool, WriteFileTool
 from .git import GitTool
@@ -28,6 +28,7 @@ from .vision import VisionTool, ScreenshotTool
 __all__ = [
     # Base
     "BaseTool",
+    "PathPolicy",
     "ToolRegistry",
     "ToolResult",
     # Core tools
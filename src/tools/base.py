@@ -8,8 +8,11 @@ Every tool must inherit from BaseTool and implement:
 - execute() - the actual implementation
 """
 
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 
@@ -38,7 +41,7 @@ class BaseTool(ABC):
     
     @property
     @abstractmethod
-    def parameters(self) -> dict[str, dict[str, Any]]:
+    def parameters(self) -> Mapping[str, dict[str, Any]]:
         """
         Parameter definitions.
         Format: {
@@ -72,6 +75,55 @@ class BaseTool(ABC):
 </tool_definition>"""
 
 
+class PathPolicy:
+    """
+    Decides whether paths fall inside a set of allowed directories.
+
+    Allowed roots are resolved once into string prefixes; each check
+    resolves the requested path with os.path.realpath and does a single
+    startswith. A policy is immutable, so one instance can be shared by
+    every tool in a registry. ``None`` allows everything.
+    """
+
+    __slots__ = ("_prefixes",)
+
+    def __init__(self, allowed_paths: Iterable[Path | str] | None = None) -> None:
+        self._prefixes = (
+            None if allowed_paths is None
+            else tuple(_dir_prefix(os.path.realpath(allowed)) for allowed in allowed_paths)
+        )
+
+    def is_allowed(self, path: Path | str) -> bool:
+        """Check if path is within the allowed directories."""
+        if self._prefixes is None:
+            return True
+        return _dir_prefix(os.path.realpath(path)).startswith(self._prefixes)
+
+
+def _dir_prefix(resolved: str) -> str:
+    """Normalize a resolved path so prefix tests respect component boundaries."""
+    resolved = os.path.normcase(resolved)
+    return resolved if resolved.endswith(os.sep) else resolved + os.sep
+
+
+class AllowedPathsMixin:
+    """
+    Restricts a tool to paths inside a set of allowed directories.
+
+    Accepts either a list of directories or a shared PathPolicy.
+    """
+
+    def __init__(self, allowed_paths: list[Path] | PathPolicy | None = None) -> None:
+        self._path_policy = (
+            allowed_paths if isinstance(allowed_paths, PathPolicy)
+            else PathPolicy(allowed_paths)
+        )
+
+    def _is_path_allowed(self, path: Path) -> bool:
+        """Check if path is within allowed directories."""
+        return self._path_policy.is_allowed(path)
+
+
 class ToolRegistry:
     """Registry of available tools."""
     
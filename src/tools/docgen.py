@@ -8,7 +8,12 @@ Supports Python, C++, C#, and other languages.
 import ast
 import logging
 import re
-from dataclasses import dataclass, field
+import sys
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
@@ -16,14 +21,85 @@ from .base import BaseTool, ToolResult
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Source files are read ahead in batches so disk latency overlaps parsing
+READ_WORKERS = 8
+READ_BATCH_SIZE = 64
+
+# Google-style docstring section headers and parameter lines
+_SECTION_RE = re.compile(
+    r"^[^\S\n]*(Args|Arguments|Parameters|Returns|Return|Raises|Exceptions|Examples|Example):[^\S\n]*$",
+    re.MULTILINE,
+)
+_SECTION_NAMES = {
+    "Args": "args",
+    "Arguments": "args",
+    "Parameters": "args",
+    "Returns": "returns",
+    "Return": "returns",
+    "Raises": "raises",
+    "Exceptions": "raises",
+    "Examples": "examples",
+    "Example": "examples",
+}
+_NEWLINE_RE = re.compile("\n")
+
+# Path components that mark non-source directories
+_EXCLUDED_DIR_RE = re.compile(
+    r"(?:^|/)(?:__pycache__|\.git|node_modules|venv|\.venv|build|dist)(?:/|$)"
+)
+
+# Fixed document frame for generate_html
+_HTML_HEAD = (
+    "<!DOCTYPE html>",
+    "<html lang='en'>",
+    "<head>",
+    "<meta charset='UTF-8'>",
+    "<meta name='viewport' content='width=device-width, initial-scale=1.0'>",
+    "<title>API Documentation</title>",
+    "<style>",
+    "body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; ",
+    "       max-width: 900px; margin: 0 auto; padding: 20px; line-height: 1.6; }",
+    "h1, h2, h3 { color: #333; }",
+    "pre { background: #f4f4f4; padding: 15px; border-radius: 5px; overflow-x: auto; }",
+    "code { background: #f4f4f4; padding: 2px 6px; border-radius: 3px; }",
+    ".module { border-left: 4px solid #007acc; padding-left: 15px; margin: 20px 0; }",
+    ".class { border-left: 3px solid #28a745; padding-left: 10px; margin: 15px 0; }",
+    ".function { border-left: 2px solid #6c757d; padding-left: 10px; margin: 10px 0; }",
+    ".docstring { color: #555; font-style: italic; }",
+    "</style>",
+    "</head>",
+    "<body>",
+    "<h1>API Documentation</h1>",
+)
+_HTML_TAIL = ("</body>", "</html>")
+_HTML_ESCAPES = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+# One "name (type): description" entry per line of an Args section
+_PARAM_RE = re.compile(
+    r"^[^\S\n]*(\w+)[^\S\n]*(?:\(([^)\n]+)\))?[^\S\n]*:[^\S\n]*(.*?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+
+def _escape_html(text: str) -> str:
+    """Escape text for HTML in a single translate pass."""
+    return text.translate(_HTML_ESCAPES)
+
+
+@dataclass(slots=True)
 class DocItem:
     """A documentation item."""
     name: str
     kind: str  # module, class, function, method, property, variable
     signature: str = ""
     docstring: str = ""
+    summary: str = ""  # first line of the docstring
     file_path: str = ""
     line_number: int = 0
     parameters: list[dict[str, str]] = field(default_factory=list)
@@ -32,8 +108,12 @@ class DocItem:
     examples: list[str] = field(default_factory=list)
     children: list["DocItem"] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        if self.docstring and not self.summary:
+            self.summary = self.docstring.partition("\n")[0]
+
 
-@dataclass
+@dataclass(slots=True)
 class ModuleDoc:
     """Documentation for a module/file."""
     name: str
@@ -48,14 +128,26 @@ class ModuleDoc:
 class DocGenerator:
     """Generates documentation from source code."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.modules: list[ModuleDoc] = []
 
-    def analyze_python_file(self, file_path: Path) -> ModuleDoc | None:
-        """Analyze a Python file and extract documentation."""
+    def analyze_python_file(
+        self,
+        file_path: Path,
+        nested_imports: bool = False,
+        raw: bytes | None = None,
+    ) -> ModuleDoc | None:
+        """Analyze a Python file and extract documentation.
+
+        Imports are collected from the top level of the module only; pass
+        ``nested_imports=True`` to also walk function and class bodies.
+        ``raw`` may carry file bytes that were already read.
+        """
         try:
-            content = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(content)
+            if raw is None:
+                raw = file_path.read_bytes()
+            # ast.parse decodes bytes itself, honouring any coding declaration
+            tree = ast.parse(raw, filename=str(file_path))
 
             module_doc = ModuleDoc(
                 name=file_path.stem,
@@ -63,23 +155,18 @@ class DocGenerator:
                 description=ast.get_docstring(tree) or "",
             )
 
-            # Extract imports
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        module_doc.imports.append(alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    module_name = node.module or ""
-                    for alias in node.names:
-                        module_doc.imports.append(f"{module_name}.{alias.name}")
-
-            # Process top-level nodes
+            # Annotation strings are shared across every signature in the file
+            unparse_cache: dict[int, str] = {}
+
+            # Process top-level nodes in a single pass
             for node in tree.body:
-                if isinstance(node, ast.ClassDef):
-                    class_doc = self._analyze_class(node, content)
+                if isinstance(node, ast.Import | ast.ImportFrom):
+                    self._collect_imports(node, module_doc.imports)
+                elif isinstance(node, ast.ClassDef):
+                    class_doc = self._analyze_class(node, unparse_cache)
                     module_doc.classes.append(class_doc)
                 elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-                    func_doc = self._analyze_function(node, content)
+                    func_doc = self._analyze_function(node, unparse_cache)
                     module_doc.functions.append(func_doc)
                 elif isinstance(node, ast.Assign):
                     # Top-level constants
@@ -91,6 +178,14 @@ class DocGenerator:
                                 line_number=node.lineno,
                             ))
 
+            if nested_imports:
+                for stmt in tree.body:
+                    if isinstance(stmt, ast.Import | ast.ImportFrom):
+                        continue
+                    for inner in ast.walk(stmt):
+                        if isinstance(inner, ast.Import | ast.ImportFrom):
+                            self._collect_imports(inner, module_doc.imports)
+
             return module_doc
 
         except SyntaxError as e:
@@ -100,12 +195,35 @@ class DocGenerator:
             logger.error(f"Error analyzing {file_path}: {e}")
             return None
 
-    def _analyze_class(self, node: ast.ClassDef, source: str) -> DocItem:
+    def _collect_imports(self, node: ast.Import | ast.ImportFrom, imports: list[str]) -> None:
+        """Append the names brought in by an import statement."""
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append(alias.name)
+        else:
+            module_name = node.module or ""
+            for alias in node.names:
+                imports.append(f"{module_name}.{alias.name}")
+
+    def _unparse(self, node: ast.AST, cache: dict[int, str] | None = None) -> str:
+        """Render an expression node back to source, memoized per node."""
+        if isinstance(node, ast.Name):
+            return node.id
+        if cache is None:
+            return ast.unparse(node)
+        key = id(node)
+        text = cache.get(key)
+        if text is None:
+            text = cache[key] = ast.unparse(node)
+        return text
+
+    def _analyze_class(
+        self,
+        node: ast.ClassDef,
+        unparse_cache: dict[int, str] | None = None,
+    ) -> DocItem:
         """Analyze a class definition."""
-        bases = [
-            ast.unparse(base) if hasattr(ast, "unparse") else ""
-            for base in node.bases
-        ]
+        bases = [self._unparse(base, unparse_cache) for base in node.bases]
         signature = f"class {node.name}({', '.join(bases)})" if bases else f"class {node.name}"
 
         class_doc = DocItem(
@@ -119,7 +237,7 @@ class DocGenerator:
         # Analyze methods
         for item in node.body:
             if isinstance(item, ast.FunctionDef | ast.AsyncFunctionDef):
-                method_doc = self._analyze_function(item, source)
+                method_doc = self._analyze_function(item, unparse_cache)
                 method_doc.kind = "method"
                 class_doc.children.append(method_doc)
             elif isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
@@ -127,24 +245,25 @@ class DocGenerator:
                 attr_doc = DocItem(
                     name=item.target.id,
                     kind="property",
-                    signature=f"{item.target.id}: {ast.unparse(item.annotation) if hasattr(ast, 'unparse') else ''}",
+                    signature=f"{item.target.id}: {self._unparse(item.annotation, unparse_cache)}",
                     line_number=item.lineno,
                 )
                 class_doc.children.append(attr_doc)
 
         return class_doc
 
-    def _analyze_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef, source: str) -> DocItem:
+    def _analyze_function(
+        self,
+        node: ast.FunctionDef | ast.AsyncFunctionDef,
+        unparse_cache: dict[int, str] | None = None,
+    ) -> DocItem:
         """Analyze a function definition."""
         # Build signature
         args = []
         for arg in node.args.args:
             arg_str = arg.arg
             if arg.annotation:
-                try:
-                    arg_str += f": {ast.unparse(arg.annotation)}"
-                except Exception:
-                    pass
+                arg_str += f": {self._unparse(arg.annotation, unparse_cache)}"
             args.append(arg_str)
 
         # Add *args and **kwargs
@@ -155,10 +274,7 @@ class DocGenerator:
 
         return_type = ""
         if node.returns:
-            try:
-                return_type = ast.unparse(node.returns)
-            except Exception:
-                pass
+            return_type = self._unparse(node.returns, unparse_cache)
 
         prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
         signature = f"{prefix} {node.name}({', '.join(args)})"
@@ -181,61 +297,47 @@ class DocGenerator:
             examples=examples,
         )
 
-    def _parse_docstring(self, docstring: str) -> tuple[list, str, list, list]:
+    def _parse_docstring(
+        self, docstring: str
+    ) -> tuple[list[dict[str, str]], str, list[str], list[str]]:
         """Parse docstring to extract structured information."""
-        parameters = []
-        returns = ""
-        raises = []
-        examples = []
+        parameters: list[dict[str, str]] = []
+        returns: list[str] = []
+        raises: list[str] = []
+        examples: list[str] = []
 
         if not docstring:
-            return parameters, returns, raises, examples
-
-        # Parse Google-style docstring
-        current_section = None
-        current_content = []
-
-        lines = docstring.split("\n")
-        for line in lines:
-            stripped = line.strip()
-
-            # Check for section headers
-            if stripped in ("Args:", "Arguments:", "Parameters:"):
-                current_section = "args"
-                continue
-            elif stripped in ("Returns:", "Return:"):
-                current_section = "returns"
-                continue
-            elif stripped in ("Raises:", "Exceptions:"):
-                current_section = "raises"
-                continue
-            elif stripped in ("Examples:", "Example:"):
-                current_section = "examples"
-                continue
-
-            # Process content based on section
-            if current_section == "args" and stripped:
-                # Parse parameter: "name (type): description"
-                match = re.match(r"(\w+)\s*(?:\(([^)]+)\))?\s*:\s*(.*)", stripped)
-                if match:
-                    parameters.append({
-                        "name": match.group(1),
-                        "type": match.group(2) or "",
-                        "description": match.group(3),
-                    })
-            elif current_section == "returns" and stripped:
-                returns += stripped + " "
-            elif current_section == "raises" and stripped:
-                raises.append(stripped)
-            elif current_section == "examples" and line:
-                examples.append(line)
-
-        return parameters, returns.strip(), raises, examples
-
-    def analyze_cpp_file(self, file_path: Path) -> ModuleDoc | None:
+            return parameters, "", raises, examples
+
+        # Parse Google-style docstring: find section headers in one scan and
+        # hand each section's body to its own parser
+        headers = list(_SECTION_RE.finditer(docstring))
+        for i, header in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(docstring)
+            body = docstring[header.end():end]
+            section = _SECTION_NAMES[header.group(1)]
+
+            if section == "args":
+                parameters.extend(
+                    {"name": m[1], "type": m[2] or "", "description": m[3]}
+                    for m in _PARAM_RE.finditer(body)
+                )
+            elif section == "returns":
+                returns.extend(line.strip() for line in body.split("\n") if line.strip())
+            elif section == "raises":
+                raises.extend(line.strip() for line in body.split("\n") if line.strip())
+            else:
+                examples.extend(line for line in body.split("\n") if line)
+
+        return parameters, " ".join(returns), raises, examples
+
+    def analyze_cpp_file(self, file_path: Path, raw: bytes | None = None) -> ModuleDoc | None:
         """Analyze a C++ file and extract documentation."""
         try:
-            content = file_path.read_text(encoding="utf-8")
+            if raw is None:
+                raw = file_path.read_bytes()
+            content = raw.decode("utf-8", "replace")
+            newlines = self._newline_offsets(content)
             module_doc = ModuleDoc(
                 name=file_path.stem,
                 path=str(file_path),
@@ -245,8 +347,9 @@ class DocGenerator:
             class_pattern = r"(?:/\*\*(.*?)\*/\s*)?(class|struct)\s+(\w+)(?:\s*:\s*([^{]+))?\s*\{"
             for match in re.finditer(class_pattern, content, re.DOTALL):
                 docstring = match.group(1) or ""
-                kind = match.group(2)
-                name = match.group(3)
+                # Kinds, types and names repeat heavily across a codebase
+                kind = sys.intern(match.group(2))
+                name = sys.intern(match.group(3))
                 bases = match.group(4) or ""
 
                 class_doc = DocItem(
@@ -254,7 +357,7 @@ class DocGenerator:
                     kind=kind,
                     signature=f"{kind} {name}" + (f" : {bases.strip()}" if bases else ""),
                     docstring=self._clean_cpp_docstring(docstring),
-                    line_number=content[:match.start()].count("\n") + 1,
+                    line_number=bisect_left(newlines, match.start()) + 1,
                 )
                 module_doc.classes.append(class_doc)
 
@@ -262,8 +365,8 @@ class DocGenerator:
             func_pattern = r"(?:/\*\*(.*?)\*/\s*)?(?:(?:virtual|static|inline|constexpr|explicit)\s+)*(\w+(?:<[^>]+>)?(?:\s*\*)?)\s+(\w+)\s*\(([^)]*)\)"
             for match in re.finditer(func_pattern, content, re.DOTALL):
                 docstring = match.group(1) or ""
-                return_type = match.group(2)
-                name = match.group(3)
+                return_type = sys.intern(match.group(2))
+                name = sys.intern(match.group(3))
                 params = match.group(4)
 
                 # Skip common false positives
@@ -276,7 +379,7 @@ class DocGenerator:
                     signature=f"{return_type} {name}({params})",
                     docstring=self._clean_cpp_docstring(docstring),
                     returns=return_type,
-                    line_number=content[:match.start()].count("\n") + 1,
+                    line_number=bisect_left(newlines, match.start()) + 1,
                 )
                 module_doc.functions.append(func_doc)
 
@@ -286,6 +389,10 @@ class DocGenerator:
             logger.error(f"Error analyzing C++ file {file_path}: {e}")
             return None
 
+    def _newline_offsets(self, content: str) -> list[int]:
+        """Offsets of every newline, for bisecting match positions to line numbers."""
+        return [m.start() for m in _NEWLINE_RE.finditer(content)]
+
     def _clean_cpp_docstring(self, docstring: str) -> str:
         """Clean up C++ docstring (remove * from each line)."""
         lines = []
@@ -297,10 +404,13 @@ class DocGenerator:
                 lines.append(line)
         return "\n".join(lines)
 
-    def analyze_csharp_file(self, file_path: Path) -> ModuleDoc | None:
+    def analyze_csharp_file(self, file_path: Path, raw: bytes | None = None) -> ModuleDoc | None:
         """Analyze a C# file and extract documentation."""
         try:
-            content = file_path.read_text(encoding="utf-8")
+            if raw is None:
+                raw = file_path.read_bytes()
+            content = raw.decode("utf-8", "replace")
+            newlines = self._newline_offsets(content)
             module_doc = ModuleDoc(
                 name=file_path.stem,
                 path=str(file_path),
@@ -315,7 +425,7 @@ class DocGenerator:
             class_pattern = r"(?:///\s*<summary>\s*(.*?)</summary>\s*)?(?:public|private|protected|internal)?\s*(?:partial|abstract|sealed|static)?\s*class\s+(\w+)(?:<[^>]+>)?(?:\s*:\s*([^{]+))?\s*\{"
             for match in re.finditer(class_pattern, content, re.DOTALL):
                 summary = match.group(1) or ""
-                name = match.group(2)
+                name = sys.intern(match.group(2))
                 bases = match.group(3) or ""
 
                 class_doc = DocItem(
@@ -323,7 +433,7 @@ class DocGenerator:
                     kind="class",
                     signature=f"class {name}" + (f" : {bases.strip()}" if bases else ""),
                     docstring=self._clean_xml_doc(summary),
-                    line_number=content[:match.start()].count("\n") + 1,
+                    line_number=bisect_left(newlines, match.start()) + 1,
                 )
                 module_doc.classes.append(class_doc)
 
@@ -331,8 +441,8 @@ class DocGenerator:
             method_pattern = r"(?:///\s*<summary>\s*(.*?)</summary>\s*)?(?:public|private|protected|internal)\s+(?:static|virtual|override|async)?\s*(\w+(?:<[^>]+>)?(?:\[\])?)\s+(\w+)\s*\(([^)]*)\)"
             for match in re.finditer(method_pattern, content, re.DOTALL):
                 summary = match.group(1) or ""
-                return_type = match.group(2)
-                name = match.group(3)
+                return_type = sys.intern(match.group(2))
+                name = sys.intern(match.group(3))
                 params = match.group(4)
 
                 func_doc = DocItem(
@@ -341,7 +451,7 @@ class DocGenerator:
                     signature=f"{return_type} {name}({params})",
                     docstring=self._clean_xml_doc(summary),
                     returns=return_type,
-                    line_number=content[:match.start()].count("\n") + 1,
+                    line_number=bisect_left(newlines, match.start()) + 1,
                 )
                 module_doc.functions.append(func_doc)
 
@@ -359,156 +469,158 @@ class DocGenerator:
         clean = re.sub(r"\s+", " ", clean).strip()
         return clean
 
+    def _public_methods(self, cls: DocItem) -> list[DocItem]:
+        """Methods of a class that appear in rendered docs."""
+        return [m for m in cls.children if m.kind == "method" and not m.name.startswith("_")]
+
+    def _public_functions(self, module: ModuleDoc) -> list[DocItem]:
+        """Module-level functions that appear in rendered docs."""
+        return [f for f in module.functions if not f.name.startswith("_")]
+
+    def public_api(self, modules: Iterable[ModuleDoc]) -> Iterator[ModuleDoc]:
+        """Drop private modules and underscore-prefixed classes and functions."""
+        for module in modules:
+            if not module.name.startswith("_"):
+                yield replace(
+                    module,
+                    classes=[c for c in module.classes if not c.name.startswith("_")],
+                    functions=[f for f in module.functions if not f.name.startswith("_")],
+                )
+
     def generate_markdown(self, modules: list[ModuleDoc]) -> str:
         """Generate markdown documentation."""
-        lines = []
+        return "".join(self.stream_markdown(modules))
 
+    def stream_markdown(self, modules: Iterable[ModuleDoc]) -> Iterator[str]:
+        """Yield markdown one module at a time, consuming modules lazily."""
+        separator = ""
         for module in modules:
-            lines.append(f"# {module.name}")
-            lines.append("")
-
-            if module.description:
-                lines.append(module.description)
-                lines.append("")
-
-            lines.append(f"**File:** `{module.path}`")
-            lines.append("")
-
-            # Table of Contents
-            if module.classes or module.functions:
-                lines.append("## Contents")
-                lines.append("")
-                for cls in module.classes:
-                    lines.append(f"- [{cls.name}](#{cls.name.lower()})")
-                for func in module.functions:
-                    lines.append(f"- [{func.name}](#{func.name.lower()})")
-                lines.append("")
-
-            # Classes
-            for cls in module.classes:
-                lines.append(f"## {cls.name}")
-                lines.append("")
-                lines.append(f"```python")
-                lines.append(cls.signature)
-                lines.append("```")
-                lines.append("")
-
-                if cls.docstring:
-                    lines.append(cls.docstring.split("\n")[0])
-                    lines.append("")
-
-                # Methods
-                if cls.children:
-                    lines.append("### Methods")
-                    lines.append("")
-                    for method in cls.children:
-                        if method.kind == "method" and not method.name.startswith("_"):
-                            lines.append(f"#### `{method.name}`")
-                            lines.append("")
-                            lines.append(f"```python")
-                            lines.append(method.signature)
-                            lines.append("```")
-                            lines.append("")
-                            if method.docstring:
-                                # Just the first line/paragraph
-                                first_line = method.docstring.split("\n\n")[0]
-                                lines.append(first_line)
-                                lines.append("")
-
-            # Functions
-            if module.functions:
-                lines.append("## Functions")
-                lines.append("")
-                for func in module.functions:
-                    if not func.name.startswith("_"):
-                        lines.append(f"### `{func.name}`")
-                        lines.append("")
-                        lines.append(f"```python")
-                        lines.append(func.signature)
-                        lines.append("```")
-                        lines.append("")
-                        if func.docstring:
-                            first_line = func.docstring.split("\n\n")[0]
-                            lines.append(first_line)
-                            lines.append("")
-
-            # Constants
-            if module.constants:
-                lines.append("## Constants")
-                lines.append("")
-                for const in module.constants:
-                    lines.append(f"- `{const.name}`")
-                lines.append("")
-
-            lines.append("---")
-            lines.append("")
-
-        return "\n".join(lines)
+            yield separator + "\n".join(self._render_markdown(module))
+            separator = "\n"
 
-    def generate_html(self, modules: list[ModuleDoc]) -> str:
-        """Generate HTML documentation."""
-        html_parts = [
-            "<!DOCTYPE html>",
-            "<html lang='en'>",
-            "<head>",
-            "<meta charset='UTF-8'>",
-            "<meta name='viewport' content='width=device-width, initial-scale=1.0'>",
-            "<title>API Documentation</title>",
-            "<style>",
-            "body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; ",
-            "       max-width: 900px; margin: 0 auto; padding: 20px; line-height: 1.6; }",
-            "h1, h2, h3 { color: #333; }",
-            "pre { background: #f4f4f4; padding: 15px; border-radius: 5px; overflow-x: auto; }",
-            "code { background: #f4f4f4; padding: 2px 6px; border-radius: 3px; }",
-            ".module { border-left: 4px solid #007acc; padding-left: 15px; margin: 20px 0; }",
-            ".class { border-left: 3px solid #28a745; padding-left: 10px; margin: 15px 0; }",
-            ".function { border-left: 2px solid #6c757d; padding-left: 10px; margin: 10px 0; }",
-            ".docstring { color: #555; font-style: italic; }",
-            "</style>",
-            "</head>",
-            "<body>",
-            "<h1>API Documentation</h1>",
-        ]
+    def _render_markdown(self, module: ModuleDoc) -> Iterator[str]:
+        """Yield the markdown lines for one module."""
+        yield f"# {module.name}"
+        yield ""
 
-        for module in modules:
-            html_parts.append(f"<div class='module'>")
-            html_parts.append(f"<h2>{module.name}</h2>")
-            html_parts.append(f"<p><code>{module.path}</code></p>")
+        if module.description:
+            yield module.description
+            yield ""
 
-            if module.description:
-                html_parts.append(f"<p class='docstring'>{module.description}</p>")
+        yield f"**File:** `{module.path}`"
+        yield ""
 
+        # Table of Contents
+        if module.classes or module.functions:
+            yield "## Contents"
+            yield ""
             for cls in module.classes:
-                html_parts.append(f"<div class='class'>")
-                html_parts.append(f"<h3>{cls.name}</h3>")
-                html_parts.append(f"<pre>{cls.signature}</pre>")
-                if cls.docstring:
-                    html_parts.append(f"<p class='docstring'>{cls.docstring.split(chr(10))[0]}</p>")
-
-                for method in cls.children:
-                    if method.kind == "method" and not method.name.startswith("_"):
-                        html_parts.append(f"<div class='function'>")
-                        html_parts.append(f"<h4>{method.name}</h4>")
-                        html_parts.append(f"<pre>{method.signature}</pre>")
-                        if method.docstring:
-                            html_parts.append(f"<p class='docstring'>{method.docstring.split(chr(10))[0]}</p>")
-                        html_parts.append("</div>")
-
-                html_parts.append("</div>")
-
+                yield f"- [{cls.name}](#{cls.name.lower()})"
             for func in module.functions:
-                if not func.name.startswith("_"):
-                    html_parts.append(f"<div class='function'>")
-                    html_parts.append(f"<h3>{func.name}</h3>")
-                    html_parts.append(f"<pre>{func.signature}</pre>")
-                    if func.docstring:
-                        html_parts.append(f"<p class='docstring'>{func.docstring.split(chr(10))[0]}</p>")
-                    html_parts.append("</div>")
+                yield f"- [{func.name}](#{func.name.lower()})"
+            yield ""
+
+        # Classes
+        for cls in module.classes:
+            yield f"## {cls.name}"
+            yield ""
+            yield "```python"
+            yield cls.signature
+            yield "```"
+            yield ""
+
+            if cls.summary:
+                yield cls.summary
+                yield ""
+
+            # Methods
+            if cls.children:
+                yield "### Methods"
+                yield ""
+                for method in self._public_methods(cls):
+                    yield f"#### `{method.name}`"
+                    yield ""
+                    yield "```python"
+                    yield method.signature
+                    yield "```"
+                    yield ""
+                    if method.docstring:
+                        # Just the first paragraph
+                        yield method.docstring.partition("\n\n")[0]
+                        yield ""
+
+        # Functions
+        if module.functions:
+            yield "## Functions"
+            yield ""
+            for func in self._public_functions(module):
+                yield f"### `{func.name}`"
+                yield ""
+                yield "```python"
+                yield func.signature
+                yield "```"
+                yield ""
+                if func.docstring:
+                    yield func.docstring.partition("\n\n")[0]
+                    yield ""
+
+        # Constants
+        if module.constants:
+            yield "## Constants"
+            yield ""
+            for const in module.constants:
+                yield f"- `{const.name}`"
+            yield ""
+
+        yield "---"
+        yield ""
 
-            html_parts.append("</div>")
+    def generate_html(self, modules: list[ModuleDoc]) -> str:
+        """Generate HTML documentation."""
+        return "".join(self.stream_html(modules))
 
-        html_parts.extend(["</body>", "</html>"])
-        return "\n".join(html_parts)
+    def stream_html(self, modules: Iterable[ModuleDoc]) -> Iterator[str]:
+        """Yield the HTML document one module at a time, consuming modules lazily."""
+        yield "\n".join(_HTML_HEAD)
+        for module in modules:
+            yield "\n" + "\n".join(self._render_html(module))
+        yield "\n" + "\n".join(_HTML_TAIL)
+
+    def _render_html(self, module: ModuleDoc) -> Iterator[str]:
+        """Yield the HTML fragments for one module."""
+        yield "<div class='module'>"
+        yield f"<h2>{_escape_html(module.name)}</h2>"
+        yield f"<p><code>{_escape_html(module.path)}</code></p>"
+
+        if module.description:
+            yield f"<p class='docstring'>{_escape_html(module.description)}</p>"
+
+        for cls in module.classes:
+            yield "<div class='class'>"
+            yield f"<h3>{_escape_html(cls.name)}</h3>"
+            yield f"<pre>{_escape_html(cls.signature)}</pre>"
+            if cls.summary:
+                yield f"<p class='docstring'>{_escape_html(cls.summary)}</p>"
+
+            for method in self._public_methods(cls):
+                yield "<div class='function'>"
+                yield f"<h4>{_escape_html(method.name)}</h4>"
+                yield f"<pre>{_escape_html(method.signature)}</pre>"
+                if method.summary:
+                    yield f"<p class='docstring'>{_escape_html(method.summary)}</p>"
+                yield "</div>"
+
+            yield "</div>"
+
+        for func in self._public_functions(module):
+            yield "<div class='function'>"
+            yield f"<h3>{_escape_html(func.name)}</h3>"
+            yield f"<pre>{_escape_html(func.signature)}</pre>"
+            if func.summary:
+                yield f"<p class='docstring'>{_escape_html(func.summary)}</p>"
+            yield "</div>"
+
+        yield "</div>"
 
 
 class DocGenTool(BaseTool):
@@ -533,7 +645,7 @@ Supports: Python, C++, C#
         "recursive": "Scan directories recursively (default: true)",
     }
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.generator = DocGenerator()
 
     def execute(
@@ -554,7 +666,7 @@ Supports: Python, C++, C#
             elif operation == "generate":
                 return self._generate(target, output, format, recursive)
             elif operation == "api":
-                return self._generate_api(target, output, format, recursive)
+                return self._generate(target, output, format, recursive, api_only=True)
             elif operation == "readme":
                 return self._generate_readme(target, output)
             else:
@@ -579,19 +691,44 @@ Supports: Python, C++, C#
             files = [f for f in path.glob("*") if f.suffix in extensions]
 
         # Exclude common non-source directories
-        exclude = {"__pycache__", ".git", "node_modules", "venv", ".venv", "build", "dist"}
-        return [f for f in files if not any(e in f.parts for e in exclude)]
+        return [f for f in files if not _EXCLUDED_DIR_RE.search(f.as_posix())]
 
-    def _analyze_file(self, file_path: Path) -> ModuleDoc | None:
+    def _analyze_file(self, file_path: Path, raw: bytes | None = None) -> ModuleDoc | None:
         """Analyze a single file based on extension."""
         if file_path.suffix == ".py":
-            return self.generator.analyze_python_file(file_path)
+            return self.generator.analyze_python_file(file_path, raw=raw)
         elif file_path.suffix in (".cpp", ".c", ".h", ".hpp"):
-            return self.generator.analyze_cpp_file(file_path)
+            return self.generator.analyze_cpp_file(file_path, raw)
         elif file_path.suffix == ".cs":
-            return self.generator.analyze_csharp_file(file_path)
+            return self.generator.analyze_csharp_file(file_path, raw)
         return None
 
+    def _read_source(self, file_path: Path) -> bytes | None:
+        """Read a source file, logging and skipping unreadable ones."""
+        try:
+            return file_path.read_bytes()
+        except OSError as e:
+            logger.error(f"Error reading {file_path}: {e}")
+            return None
+
+    def _iter_modules(self, files: list[Path]) -> Iterator[ModuleDoc]:
+        """Analyze files in order, reading the next batch ahead on a thread pool."""
+        if len(files) == 1:
+            module_doc = self._analyze_file(files[0])
+            if module_doc:
+                yield module_doc
+            return
+
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+            for start in range(0, len(files), READ_BATCH_SIZE):
+                batch = files[start:start + READ_BATCH_SIZE]
+                for file_path, raw in zip(batch, pool.map(self._read_source, batch)):
+                    if raw is None:
+                        continue
+                    module_doc = self._analyze_file(file_path, raw)
+                    if module_doc:
+                        yield module_doc
+
     def _analyze(self, path: Path, recursive: bool) -> ToolResult:
         """Analyze files and return summary."""
         files = self._get_files(path, recursive)
@@ -602,11 +739,7 @@ Supports: Python, C++, C#
                 error=f"No source files found in {path}"
             )
 
-        modules = []
-        for file_path in files:
-            module_doc = self._analyze_file(file_path)
-            if module_doc:
-                modules.append(module_doc)
+        modules = list(self._iter_modules(files))
 
         # Build summary
         total_classes = sum(len(m.classes) for m in modules)
@@ -637,9 +770,10 @@ Supports: Python, C++, C#
         path: Path,
         output: str,
         format: str,
-        recursive: bool
+        recursive: bool,
+        api_only: bool = False,
     ) -> ToolResult:
-        """Generate documentation."""
+        """Generate documentation, optionally limited to the public API."""
         files = self._get_files(path, recursive)
         if not files:
             return ToolResult(
@@ -648,25 +782,33 @@ Supports: Python, C++, C#
                 error=f"No source files found in {path}"
             )
 
-        modules = []
-        for file_path in files:
-            module_doc = self._analyze_file(file_path)
-            if module_doc:
-                modules.append(module_doc)
+        # Modules are analyzed, rendered and written one at a time, so the
+        # full documentation graph is never held in memory
+        modules = self._iter_modules(files)
+        if api_only:
+            modules = self.generator.public_api(modules)
 
-        if not modules:
+        first = next(modules, None)
+        if first is None:
             return ToolResult(
                 success=False,
                 output="",
                 error="No documentation extracted"
             )
 
-        # Generate output
+        documented = 0
+
+        def tally() -> Iterator[ModuleDoc]:
+            nonlocal documented
+            for module in chain((first,), modules):
+                documented += 1
+                yield module
+
         if format == "html":
-            content = self.generator.generate_html(modules)
+            chunks = self.generator.stream_html(tally())
             extension = ".html"
         else:
-            content = self.generator.generate_markdown(modules)
+            chunks = self.generator.stream_markdown(tally())
             extension = ".md"
 
         # Write to file or return
@@ -674,24 +816,14 @@ Supports: Python, C++, C#
             output_path = Path(output)
             if not output_path.suffix:
                 output_path = output_path.with_suffix(extension)
-            output_path.write_text(content, encoding="utf-8")
+            with output_path.open("w", encoding="utf-8") as f:
+                f.writelines(chunks)
             return ToolResult(
                 success=True,
-                output=f"Documentation generated: {output_path}\n({len(modules)} modules documented)"
+                output=f"Documentation generated: {output_path}\n({documented} modules documented)"
             )
         else:
-            return ToolResult(success=True, output=content)
-
-    def _generate_api(
-        self,
-        path: Path,
-        output: str,
-        format: str,
-        recursive: bool
-    ) -> ToolResult:
-        """Generate API reference documentation."""
-        # Same as generate but with API-specific formatting
-        return self._generate(path, output, format, recursive)
+            return ToolResult(success=True, output="".join(chunks))
 
     def _generate_readme(self, path: Path, output: str) -> ToolResult:
         """Generate README template."""
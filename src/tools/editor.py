@@ -6,13 +6,103 @@ It's more token-efficient and precise than write_file for small changes.
 """
 
 import difflib
+import os
+import re
+import stat
+from collections.abc import Iterator
+from itertools import chain, islice
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from .base import BaseTool, ToolResult
+from .base import AllowedPathsMixin, BaseTool, PathPolicy, ToolResult
 
+# Unchanged lines shown around an edit, as in `diff -u`
+DIFF_CONTEXT_LINES = 3
 
-class StrReplaceTool(BaseTool):
+# Diff previews stop after this many lines
+MAX_DIFF_LINES = 200
+
+# Replacements spanning more lines than this are diffed with difflib so
+# unchanged lines inside them are not shown as removed and re-added
+MAX_SYNTHESIZED_HUNK_LINES = 200
+
+# A NUL in the first block marks a binary file
+BINARY_SNIFF_BYTES = 8192
+
+# Recently edited files kept in memory for follow-up edits
+EDIT_CACHE_FILES = 8
+
+_HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@")
+
+
+def _split_lines(data: bytes) -> list[bytes]:
+    """Split data on newlines, ignoring the terminator of the last line."""
+    lines = data.split(b"\n")
+    if lines[-1] == b"":
+        lines.pop()
+    return lines
+
+
+def _lines_before(content: bytes, pos: int) -> list[bytes]:
+    """The context lines that end at line-start offset pos."""
+    start = pos
+    for _ in range(DIFF_CONTEXT_LINES):
+        if start == 0:
+            break
+        start = content.rfind(b"\n", 0, start - 1) + 1
+    return _split_lines(content[start:pos])
+
+
+def _lines_after(content: bytes, pos: int) -> list[bytes]:
+    """The context lines that start at line-start offset pos."""
+    end = pos
+    for _ in range(DIFF_CONTEXT_LINES):
+        if end >= len(content):
+            break
+        newline = content.find(b"\n", end)
+        end = len(content) if newline == -1 else newline + 1
+    return _split_lines(content[pos:end])
+
+
+def _display(lines: list[bytes]) -> list[str]:
+    """Decode diff lines for display, hiding Windows line terminators."""
+    return [line.decode("utf-8", "replace").removesuffix("\r") for line in lines]
+
+
+def _to_crlf(data: bytes) -> bytes:
+    """Convert LF line endings to CRLF, leaving existing CRLFs alone."""
+    return data.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n")
+
+
+def _line_span(content: bytes, start_line: int, end_line: int) -> tuple[int, int] | None:
+    """Byte offsets covering lines start_line..end_line (1-based, inclusive)."""
+    if start_line < 1 or end_line < start_line:
+        return None
+    start = 0
+    for _ in range(start_line - 1):
+        start = content.find(b"\n", start) + 1
+        if start == 0:
+            return None
+    end = start
+    for _ in range(end_line - start_line + 1):
+        if end == len(content):
+            return None
+        newline = content.find(b"\n", end)
+        end = len(content) if newline == -1 else newline + 1
+    return start, end
+
+
+def _format_range(start: int, length: int) -> str:
+    """Format a hunk range the way difflib.unified_diff does."""
+    if length == 1:
+        return str(start + 1)
+    if not length:
+        return f"{start},0"
+    return f"{start + 1},{length}"
+
+
+class StrReplaceTool(AllowedPathsMixin, BaseTool):
     """
     Replace an exact string in a file with new content.
 
@@ -20,69 +110,165 @@ class StrReplaceTool(BaseTool):
     Returns a unified diff showing the changes made.
     """
 
-    def __init__(self, allowed_paths: list[Path] | None = None):
-        self._allowed_paths = allowed_paths
+    name = "str_replace"
+    description = (
+        "Replace an exact string in a file. The old_str must appear exactly "
+        "once in the file. Alternatively, give start_line/end_line to replace "
+        "that range of lines. Returns a diff preview of the changes."
+    )
+    parameters = MappingProxyType({
+        "path": {
+            "type": "string",
+            "description": "Path to the file to edit",
+            "required": True
+        },
+        "old_str": {
+            "type": "string",
+            "description": "Exact string to find (must be unique in file); omit when using start_line",
+            "required": False
+        },
+        "new_str": {
+            "type": "string",
+            "description": "String to replace with",
+            "required": True
+        },
+        "start_line": {
+            "type": "integer",
+            "description": "First line to replace (1-based); replaces lines start_line..end_line instead of old_str",
+            "required": False
+        },
+        "end_line": {
+            "type": "integer",
+            "description": "Last line to replace, inclusive (default: start_line)",
+            "required": False
+        }
+    })
 
-    @property
-    def name(self) -> str:
-        return "str_replace"
+    def __init__(self, allowed_paths: list[Path] | PathPolicy | None = None):
+        super().__init__(allowed_paths)
+        # absolute path -> ((mtime_ns, size, inode), content) as last seen
+        self._content_cache: dict[str, tuple[tuple[int, int, int], bytes]] = {}
 
-    @property
-    def description(self) -> str:
-        return (
-            "Replace an exact string in a file. The old_str must appear exactly "
-            "once in the file. Returns a diff preview of the changes."
-        )
+    def _read_content(self, path: Path, st: os.stat_result) -> bytes:
+        """
+        Read path, reusing the bytes from an earlier edit when unchanged.
 
-    @property
-    def parameters(self) -> dict[str, dict[str, Any]]:
-        return {
-            "path": {
-                "type": "string",
-                "description": "Path to the file to edit",
-                "required": True
-            },
-            "old_str": {
-                "type": "string",
-                "description": "Exact string to find (must be unique in file)",
-                "required": True
-            },
-            "new_str": {
-                "type": "string",
-                "description": "String to replace with",
-                "required": True
-            }
-        }
+        The file counts as unchanged while its modification time, size
+        and inode (from st) all match what was recorded; any external
+        write moves at least one of them.
+        """
+        key = os.path.abspath(path)
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._content_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        return path.read_bytes()
+
+    def _remember_content(self, path: Path, content: bytes) -> None:
+        """Record content as the current state of path."""
+        key = os.path.abspath(path)
+        self._content_cache.pop(key, None)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return
+        if len(self._content_cache) >= EDIT_CACHE_FILES:
+            del self._content_cache[next(iter(self._content_cache))]
+        self._content_cache[key] = ((st.st_mtime_ns, st.st_size, st.st_ino), content)
+
+    def _generate_diff(
+        self,
+        content: bytes,
+        offset: int,
+        old: bytes,
+        new: bytes,
+        filepath: str,
+    ) -> str:
+        """
+        Generate a unified diff for replacing old at offset in content.
 
-    def _is_path_allowed(self, path: Path) -> bool:
-        """Check if path is within allowed directories."""
-        if self._allowed_paths is None:
-            return True
-        resolved = path.resolve()
-        return any(
-            resolved.is_relative_to(allowed.resolve())
-            for allowed in self._allowed_paths
+        Only the lines touched by the replacement and their context are
+        examined and decoded, so the cost does not grow with the size of
+        the file.
+        """
+        old_end = offset + len(old)
+        region_start = content.rfind(b"\n", 0, offset) + 1
+        newline = content.find(b"\n", old_end)
+        region_end = len(content) if newline == -1 else newline + 1
+
+        old_lines = _split_lines(content[region_start:region_end])
+        new_lines = _split_lines(
+            content[region_start:offset] + new + content[old_end:region_end]
         )
 
-    def _generate_diff(self, old_content: str, new_content: str, filepath: str) -> str:
-        """Generate a unified diff for display."""
-        old_lines = old_content.splitlines(keepends=True)
-        new_lines = new_content.splitlines(keepends=True)
-
-        diff = difflib.unified_diff(
-            old_lines,
-            new_lines,
-            fromfile=f"{filepath} (before)",
-            tofile=f"{filepath} (after)",
-            lineterm=""
+        # Lines the replacement left unchanged become context
+        head = 0
+        while head < min(len(old_lines), len(new_lines)) and old_lines[head] == new_lines[head]:
+            head += 1
+        tail = 0
+        while (
+            tail < min(len(old_lines), len(new_lines)) - head
+            and old_lines[-1 - tail] == new_lines[-1 - tail]
+        ):
+            tail += 1
+        removed = old_lines[head:len(old_lines) - tail]
+        added = new_lines[head:len(new_lines) - tail]
+        if not removed and not added:
+            return ""
+
+        before = (_lines_before(content, region_start) + old_lines[:head])[-DIFF_CONTEXT_LINES:]
+        after = (old_lines[len(old_lines) - tail:] + _lines_after(content, region_end))[:DIFF_CONTEXT_LINES]
+        first_line = content.count(b"\n", 0, region_start) + head - len(before)
+        shown_before, shown_removed, shown_added, shown_after = map(
+            _display, (before, removed, added, after)
         )
 
-        return "".join(diff)
+        body: Iterator[str]
+        if len(shown_removed) + len(shown_added) > MAX_SYNTHESIZED_HUNK_LINES:
+            # Large replacements may keep many lines; let difflib find them
+            # within the window, then shift its hunks to file line numbers
+            hunks = difflib.unified_diff(
+                shown_before + shown_removed + shown_after,
+                shown_before + shown_added + shown_after,
+                lineterm="",
+                n=DIFF_CONTEXT_LINES,
+            )
+            body = (
+                _HUNK_HEADER_RE.sub(
+                    lambda m: (
+                        f"@@ -{int(m[1]) + first_line}{m[2] or ''} "
+                        f"+{int(m[3]) + first_line}{m[4] or ''} @@"
+                    ),
+                    line,
+                ) if line.startswith("@@") else line
+                for line in islice(hunks, 2, None)
+            )
+        else:
+            old_count = len(shown_before) + len(shown_removed) + len(shown_after)
+            new_count = len(shown_before) + len(shown_added) + len(shown_after)
+            body = chain(
+                [f"@@ -{_format_range(first_line, old_count)} "
+                 f"+{_format_range(first_line, new_count)} @@"],
+                (f" {line}" for line in shown_before),
+                (f"-{line}" for line in shown_removed),
+                (f"+{line}" for line in shown_added),
+                (f" {line}" for line in shown_after),
+            )
+
+        # The diff is only a preview; stop generating it past the cap
+        diff = [f"--- {filepath} (before)", f"+++ {filepath} (after)"]
+        diff.extend(islice(body, MAX_DIFF_LINES))
+        if next(body, None) is not None:
+            diff.append(f"... (diff truncated after {MAX_DIFF_LINES} lines)")
+
+        return "\n".join(diff)
 
     def execute(self, **kwargs: Any) -> ToolResult:
         path_str = kwargs.get("path")
         old_str = kwargs.get("old_str")
         new_str = kwargs.get("new_str")
+        start_line = kwargs.get("start_line")
+        end_line = kwargs.get("end_line")
 
         # Validate parameters
         if not path_str:
@@ -91,7 +277,19 @@ class StrReplaceTool(BaseTool):
                 output="",
                 error="Missing required parameter: path"
             )
-        if old_str is None:
+        # (start_line, end_line) when replacing by line numbers
+        line_range: tuple[int, int] | None = None
+        if start_line is not None:
+            try:
+                first_line = int(start_line)
+                line_range = (first_line, first_line if end_line is None else int(end_line))
+            except (TypeError, ValueError):
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error="start_line and end_line must be integers"
+                )
+        elif old_str is None:
             return ToolResult(
                 success=False,
                 output="",
@@ -114,30 +312,32 @@ class StrReplaceTool(BaseTool):
                 error=f"Access denied: {path} is outside allowed directories"
             )
 
-        # Check file exists
-        if not path.exists():
+        # One stat answers both "exists" and "is a regular file"
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
             return ToolResult(
                 success=False,
                 output="",
                 error=f"File not found: {path}"
             )
-
-        if not path.is_file():
+        except OSError as e:
             return ToolResult(
                 success=False,
                 output="",
-                error=f"Not a file: {path}"
+                error=f"Error reading {path}: {e}"
             )
 
-        # Read file
-        try:
-            original_content = path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
+        if not stat.S_ISREG(st.st_mode):
             return ToolResult(
                 success=False,
                 output="",
-                error=f"Cannot read {path}: not a text file"
+                error=f"Not a file: {path}"
             )
+
+        # Read file; bytes are matched and written back without decoding
+        try:
+            original_content = self._read_content(path, st)
         except Exception as e:
             return ToolResult(
                 success=False,
@@ -145,32 +345,73 @@ class StrReplaceTool(BaseTool):
                 error=f"Error reading {path}: {e}"
             )
 
-        # Check old_str appears exactly once
-        occurrences = original_content.count(old_str)
-
-        if occurrences == 0:
+        if b"\x00" in original_content[:BINARY_SNIFF_BYTES]:
             return ToolResult(
                 success=False,
                 output="",
-                error=f"String not found in {path}:\n{old_str[:100]}..."
+                error=f"Cannot read {path}: not a text file"
             )
 
-        if occurrences > 1:
-            return ToolResult(
-                success=False,
-                output="",
-                error=f"String appears {occurrences} times in {path}. Must appear exactly once for safety."
-            )
+        new_bytes = new_str.encode("utf-8")
+
+        if line_range is not None:
+            span = _line_span(original_content, *line_range)
+            if span is None:
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Lines {line_range[0]}-{line_range[1]} are outside {path}"
+                )
+            offset, end = span
+            old_bytes = original_content[offset:end]
+            if b"\r\n" in old_bytes:
+                new_bytes = _to_crlf(new_bytes)
+            # Replacement text takes over the last line's terminator
+            if new_bytes and not new_bytes.endswith(b"\n"):
+                if old_bytes.endswith(b"\r\n"):
+                    new_bytes += b"\r\n"
+                elif old_bytes.endswith(b"\n"):
+                    new_bytes += b"\n"
+        else:
+            # Checked above: without a line range, old_str is required
+            assert old_str is not None
+            old_bytes = old_str.encode("utf-8")
+
+            # Check old_str appears exactly once: the first scan stops at the
+            # match, the second only covers the rest of the file
+            offset = original_content.find(old_bytes)
+            if offset == -1 and b"\n" in old_bytes and b"\r\n" in original_content:
+                # The file uses Windows line endings; match and keep them
+                old_bytes = _to_crlf(old_bytes)
+                new_bytes = _to_crlf(new_bytes)
+                offset = original_content.find(old_bytes)
+
+            if offset == -1:
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"String not found in {path}:\n{old_str[:100]}..."
+                )
+
+            end = offset + len(old_bytes)
+            if original_content.find(old_bytes, max(end, offset + 1)) != -1:
+                occurrences = original_content.count(old_bytes)
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"String appears {occurrences} times in {path}. Must appear exactly once for safety."
+                )
 
         # Perform replacement
-        new_content = original_content.replace(old_str, new_str, 1)
+        new_content = original_content[:offset] + new_bytes + original_content[end:]
 
         # Generate diff
-        diff = self._generate_diff(original_content, new_content, str(path))
+        diff = self._generate_diff(original_content, offset, old_bytes, new_bytes, str(path))
 
         # Write back to file
         try:
-            path.write_text(new_content, encoding="utf-8")
+            path.write_bytes(new_content)
+            self._remember_content(path, new_content)
         except Exception as e:
             return ToolResult(
                 success=False,
@@ -0,0 +1,166 @@
+"""
+Fork server for PythonExecTool.
+
+Run as a script by PythonExecTool. It starts once, then for each
+request forks a child that executes the code in a fresh __main__
+namespace. Every call therefore starts from the same clean interpreter
+state without paying interpreter startup again.
+
+Protocol (stdin/stdout, each message a 4-byte big-endian length
+followed by a pickle):
+    request:  (code: str, timeout: float, environ: dict[str, str], cwd: str)
+    response: (returncode: int, stdout: bytes, stderr: bytes, timed_out: bool)
+
+Only the standard library is imported here, so user code sees the
+same modules as under a plain `python -`.
+"""
+
+import builtins
+import linecache
+import os
+import pickle
+import selectors
+import signal
+import struct
+import sys
+import time
+import traceback
+import types
+from importlib.machinery import BuiltinImporter
+from typing import BinaryIO
+
+_HEADER = struct.Struct(">I")
+
+
+def _read_message(stream: BinaryIO) -> object | None:
+    """Read one length-prefixed pickle, or None at end of input."""
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    message: object = pickle.loads(stream.read(_HEADER.unpack(header)[0]))
+    return message
+
+
+def _parse_request(message: object) -> tuple[str, float, dict[str, str], str]:
+    """Check that message is a (code, timeout, environ, cwd) request."""
+    if (
+        not isinstance(message, tuple) or len(message) != 4
+        or not isinstance(message[0], str) or not isinstance(message[1], (int, float))
+        or not isinstance(message[2], dict) or not isinstance(message[3], str)
+    ):
+        raise ValueError(f"Malformed request: {message!r}")
+    return message[0], float(message[1]), message[2], message[3]
+
+
+def _main_module() -> types.ModuleType:
+    """Create a fresh __main__ module set up the way `python -` sets it up."""
+    module = types.ModuleType("__main__")
+    module.__file__ = "<stdin>"
+    module.__cached__ = None  # type: ignore[attr-defined]
+    module.__loader__ = BuiltinImporter
+    module.__package__ = None
+    module.__spec__ = None
+    module.__builtins__ = builtins  # type: ignore[attr-defined]
+    return module
+
+
+def _write_message(stream: BinaryIO, message: object) -> None:
+    """Write one length-prefixed pickle."""
+    payload = pickle.dumps(message)
+    stream.write(_HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+
+def _run_child(code: str, environ: dict[str, str], cwd: str, out_fd: int, err_fd: int) -> None:
+    """Execute code as __main__ in the forked child; never returns."""
+    os.dup2(out_fd, 1)
+    os.dup2(err_fd, 2)
+    os.close(out_fd)
+    os.close(err_fd)
+    # The caller's environment and directory now, not the server's at startup
+    os.environ.clear()
+    os.environ.update(environ)
+    try:
+        os.chdir(cwd)
+    except OSError as e:
+        print(f"Cannot run in {cwd}: {e}", file=sys.stderr)
+        sys.exit(1)
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    sys.stdin = open(0, closefd=False)
+    sys.argv = ["-"]
+
+    # Let tracebacks quote the failing source lines
+    linecache.cache["<stdin>"] = (len(code), None, code.splitlines(True), "<stdin>")
+    # A real module, so pickle, multiprocessing and unittest.main() can
+    # find what the code defines as __main__.<name>
+    main_module = _main_module()
+    sys.modules["__main__"] = main_module
+    try:
+        exec(compile(code, "<stdin>", "exec"), main_module.__dict__)
+    except SystemExit:
+        raise
+    except BaseException as e:
+        # Hide this module's frame, as if the code were run directly
+        tb = e.__traceback__
+        traceback.print_exception(type(e), e, tb.tb_next if tb is not None else None)
+        sys.exit(1)
+    # Normal interpreter shutdown: atexit hooks, thread joins, flushing
+    sys.exit(0)
+
+
+def _collect(pid: int, out_r: int, err_r: int, timeout: float) -> tuple[int, bytes, bytes, bool]:
+    """Gather the child's output until both pipes close or time runs out."""
+    chunks: dict[int, list[bytes]] = {out_r: [], err_r: []}
+    timed_out = False
+    deadline = time.monotonic() + timeout
+    with selectors.DefaultSelector() as selector:
+        selector.register(out_r, selectors.EVENT_READ)
+        selector.register(err_r, selectors.EVENT_READ)
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                os.kill(pid, signal.SIGKILL)
+                break
+            for key, _ in selector.select(remaining):
+                data = os.read(key.fd, 65536)
+                if data:
+                    chunks[key.fd].append(data)
+                else:
+                    selector.unregister(key.fd)
+    os.close(out_r)
+    os.close(err_r)
+    _, status = os.waitpid(pid, 0)
+    return (
+        os.waitstatus_to_exitcode(status),
+        b"".join(chunks[out_r]),
+        b"".join(chunks[err_r]),
+        timed_out,
+    )
+
+
+def main() -> None:
+    # Behave like `python -`: the working directory, not this file's
+    # directory, comes first on sys.path
+    sys.path[0] = ""
+    requests = sys.stdin.buffer
+    responses = sys.stdout.buffer
+
+    while (request := _read_message(requests)) is not None:
+        code, timeout, environ, cwd = _parse_request(request)
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(out_r)
+            os.close(err_r)
+            _run_child(code, environ, cwd, out_w, err_w)
+        os.close(out_w)
+        os.close(err_w)
+        _write_message(responses, _collect(pid, out_r, err_r, timeout))
+
+
+if __name__ == "__main__":
+    main()
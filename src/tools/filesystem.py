@@ -7,45 +7,84 @@ Tools:
 - list_directory: List files in a directory
 """
 
+import codecs
+import os
+import stat
+from collections.abc import Iterator
+from operator import attrgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from .base import BaseTool, ToolResult
+from .base import AllowedPathsMixin, BaseTool, ToolResult
 
+# Listings stop here so a huge tree cannot flood the agent's context
+MAX_LIST_ENTRIES = 10_000
 
-class ReadFileTool(BaseTool):
+# A NUL in the first block marks a binary file, unless a BOM says UTF-16
+BINARY_SNIFF_BYTES = 8192
+
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _sniff_encoding(data: bytes) -> str | None:
+    """Pick the encoding to try first for data, or None if it looks binary."""
+    for bom, encoding in _BOM_ENCODINGS:
+        if data.startswith(bom):
+            return encoding
+    if b"\x00" in data[:BINARY_SNIFF_BYTES]:
+        return None
+    return "utf-8"
+
+
+def _walk_entries(root: str) -> Iterator[tuple[bool, str]]:
+    """
+    Yield (is_dir, relative_path) for everything under root.
+
+    Each directory's entries are listed before descending into its
+    subdirectories. Symlinked directories are listed but not followed,
+    and unreadable subdirectories are skipped.
+    """
+    # Relative paths are built by string concatenation onto each
+    # directory's prefix; os.path.join per entry costs more than the scan
+    pending = [("", root)]
+    while pending:
+        rel_prefix, dir_path = pending.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                children = list(it)
+        except OSError:
+            if dir_path == root:
+                raise
+            continue
+        subdirs = []
+        for entry in children:
+            rel_path = rel_prefix + entry.name
+            is_dir = entry.is_dir()
+            yield is_dir, rel_path
+            if is_dir and not entry.is_symlink():
+                subdirs.append((rel_path + os.sep, entry.path))
+        pending.extend(reversed(subdirs))
+
+
+class ReadFileTool(AllowedPathsMixin, BaseTool):
     """Read the contents of a file."""
     
-    def __init__(self, allowed_paths: list[Path] | None = None):
-        self._allowed_paths = allowed_paths
+    name = "read_file"
     
-    @property
-    def name(self) -> str:
-        return "read_file"
+    description = "Read the contents of a file at the specified path."
     
-    @property
-    def description(self) -> str:
-        return "Read the contents of a file at the specified path."
-    
-    @property
-    def parameters(self) -> dict[str, dict[str, Any]]:
-        return {
-            "path": {
-                "type": "string",
-                "description": "Absolute or relative path to the file",
-                "required": True
-            }
+    parameters = MappingProxyType({
+        "path": {
+            "type": "string",
+            "description": "Absolute or relative path to the file",
+            "required": True
         }
-    
-    def _is_path_allowed(self, path: Path) -> bool:
-        """Check if path is within allowed directories."""
-        if self._allowed_paths is None:
-            return True
-        resolved = path.resolve()
-        return any(
-            resolved.is_relative_to(allowed.resolve()) 
-            for allowed in self._allowed_paths
-        )
+    })
     
     def execute(self, **kwargs: Any) -> ToolResult:
         path_str = kwargs.get("path")
@@ -65,14 +104,23 @@ class ReadFileTool(BaseTool):
                 error=f"Access denied: {path} is outside allowed directories"
             )
         
-        if not path.exists():
+        # One stat answers both "exists" and "is a regular file"
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
             return ToolResult(
                 success=False,
                 output="",
                 error=f"File not found: {path}"
             )
-        
-        if not path.is_file():
+        except OSError as e:
+            return ToolResult(
+                success=False,
+                output="",
+                error=f"Error reading {path}: {e}"
+            )
+
+        if not stat.S_ISREG(st.st_mode):
             return ToolResult(
                 success=False,
                 output="",
@@ -80,42 +128,7 @@ class ReadFileTool(BaseTool):
             )
         
         try:
-            content = path.read_text(encoding="utf-8")
-            return ToolResult(
-                success=True,
-                output=content
-            )
-        except UnicodeDecodeError:
-            # Try other encodings
-            for encoding in ["latin-1", "cp1252", "utf-16"]:
-                try:
-                    content = path.read_text(encoding=encoding)
-                    return ToolResult(
-                        success=True,
-                        output=f"[Read with {encoding} encoding]\n{content}"
-                    )
-                except (UnicodeDecodeError, Exception):
-                    continue
-
-            # If all encodings fail, provide file info
-            try:
-                file_size = path.stat().st_size
-                # Read first bytes to detect type
-                with open(path, "rb") as f:
-                    header = f.read(32)
-                header_hex = header.hex()
-
-                return ToolResult(
-                    success=False,
-                    output=f"File info: {file_size} bytes, header: {header_hex[:32]}...",
-                    error=f"Cannot read {path}: binary file ({file_size} bytes). This appears to be a compiled/binary file, not source code."
-                )
-            except Exception:
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error=f"Cannot read {path}: binary/non-text file"
-                )
+            data = path.read_bytes()
         except Exception as e:
             return ToolResult(
                 success=False,
@@ -123,44 +136,50 @@ class ReadFileTool(BaseTool):
                 error=f"Error reading {path}: {e}"
             )
 
+        encoding = _sniff_encoding(data)
+        if encoding is None:
+            header_hex = data[:16].hex()
+            return ToolResult(
+                success=False,
+                output=f"File info: {len(data)} bytes, header: {header_hex}...",
+                error=f"Cannot read {path}: binary file ({len(data)} bytes). This appears to be a compiled/binary file, not source code."
+            )
+
+        try:
+            content = data.decode(encoding)
+        except UnicodeDecodeError:
+            encoding = "latin-1"
+            content = data.decode(encoding)
+
+        # Match read_text's universal newline handling
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+        if encoding not in ("utf-8", "utf-8-sig"):
+            content = f"[Read with {encoding} encoding]\n{content}"
+        return ToolResult(
+            success=True,
+            output=content
+        )
+
 
-class WriteFileTool(BaseTool):
+class WriteFileTool(AllowedPathsMixin, BaseTool):
     """Write content to a file."""
     
-    def __init__(self, allowed_paths: list[Path] | None = None):
-        self._allowed_paths = allowed_paths
-    
-    @property
-    def name(self) -> str:
-        return "write_file"
+    name = "write_file"
     
-    @property
-    def description(self) -> str:
-        return "Write content to a file. Creates the file if it doesn't exist, overwrites if it does."
+    description = "Write content to a file. Creates the file if it doesn't exist, overwrites if it does."
     
-    @property
-    def parameters(self) -> dict[str, dict[str, Any]]:
-        return {
-            "path": {
-                "type": "string",
-                "description": "Absolute or relative path to the file",
-                "required": True
-            },
-            "content": {
-                "type": "string",
-                "description": "Content to write to the file",
-                "required": True
-            }
+    parameters = MappingProxyType({
+        "path": {
+            "type": "string",
+            "description": "Absolute or relative path to the file",
+            "required": True
+        },
+        "content": {
+            "type": "string",
+            "description": "Content to write to the file",
+            "required": True
         }
-    
-    def _is_path_allowed(self, path: Path) -> bool:
-        if self._allowed_paths is None:
-            return True
-        resolved = path.resolve()
-        return any(
-            resolved.is_relative_to(allowed.resolve()) 
-            for allowed in self._allowed_paths
-        )
+    })
     
     def execute(self, **kwargs: Any) -> ToolResult:
         path_str = kwargs.get("path")
@@ -183,7 +202,11 @@ class WriteFileTool(BaseTool):
         try:
             # Create parent directories if needed
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(content, encoding="utf-8")
+            if isinstance(content, (bytes, bytearray)):
+                # Already encoded; write it through untouched
+                path.write_bytes(content)
+            else:
+                path.write_text(content, encoding="utf-8")
             return ToolResult(
                 success=True,
                 output=f"Successfully wrote {len(content)} bytes to {path}"
@@ -196,43 +219,25 @@ class WriteFileTool(BaseTool):
             )
 
 
-class ListDirectoryTool(BaseTool):
+class ListDirectoryTool(AllowedPathsMixin, BaseTool):
     """List contents of a directory."""
     
-    def __init__(self, allowed_paths: list[Path] | None = None):
-        self._allowed_paths = allowed_paths
+    name = "list_directory"
     
-    @property
-    def name(self) -> str:
-        return "list_directory"
+    description = "List files and subdirectories in the specified directory."
     
-    @property
-    def description(self) -> str:
-        return "List files and subdirectories in the specified directory."
-    
-    @property
-    def parameters(self) -> dict[str, dict[str, Any]]:
-        return {
-            "path": {
-                "type": "string",
-                "description": "Path to the directory",
-                "required": True
-            },
-            "recursive": {
-                "type": "boolean",
-                "description": "Whether to list recursively (default: false)",
-                "required": False
-            }
+    parameters = MappingProxyType({
+        "path": {
+            "type": "string",
+            "description": "Path to the directory",
+            "required": True
+        },
+        "recursive": {
+            "type": "boolean",
+            "description": "Whether to list recursively (default: false)",
+            "required": False
         }
-    
-    def _is_path_allowed(self, path: Path) -> bool:
-        if self._allowed_paths is None:
-            return True
-        resolved = path.resolve()
-        return any(
-            resolved.is_relative_to(allowed.resolve()) 
-            for allowed in self._allowed_paths
-        )
+    })
     
     def execute(self, **kwargs: Any) -> ToolResult:
         path_str = kwargs.get("path")
@@ -250,23 +255,31 @@ class ListDirectoryTool(BaseTool):
                 error=f"Access denied: {path} is outside allowed directories"
             )
         
-        if not path.exists():
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
             return ToolResult(success=False, output="", error=f"Directory not found: {path}")
-        
-        if not path.is_dir():
+        except OSError as e:
+            return ToolResult(success=False, output="", error=f"Error listing {path}: {e}")
+
+        if not stat.S_ISDIR(st.st_mode):
             return ToolResult(success=False, output="", error=f"Not a directory: {path}")
         
         try:
-            entries = []
             if recursive:
-                for item in path.rglob("*"):
-                    rel_path = item.relative_to(path)
-                    prefix = "[DIR] " if item.is_dir() else "[FILE]"
-                    entries.append(f"{prefix} {rel_path}")
+                items = _walk_entries(str(path))
             else:
-                for item in sorted(path.iterdir()):
-                    prefix = "[DIR] " if item.is_dir() else "[FILE]"
-                    entries.append(f"{prefix} {item.name}")
+                with os.scandir(path) as it:
+                    children = sorted(it, key=attrgetter("name"))
+                items = ((entry.is_dir(), entry.name) for entry in children)
+
+            entries: list[str] = []
+            for is_dir, rel_path in items:
+                if len(entries) == MAX_LIST_ENTRIES:
+                    entries.append(f"... (truncated after {MAX_LIST_ENTRIES} entries)")
+                    break
+                prefix = "[DIR] " if is_dir else "[FILE]"
+                entries.append(f"{prefix} {rel_path}")
             
             output = "\n".join(entries) if entries else "(empty directory)"
             return ToolResult(success=True, output=output)
@@ -2,85 +2,181 @@
 Git integration tools.
 
 Provides Git operations: status, diff, log, commit, branch management.
+Read-only listings use libgit2 via pygit2 when it is installed, which
+avoids spawning a git process; everything else runs the git CLI.
 """
 
+import os
 import subprocess
+from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from .base import BaseTool, ToolResult
+from .base import AllowedPathsMixin, BaseTool, PathPolicy, ToolResult
+
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+# Commits shown by `log` when no arguments are given
+DEFAULT_LOG_COUNT = 10
+
+# Seconds before a git command is abandoned
+GIT_TIMEOUT = 30
+
+# Output is captured, never shown on a terminal: skip pager and color setup
+GIT_OUTPUT_CONFIG = ("-c", "core.pager=cat", "-c", "color.ui=false")
+
+# operation -> (leading git arguments, error when required input is missing)
+_OPERATIONS: dict[str, tuple[tuple[str, ...], str | None]] = {
+    "status": (("status",), None),
+    # Branch, upstream, HEAD commit and every change in one call
+    "context": (("status", "--porcelain=v2", "--branch"), None),
+    "diff": (("diff", "--no-color", "--no-ext-diff"), None),
+    "log": (("log",), None),
+    "add": (("add",), "'add' operation requires 'args' parameter (files to add)"),
+    "commit": (("commit",), "'commit' operation requires 'message' parameter"),
+    "branch": (("branch",), None),
+    "checkout": (("checkout",), "'checkout' operation requires 'args' parameter (branch name)"),
+    "pull": (("pull",), None),
+    "push": (("push",), None),
+}
+
+# Arguments used when the caller gives none
+_DEFAULT_ARGS: dict[str, tuple[str, ...]] = {
+    # Last few commits in oneline format
+    "log": ("--oneline", "--no-decorate", "-n", str(DEFAULT_LOG_COUNT)),
+}
+
+
+@lru_cache(maxsize=128)
+def _build_git_args(operation: str, args_str: str, message: str | None) -> tuple[str, ...]:
+    """
+    Build the git argument list for an operation.
+
+    Cached, since agents tend to repeat the same few calls (status polls).
+
+    Raises:
+        ValueError: If the operation is unsupported or missing its input
+    """
+    if operation not in _OPERATIONS:
+        raise ValueError(
+            f"Unsupported operation: {operation}. Supported: {', '.join(_OPERATIONS)}"
+        )
+    base, missing_error = _OPERATIONS[operation]
+    if operation == "commit":
+        if not message:
+            raise ValueError(missing_error)
+        base = (*base, "-m", message)
+    elif missing_error and not args_str:
+        raise ValueError(missing_error)
+
+    if args_str:
+        return (*base, *args_str.split())
+    return (*base, *_DEFAULT_ARGS.get(operation, ()))
 
 
-class GitTool(BaseTool):
+class GitTool(AllowedPathsMixin, BaseTool):
     """
     Execute Git commands.
 
     Supports common operations: status, diff, log, commit, branch, etc.
     """
 
-    def __init__(self, allowed_paths: list[Path] | None = None):
-        self._allowed_paths = allowed_paths
+    name = "git"
+    description = (
+        "Execute Git commands. Supported operations: status, context, diff, log, "
+        "commit, add, branch, checkout. Use 'operation' parameter to specify the command. "
+        "'context' returns branch, HEAD and changed files in machine-readable form."
+    )
+    parameters = MappingProxyType({
+        "operation": {
+            "type": "string",
+            "description": "Git operation: status, context, diff, log, add, commit, branch, checkout",
+            "required": True
+        },
+        "path": {
+            "type": "string",
+            "description": "Repository path (default: current directory)",
+            "required": False
+        },
+        "args": {
+            "type": "string",
+            "description": "Additional arguments for the git command",
+            "required": False
+        },
+        "message": {
+            "type": "string",
+            "description": "Commit message (for commit operation)",
+            "required": False
+        }
+    })
 
-    @property
-    def name(self) -> str:
-        return "git"
+    def __init__(self, allowed_paths: list[Path] | PathPolicy | None = None):
+        super().__init__(allowed_paths)
+        self._repositories: dict[str, Any] = {}
 
-    @property
-    def description(self) -> str:
-        return (
-            "Execute Git commands. Supported operations: status, diff, log, "
-            "commit, add, branch, checkout. Use 'operation' parameter to specify the command."
-        )
+    def _open_repository(self, repo_path: Path) -> Any:
+        """Open (and cache) the pygit2 repository containing repo_path."""
+        key = os.path.realpath(repo_path)
+        if key not in self._repositories:
+            git_dir = pygit2.discover_repository(key)
+            self._repositories[key] = pygit2.Repository(git_dir) if git_dir else None
+        return self._repositories[key]
 
-    @property
-    def parameters(self) -> dict[str, dict[str, Any]]:
-        return {
-            "operation": {
-                "type": "string",
-                "description": "Git operation: status, diff, log, add, commit, branch, checkout",
-                "required": True
-            },
-            "path": {
-                "type": "string",
-                "description": "Repository path (default: current directory)",
-                "required": False
-            },
-            "args": {
-                "type": "string",
-                "description": "Additional arguments for the git command",
-                "required": False
-            },
-            "message": {
-                "type": "string",
-                "description": "Commit message (for commit operation)",
-                "required": False
-            }
-        }
+    def _read_with_pygit2(self, repo_path: Path, operation: str, args_str: str) -> str | None:
+        """
+        Answer argument-less `branch` and `log` in-process.
 
-    def _is_path_allowed(self, path: Path) -> bool:
-        """Check if path is within allowed directories."""
-        if self._allowed_paths is None:
-            return True
-        resolved = path.resolve()
-        return any(
-            resolved.is_relative_to(allowed.resolve())
-            for allowed in self._allowed_paths
-        )
+        Returns None whenever the git CLI should handle the request instead.
+        """
+        if not PYGIT2_AVAILABLE or args_str or operation not in ("branch", "log"):
+            return None
+        try:
+            repo = self._open_repository(repo_path)
+            if repo is None or repo.head_is_unborn or repo.head_is_detached:
+                return None
+
+            if operation == "branch":
+                current = repo.head.shorthand
+                return "".join(
+                    f"{'*' if name == current else ' '} {name}\n"
+                    for name in sorted(repo.branches.local)
+                )
 
-    def _run_git_command(self, repo_path: Path, git_args: list[str]) -> tuple[bool, str, str]:
+            lines: list[str] = []
+            order = pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME
+            for commit in repo.walk(repo.head.target, order):
+                if len(lines) == DEFAULT_LOG_COUNT:
+                    break
+                subject = " ".join(commit.message.split("\n\n", 1)[0].split())
+                lines.append(f"{commit.short_id} {subject}\n")
+            return "".join(lines)
+        except Exception:
+            return None
+
+    def _run_git_command(self, repo_path: Path, git_args: Sequence[str]) -> tuple[bool, str, str]:
         """
         Run a git command and return (success, stdout, stderr).
+
+        Output is captured as bytes; stderr is only decoded on failure.
         """
         try:
             result = subprocess.run(
-                ["git", "-C", str(repo_path)] + git_args,
+                ["git", *GIT_OUTPUT_CONFIG, "-C", str(repo_path), *git_args],
                 capture_output=True,
-                text=True,
-                timeout=30
+                timeout=GIT_TIMEOUT
             )
-            return (result.returncode == 0, result.stdout, result.stderr)
+            stdout = result.stdout.decode("utf-8", "replace")
+            if result.returncode == 0:
+                return (True, stdout, "")
+            return (False, stdout, result.stderr.decode("utf-8", "replace"))
         except subprocess.TimeoutExpired:
-            return (False, "", "Git command timed out after 30 seconds")
+            return (False, "", f"Git command timed out after {GIT_TIMEOUT} seconds")
         except FileNotFoundError:
             return (False, "", "Git is not installed or not in PATH")
         except Exception as e:
@@ -116,80 +212,21 @@ class GitTool(BaseTool):
                 error=f"Path not found: {repo_path}"
             )
 
-        # Build git command based on operation
-        git_args: list[str] = []
-
-        if operation == "status":
-            git_args = ["status"]
-            if args_str:
-                git_args.extend(args_str.split())
-
-        elif operation == "diff":
-            git_args = ["diff"]
-            if args_str:
-                git_args.extend(args_str.split())
-
-        elif operation == "log":
-            git_args = ["log"]
-            if not args_str:
-                # Default: show last 10 commits with oneline format
-                git_args.extend(["--oneline", "-n", "10"])
-            else:
-                git_args.extend(args_str.split())
-
-        elif operation == "add":
-            if not args_str:
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error="'add' operation requires 'args' parameter (files to add)"
-                )
-            git_args = ["add"] + args_str.split()
-
-        elif operation == "commit":
-            if not message:
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error="'commit' operation requires 'message' parameter"
-                )
-            git_args = ["commit", "-m", message]
-            if args_str:
-                git_args.extend(args_str.split())
-
-        elif operation == "branch":
-            git_args = ["branch"]
-            if args_str:
-                git_args.extend(args_str.split())
-
-        elif operation == "checkout":
-            if not args_str:
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error="'checkout' operation requires 'args' parameter (branch name)"
-                )
-            git_args = ["checkout"] + args_str.split()
-
-        elif operation == "pull":
-            git_args = ["pull"]
-            if args_str:
-                git_args.extend(args_str.split())
-
-        elif operation == "push":
-            git_args = ["push"]
-            if args_str:
-                git_args.extend(args_str.split())
-
-        else:
+        try:
+            git_args = _build_git_args(operation, args_str, message)
+        except ValueError as e:
             return ToolResult(
                 success=False,
                 output="",
-                error=f"Unsupported operation: {operation}. Supported: status, diff, log, add, commit, branch, checkout, pull, push"
+                error=str(e)
             )
 
         # Execute git command
-        success, stdout, stderr = self._run_git_command(repo_path, git_args)
+        listing = self._read_with_pygit2(repo_path, operation, args_str)
+        if listing is not None:
+            success, stdout, stderr = True, listing, ""
+        else:
+            success, stdout, stderr = self._run_git_command(repo_path, git_args)
 
         if success:
             output = stdout if stdout else "(no output)"
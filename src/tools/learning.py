@@ -4,16 +4,40 @@ Code Learning Tool.
 Provides agent access to the pattern learning system.
 """
 
+import json
 import logging
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .base import BaseTool, ToolResult
-from src.agent.pattern_learner import PatternLearner
+from src.agent.pattern_learner import CodePattern, PatternLearner
 
 logger = logging.getLogger(__name__)
 
 
+def _dump_export(fp: IO[str], patterns: Iterable[dict[str, Any]], style: dict[str, Any]) -> None:
+    """
+    Write an export in json.dumps(indent=2) layout, one pattern at a time.
+
+    json.dump cannot consume a generator, so the outer object is written
+    by hand and only a single pattern dict is held in memory at once.
+    """
+    fp.write('{\n  "patterns": [')
+    count = 0
+    for count, pattern in enumerate(patterns, 1):
+        fp.write("," if count > 1 else "")
+        fp.write("\n    " + json.dumps(pattern, indent=2).replace("\n", "\n    "))
+    fp.write("\n  ]" if count else "]")
+    fp.write(',\n  "style": ' + json.dumps(style, indent=2).replace("\n", "\n  ") + "\n}")
+
+
 class LearningTool(BaseTool):
     """Tool for learning from and querying code patterns."""
 
@@ -41,6 +65,8 @@ This tool helps the agent understand project conventions and coding patterns.
 
     def __init__(self, storage_path: str = ".sovereign/patterns"):
         self.learner = PatternLearner(storage_path)
+        # (language, category) -> matching patterns by confidence; "" matches any
+        self._pattern_index: dict[tuple[str, str], list[CodePattern]] = {}
 
     def execute(
         self,
@@ -78,6 +104,7 @@ This tool helps the agent understand project conventions and coding patterns.
 
     def _analyze(self, path: Path) -> ToolResult:
         """Analyze files and learn patterns."""
+        self._pattern_index.clear()
         if not path.exists():
             return ToolResult(
                 success=False,
@@ -105,15 +132,7 @@ This tool helps the agent understand project conventions and coding patterns.
 
     def _get_patterns(self, language: str, category: str) -> ToolResult:
         """Get learned patterns with optional filtering."""
-        patterns = list(self.learner.patterns.values())
-
-        if language:
-            patterns = [p for p in patterns if p.language == language]
-        if category:
-            patterns = [p for p in patterns if p.category == category]
-
-        # Sort by confidence
-        patterns = sorted(patterns, key=lambda p: p.confidence, reverse=True)
+        patterns = self._sorted_patterns(language, category)
 
         if not patterns:
             return ToolResult(
@@ -136,6 +155,25 @@ This tool helps the agent understand project conventions and coding patterns.
 
         return ToolResult(success=True, output="\n".join(lines))
 
+    def _sorted_patterns(self, language: str, category: str) -> list[CodePattern]:
+        """Patterns matching the filters, highest confidence first."""
+        key = (language, category)
+        patterns = self._pattern_index.get(key)
+        if patterns is None:
+            if key == ("", ""):
+                patterns = sorted(
+                    self.learner.patterns.values(), key=lambda p: p.confidence, reverse=True
+                )
+            else:
+                # Filtering the sorted list keeps the order a fresh sort would give
+                patterns = [
+                    p for p in self._sorted_patterns("", "")
+                    if (not language or p.language == language)
+                    and (not category or p.category == category)
+                ]
+            self._pattern_index[key] = patterns
+        return patterns
+
     def _get_style(self) -> ToolResult:
         """Get learned project style."""
         summary = self.learner.get_style_summary()
@@ -195,23 +233,25 @@ This tool helps the agent understand project conventions and coding patterns.
         if not output:
             output = "patterns_export.json"
 
-        import json
         output_path = Path(output)
-
-        data = {
-            "patterns": [p.to_dict() for p in self.learner.patterns.values()],
-            "style": {
-                "naming_conventions": self.learner.project_style.naming_conventions,
-                "import_style": self.learner.project_style.import_style,
-                "docstring_style": self.learner.project_style.docstring_style,
-                "type_hints": self.learner.project_style.type_hints,
-                "line_length": self.learner.project_style.line_length,
-                "quotes": self.learner.project_style.quotes,
-            }
+        style = {
+            "naming_conventions": self.learner.project_style.naming_conventions,
+            "import_style": self.learner.project_style.import_style,
+            "docstring_style": self.learner.project_style.docstring_style,
+            "type_hints": self.learner.project_style.type_hints,
+            "line_length": self.learner.project_style.line_length,
+            "quotes": self.learner.project_style.quotes,
         }
+        patterns = self.learner.patterns.values()
+
+        if ORJSON_AVAILABLE:
+            data = {"patterns": [p.to_dict() for p in patterns], "style": style}
+            output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with output_path.open("w", encoding="utf-8") as fp:
+                _dump_export(fp, (p.to_dict() for p in patterns), style)
 
-        output_path.write_text(json.dumps(data, indent=2))
         return ToolResult(
             success=True,
-            output=f"Exported {len(data['patterns'])} patterns to {output_path}"
+            output=f"Exported {len(patterns)} patterns to {output_path}"
         )
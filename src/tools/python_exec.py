@@ -2,15 +2,101 @@
 Python code execution tool.
 
 Allows the agent to execute Python code directly for autonomous operation.
+
+On POSIX systems code runs in a child forked from a long-lived server
+interpreter (see exec_server.py), so each call skips interpreter
+startup while still starting from a clean state. Elsewhere, or when
+the server is busy or fails, a fresh interpreter is spawned per call.
 """
 
+import os
+import pickle
+import select
+import struct
 import subprocess
-import tempfile
+import sys
+import threading
+import time
+import weakref
 from pathlib import Path
 from typing import Any
 
 from .base import BaseTool, ToolResult
 
+_SERVER_SCRIPT = Path(__file__).with_name("exec_server.py")
+_HEADER = struct.Struct(">I")
+
+# Extra seconds to wait for the server beyond the code's own timeout
+SERVER_GRACE_SECONDS = 10
+
+
+def _startup_env() -> dict[str, str]:
+    """Environment variables read at interpreter startup, which a fork cannot apply."""
+    return {name: value for name, value in os.environ.items() if name.startswith("PYTHON")}
+
+
+class _ExecServer:
+    """Client side of a running exec_server.py process."""
+
+    def __init__(self) -> None:
+        # Children get the current environment and directory with each
+        # request, but these only take effect when the server starts
+        self.startup_env = _startup_env()
+        self._proc = subprocess.Popen(
+            [sys.executable, str(_SERVER_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self._finalizer = weakref.finalize(self, _stop_process, self._proc)
+
+    def send(self, code: str, timeout: float, cwd: str) -> None:
+        """Submit code for execution in cwd, with the current environment."""
+        assert self._proc.stdin is not None
+        payload = pickle.dumps((code, timeout, dict(os.environ), cwd))
+        self._proc.stdin.write(_HEADER.pack(len(payload)) + payload)
+        self._proc.stdin.flush()
+
+    def receive(self, timeout: float) -> tuple[int, bytes, bytes, bool]:
+        """Wait for the result: (returncode, stdout, stderr, timed_out)."""
+        deadline = time.monotonic() + timeout + SERVER_GRACE_SECONDS
+        size = _HEADER.unpack(self._read_exact(_HEADER.size, deadline))[0]
+        result: tuple[int, bytes, bytes, bool] = pickle.loads(self._read_exact(size, deadline))
+        return result
+
+    def _read_exact(self, size: int, deadline: float) -> bytes:
+        """Read size bytes from the server, failing at EOF or deadline."""
+        assert self._proc.stdout is not None
+        fd = self._proc.stdout.fileno()
+        chunks = []
+        while size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise TimeoutError("exec server did not respond")
+            data = os.read(fd, size)
+            if not data:
+                raise EOFError("exec server exited")
+            chunks.append(data)
+            size -= len(data)
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        """Stop the server process."""
+        self._finalizer()
+
+
+def _stop_process(proc: subprocess.Popen[bytes]) -> None:
+    """Terminate a server process and release its pipes."""
+    proc.kill()
+    proc.wait()
+    for stream in (proc.stdin, proc.stdout):
+        if stream is not None:
+            stream.close()
+
+
+def _decode(data: bytes) -> str:
+    """Decode process output the way subprocess's text mode does."""
+    return data.decode("utf-8", "replace").replace("\r\n", "\n").replace("\r", "\n")
+
 
 class PythonExecTool(BaseTool):
     """Execute Python code directly."""
@@ -18,6 +104,8 @@ class PythonExecTool(BaseTool):
     def __init__(self, timeout: int = 120, working_dir: Path | None = None):
         self._timeout = timeout
         self._working_dir = working_dir
+        self._server: _ExecServer | None = None
+        self._server_lock = threading.Lock()
 
     @property
     def name(self) -> str:
@@ -43,6 +131,62 @@ Use this to:
             }
         }
 
+    def _run_on_server(self, code: str) -> tuple[int, str, str, bool] | None:
+        """
+        Run code on the fork server.
+
+        Returns None when the code was not handed to the server (no fork
+        support, a concurrent call holds it, or it could not be reached),
+        so the caller should spawn a fresh interpreter instead. Failures
+        after the code was sent are raised, never retried, so code is
+        not run twice.
+        """
+        if not hasattr(os, "fork") or not self._server_lock.acquire(blocking=False):
+            return None
+        try:
+            if self._server is not None and self._server.startup_env != _startup_env():
+                self._reset_server()
+            try:
+                if self._server is None:
+                    self._server = _ExecServer()
+                # Resolved per call, as a spawned interpreter's cwd would be
+                cwd = os.path.abspath(self._working_dir) if self._working_dir else os.getcwd()
+                self._server.send(code, self._timeout, cwd)
+            except OSError:
+                self._reset_server()
+                return None
+
+            try:
+                returncode, stdout, stderr, timed_out = self._server.receive(self._timeout)
+            except Exception:
+                self._reset_server()
+                raise
+            return returncode, _decode(stdout), _decode(stderr), timed_out
+        finally:
+            self._server_lock.release()
+
+    def _reset_server(self) -> None:
+        """Stop the server so the next call starts a new one."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+
+    def _run_in_subprocess(self, code: str) -> tuple[int, str, str, bool]:
+        """Run code in a freshly spawned interpreter."""
+        # Code is piped on stdin (`python -`), so nothing touches disk
+        try:
+            result = subprocess.run(
+                [sys.executable, "-"],
+                input=code,
+                capture_output=True,
+                text=True,
+                timeout=self._timeout,
+                cwd=str(self._working_dir) if self._working_dir else None,
+            )
+            return result.returncode, result.stdout, result.stderr, False
+        except subprocess.TimeoutExpired:
+            return -1, "", "", True
+
     def execute(self, **kwargs: Any) -> ToolResult:
         code = kwargs.get("code")
 
@@ -54,47 +198,36 @@ Use this to:
             )
 
         try:
-            # Write code to temp file
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.py',
-                delete=False
-            ) as f:
-                f.write(code)
-                temp_path = f.name
-
-            # Execute the code
-            result = subprocess.run(
-                ["python", temp_path],
-                capture_output=True,
-                text=True,
-                timeout=self._timeout,
-                cwd=str(self._working_dir) if self._working_dir else None,
-            )
-
-            # Clean up
-            Path(temp_path).unlink(missing_ok=True)
-
-            output = result.stdout
-            if result.stderr:
-                output += f"\n[stderr]: {result.stderr}"
+            outcome = self._run_on_server(code)
+            if outcome is None:
+                outcome = self._run_in_subprocess(code)
+            returncode, stdout, stderr, timed_out = outcome
+
+            if timed_out:
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Code execution timed out after {self._timeout} seconds"
+                )
+
+            output = stdout
+            if stderr:
+                output += f"\n[stderr]: {stderr}"
 
             return ToolResult(
-                success=result.returncode == 0,
+                success=returncode == 0,
                 output=output.strip() or "(no output)",
-                error=None if result.returncode == 0 else f"Exit code: {result.returncode}"
+                error=None if returncode == 0 else f"Exit code: {returncode}"
             )
 
-        except subprocess.TimeoutExpired:
-            Path(temp_path).unlink(missing_ok=True)
-            return ToolResult(
-                success=False,
-                output="",
-                error=f"Code execution timed out after {self._timeout} seconds"
-            )
         except Exception as e:
             return ToolResult(
                 success=False,
                 output="",
                 error=f"Error executing code: {e}"
             )
+
+    def close(self) -> None:
+        """Stop the background interpreter, if one was started."""
+        with self._server_lock:
+            self._reset_server()
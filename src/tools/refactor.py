@@ -5,16 +5,105 @@ Provides intelligent refactoring capabilities across multiple files,
 with support for rename, extract, move, and other refactoring operations.
 """
 
+import io
 import logging
+import os
 import re
+import textwrap
+import threading
+import tokenize
+from bisect import bisect_left
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, AnyStr, TypeVar
 
 from .base import BaseTool, ToolResult
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Threads reading and scanning files for rename/find_usages
+SCAN_WORKERS = 8
+
+SOURCE_EXTENSIONS = frozenset({".py", ".cpp", ".c", ".h", ".hpp", ".cs", ".java", ".js", ".ts"})
+EXCLUDED_DIRS = frozenset({"node_modules", "__pycache__", ".git", "venv", ".venv", "build", "dist"})
+
+# find_usages stops scanning once this many usages are found, and shows at most this many
+MAX_USAGES_SHOWN = 50
+
+# Files whose bytes RefactorTool keeps between operations, and the largest it keeps
+CONTENT_CACHE_FILES = 128
+CONTENT_CACHE_MAX_FILE_BYTES = 1_000_000
+
+# find_usages reads files larger than this line by line instead of whole
+STREAM_USAGES_BYTES = 1_000_000
+
+# A NUL in the first block marks a binary file that slipped past the extension filter
+BINARY_SNIFF_BYTES = 4096
+
+
+def _walk_source_files(base: Path) -> Iterator[Path]:
+    """
+    Yield source files under base in sorted order.
+
+    One walk covers every extension, and excluded directories are
+    pruned before they are entered.
+    """
+    for root, dirs, files in os.walk(base):
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_DIRS)
+        root_path = Path(root)
+        for name in sorted(files):
+            if os.path.splitext(name)[1] in SOURCE_EXTENSIONS:
+                yield root_path / name
+
+
+@lru_cache(maxsize=512)
+def _word_re(symbol: str, ascii_only: bool = False) -> re.Pattern[str]:
+    """
+    Compiled whole-word pattern for symbol.
+
+    With ascii_only, \\b uses the cheaper ASCII word test. That gives the
+    same matches only when the searched text is ASCII.
+    """
+    return re.compile(rf'\b{re.escape(symbol)}\b', re.ASCII if ascii_only else 0)
+
+
+# Definition patterns for move_to_file: Python, C/C++ and C# functions or
+# classes. %(symbol)s stands for the escaped symbol; (?!\w) after it stops
+# a name that merely starts with the symbol from matching
+_PY_DEF_TEMPLATE = r'^((?:def|class)\s+%(symbol)s(?!\w)[^:]*:.*?)(?=\n(?:def|class)\s|\Z)'
+_CXX_DEF_TEMPLATE = (
+    r'((?:class|struct)\s+%(symbol)s(?!\w)\s*[^{]*\{[^}]*\};?|'
+    r'[^\n]*\s+%(symbol)s(?!\w)\s*\([^)]*\)\s*\{[^}]*\})'
+)
+_CS_DEF_TEMPLATE = (
+    r'((?:public|private|protected|internal)?\s*(?:static)?\s*(?:class|struct)\s+%(symbol)s(?!\w)[^{]*\{[^}]*\}|'
+    r'(?:public|private|protected|internal)?\s*(?:static)?\s*\w+\s+%(symbol)s(?!\w)\s*\([^)]*\)\s*\{[^}]*\})'
+)
+_DEF_TEMPLATES = {
+    ".py": _PY_DEF_TEMPLATE,
+    ".cpp": _CXX_DEF_TEMPLATE,
+    ".c": _CXX_DEF_TEMPLATE,
+    ".h": _CXX_DEF_TEMPLATE,
+    ".hpp": _CXX_DEF_TEMPLATE,
+    ".cs": _CS_DEF_TEMPLATE,
+}
+
+
+@lru_cache(maxsize=128)
+def _definition_re(ext: str, symbol: str) -> re.Pattern[str] | None:
+    """Compiled definition pattern for symbol in files with extension ext, or None if unsupported."""
+    template = _DEF_TEMPLATES.get(ext)
+    if template is None:
+        return None
+    return re.compile(template % {"symbol": re.escape(symbol)}, re.MULTILINE | re.DOTALL)
+
 
 @dataclass
 class RefactorChange:
@@ -35,6 +124,298 @@ class RefactorResult:
     error: str | None = None
 
 
+def _is_word_char(char: str) -> bool:
+    """Whether char counts as a word character for \\b."""
+    return char.isalnum() or char == "_"
+
+
+_WORD_BYTES = frozenset(b"_0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+
+
+def _is_word_byte(byte: int) -> bool:
+    """_is_word_char for one byte of ASCII content."""
+    return byte in _WORD_BYTES
+
+
+def _is_word_edged(symbol: str) -> bool:
+    """Whether symbol starts and ends with word characters."""
+    return bool(symbol) and _is_word_char(symbol[0]) and _is_word_char(symbol[-1])
+
+
+def _word_offsets(content: AnyStr, symbol: AnyStr) -> Iterator[int]:
+    """
+    Start offsets of symbol in content where it stands as a whole word.
+
+    Equivalent to _word_re(symbol).finditer. When the symbol starts and
+    ends with word characters, find locates candidates and only their
+    two neighbours are checked, which is much faster than the regex
+    engine. Other symbols fall back to the regex (str content only).
+    Bytes content must be ASCII.
+    """
+    if isinstance(content, bytes):
+        is_word: Callable[[Any], bool] = _is_word_byte
+    elif _is_word_edged(symbol):
+        is_word = _is_word_char
+    else:
+        for match in _word_re(symbol, content.isascii()).finditer(content):
+            yield match.start()
+        return
+
+    size = len(symbol)
+    end = len(content)
+    offset = content.find(symbol)
+    while offset != -1:
+        after = offset + size
+        if (
+            (offset == 0 or not is_word(content[offset - 1]))
+            and (after == end or not is_word(content[after]))
+        ):
+            yield offset
+            # Matches never overlap, as with finditer
+            offset = content.find(symbol, after)
+        else:
+            offset = content.find(symbol, offset + 1)
+
+
+def _replace_at(content: AnyStr, offsets: list[int], size: int, new_text: AnyStr) -> AnyStr:
+    """Replace the size-character spans starting at offsets with new_text."""
+    pieces = []
+    previous = 0
+    for offset in offsets:
+        pieces.append(content[previous:offset])
+        pieces.append(new_text)
+        previous = offset + size
+    pieces.append(content[previous:])
+    return content[:0].join(pieces)
+
+
+def _read_if_contains(
+    file: Path, symbol: str, read: Callable[[Path], bytes] = Path.read_bytes
+) -> str | bytes | None:
+    """
+    Read file for scanning, or return None if symbol cannot occur in it.
+
+    The check runs on the raw bytes, so files without the symbol, and
+    binary files, are never decoded. ASCII files are returned as bytes
+    when the symbol is an ASCII word: byte offsets then equal character
+    offsets and whole-word checks agree with str, so no decoding is
+    needed at all. Newlines are translated as read_text would.
+    """
+    data = read(file)
+    # A symbol spanning lines may only match after newline translation
+    if "\n" not in symbol and symbol.encode("utf-8") not in data:
+        return None
+    if b"\x00" in data[:BINARY_SNIFF_BYTES]:
+        return None
+    if symbol.isascii() and _is_word_edged(symbol) and data.isascii():
+        if b"\r" in data:
+            data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        return data
+    content = data.decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _as_text(content: str | bytes) -> str:
+    """A slice of scanned content as str."""
+    return content if isinstance(content, str) else content.decode("utf-8")
+
+
+def _python_code_offsets(content: str | bytes, offsets: list[int], symbol: str) -> list[int]:
+    """
+    Keep the offsets in Python source that refer to the symbol in code.
+
+    Names (including attribute names) are kept; comments and prose in
+    string literals are skipped. A string literal that is exactly the
+    symbol (`__all__`, getattr, forward references) counts as code, and
+    f-strings are matched textually as before. Source that does not
+    tokenize keeps every offset.
+    """
+    if not symbol.isidentifier():
+        return offsets
+    text = _as_text(content)
+    line_starts = [0, 0]
+    newline = text.find("\n")
+    while newline != -1:
+        line_starts.append(newline + 1)
+        newline = text.find("\n", newline + 1)
+
+    quoted = (f'"{symbol}"', f"'{symbol}'")
+    kept = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(text).readline):
+            if token.type == tokenize.NAME:
+                if token.string == symbol:
+                    kept.append(line_starts[token.start[0]] + token.start[1])
+            elif token.type == tokenize.STRING:
+                start = line_starts[token.start[0]] + token.start[1]
+                prefix = token.string[:token.string.index(token.string[-1])]
+                if "f" in prefix.lower():
+                    end = line_starts[token.end[0]] + token.end[1]
+                    kept.extend(offsets[bisect_left(offsets, start):bisect_left(offsets, end)])
+                elif token.string[len(prefix):] in quoted:
+                    kept.append(start + len(prefix) + 1)
+    except (tokenize.TokenError, SyntaxError):
+        return offsets
+    return kept
+
+
+def _rename_in_content(
+    file: Path, content: AnyStr, target: AnyStr, replacement: AnyStr, newline: AnyStr, symbol: str
+) -> tuple[list[RefactorChange], AnyStr | None]:
+    """
+    Rename target in content read from file, as str or as ASCII bytes.
+
+    Returns the changed lines and the new content, or None if nothing changes.
+    """
+    changes: list[RefactorChange] = []
+    offsets = list(_word_offsets(content, target))
+    if offsets and file.suffix == ".py":
+        offsets = _python_code_offsets(content, offsets, symbol)
+    if not offsets or replacement == target:
+        return changes, None
+
+    # Report each changed line once, counting newlines between matches
+    size = len(target)
+    line_number = 1
+    scanned = 0
+    index = 0
+    while index < len(offsets):
+        offset = offsets[index]
+        line_start = content.rfind(newline, 0, offset) + 1
+        line_end = content.find(newline, offset + size)
+        if line_end == -1:
+            line_end = len(content)
+        line_number += content.count(newline, scanned, line_start)
+        scanned = line_start
+        line = content[line_start:line_end]
+        line_offsets = []
+        while index < len(offsets) and offsets[index] < line_end:
+            line_offsets.append(offsets[index] - line_start)
+            index += 1
+        changes.append(RefactorChange(
+            file_path=file,
+            line_number=line_number,
+            old_text=_as_text(line).strip(),
+            new_text=_as_text(_replace_at(line, line_offsets, size, replacement)).strip(),
+            change_type="replace"
+        ))
+
+    return changes, _replace_at(content, offsets, size, replacement)
+
+
+def _rename_in_file(
+    file: Path, symbol: str, new_name: str, read: Callable[[Path], bytes] = Path.read_bytes
+) -> list[RefactorChange]:
+    """Rename symbol in one file, returning the changed lines."""
+    changes: list[RefactorChange] = []
+    try:
+        content = _read_if_contains(file, symbol, read)
+        if content is None:
+            return changes
+        new_content: str | bytes | None
+        if isinstance(content, bytes):
+            changes, new_content = _rename_in_content(
+                file, content, symbol.encode("ascii"), new_name.encode("utf-8"), b"\n", symbol
+            )
+        else:
+            changes, new_content = _rename_in_content(file, content, symbol, new_name, "\n", symbol)
+        if new_content is None:
+            return changes
+
+        if isinstance(new_content, str):
+            new_content = new_content.encode("utf-8")
+        if os.linesep != "\n":
+            new_content = new_content.replace(b"\n", os.linesep.encode())
+        # One contiguous buffer goes straight to a single write()
+        file.write_bytes(new_content)
+    except Exception as e:
+        logger.warning(f"Error processing {file}: {e}")
+    return changes
+
+
+def _usages_in_content(
+    file: Path, content: AnyStr, target: AnyStr, newline: AnyStr, limit: int | None
+) -> list[dict[str, Any]]:
+    """Find whole-word uses of target in content read from file, as str or as ASCII bytes."""
+    usages: list[dict[str, Any]] = []
+    line_number = 1
+    scanned = 0
+    line_start = 0
+    line_end = -1
+    text = ""
+    for offset in islice(_word_offsets(content, target), limit):
+        if offset > line_end:
+            line_start = content.rfind(newline, 0, offset) + 1
+            line_end = content.find(newline, offset)
+            if line_end == -1:
+                line_end = len(content)
+            line_number += content.count(newline, scanned, line_start)
+            scanned = line_start
+            text = _as_text(content[line_start:line_end]).strip()
+        usages.append({
+            "file": str(file),
+            "line": line_number,
+            "column": offset - line_start + 1,
+            "text": text,
+        })
+    return usages
+
+
+def _usages_in_file(
+    file: Path,
+    symbol: str,
+    limit: int | None = None,
+    read: Callable[[Path], bytes] = Path.read_bytes
+) -> list[dict[str, Any]]:
+    """Find whole-word uses of symbol in one file, at most limit of them."""
+    usages: list[dict[str, Any]] = []
+    try:
+        if "\n" not in symbol and os.path.getsize(file) > STREAM_USAGES_BYTES:
+            return _usages_in_stream(file, symbol, limit)
+        content = _read_if_contains(file, symbol, read)
+        if content is None:
+            return usages
+        if isinstance(content, bytes):
+            usages = _usages_in_content(file, content, symbol.encode("ascii"), b"\n", limit)
+        else:
+            usages = _usages_in_content(file, content, symbol, "\n", limit)
+
+    except Exception as e:
+        logger.warning(f"Error processing {file}: {e}")
+    return usages
+
+
+def _usages_in_stream(file: Path, symbol: str, limit: int | None) -> list[dict[str, Any]]:
+    """
+    _usages_in_file for large files, reading one line at a time.
+
+    Memory stays proportional to the longest line rather than the file.
+    The symbol must not contain a newline.
+    """
+    usages: list[dict[str, Any]] = []
+    with open(file, "rb") as raw:
+        if b"\x00" in raw.read(BINARY_SNIFF_BYTES):
+            return usages
+        raw.seek(0)
+        with io.TextIOWrapper(raw, encoding="utf-8") as lines:
+            for line_number, line in enumerate(lines, 1):
+                if symbol not in line:
+                    continue
+                remaining = None if limit is None else limit - len(usages)
+                for offset in islice(_word_offsets(line, symbol), remaining):
+                    usages.append({
+                        "file": str(file),
+                        "line": line_number,
+                        "column": offset + 1,
+                        "text": line.strip(),
+                    })
+                if limit is not None and len(usages) >= limit:
+                    break
+    return usages
+
+
 class RefactorTool(BaseTool):
     """Tool for multi-file refactoring operations."""
 
@@ -58,10 +439,54 @@ Operations:
         "scope": "Scope: file, directory, project",
         "line_start": "Starting line (for extract operations)",
         "line_end": "Ending line (for extract operations)",
+        "limit": f"Stop find_usages after this many usages (default {MAX_USAGES_SHOWN}, 0 for all)",
     }
 
     def __init__(self, working_dir: Path | None = None):
         self.working_dir = working_dir or Path.cwd()
+        # abspath -> ((mtime_ns, size, inode), bytes), least recently used first
+        self._content_cache: dict[str, tuple[tuple[int, int, int], bytes]] = {}
+        self._cache_lock = threading.Lock()
+
+    def _read_bytes(self, path: Path) -> bytes:
+        """
+        Read path, reusing the bytes from an earlier operation when unchanged.
+
+        Safe to call from the scanning threads.
+        """
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        with self._cache_lock:
+            cached = self._content_cache.pop(key, None)
+            if cached is not None and cached[0] == stamp:
+                self._content_cache[key] = cached
+                return cached[1]
+
+        data = path.read_bytes()
+        if len(data) <= CONTENT_CACHE_MAX_FILE_BYTES:
+            with self._cache_lock:
+                if len(self._content_cache) >= CONTENT_CACHE_FILES:
+                    del self._content_cache[next(iter(self._content_cache))]
+                self._content_cache[key] = (stamp, data)
+        return data
+
+    def _read_text(self, path: Path) -> str:
+        """Read path as UTF-8 text with newlines translated, as read_text does."""
+        content = self._read_bytes(path).decode("utf-8")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
+    def _write_text(self, path: Path, content: str) -> None:
+        """Write content to path and drop any cached copy."""
+        self._forget(path)
+        path.write_text(content, encoding="utf-8")
+
+    def _forget(self, path: Path) -> None:
+        """Drop the cached copy of path, after it was written."""
+        with self._cache_lock:
+            self._content_cache.pop(os.path.abspath(path), None)
 
     def execute(
         self,
@@ -85,7 +510,17 @@ Operations:
             elif operation == "move_to_file":
                 return self._move_to_file(symbol, file_path, kwargs.get("target_file", ""))
             elif operation == "find_usages":
-                return self._find_usages(symbol, file_path, scope)
+                try:
+                    limit = int(kwargs.get("limit", MAX_USAGES_SHOWN))
+                except (TypeError, ValueError):
+                    limit = -1
+                if limit < 0:
+                    return ToolResult(
+                        success=False,
+                        output="",
+                        error="limit must be a non-negative integer"
+                    )
+                return self._find_usages(symbol, file_path, scope, limit or None)
             elif operation == "inline_function":
                 return self._inline_function(symbol, file_path)
             elif operation == "change_signature":
@@ -116,17 +551,27 @@ Operations:
         else:  # project
             base = self.working_dir
 
-        # Find all source files
-        extensions = [".py", ".cpp", ".c", ".h", ".hpp", ".cs", ".java", ".js", ".ts"]
-        files = []
-        for ext in extensions:
-            files.extend(base.rglob(f"*{ext}"))
+        return list(_walk_source_files(base))
 
-        # Exclude common directories
-        exclude_dirs = {"node_modules", "__pycache__", ".git", "venv", ".venv", "build", "dist"}
-        files = [f for f in files if not any(d in f.parts for d in exclude_dirs)]
+    def _map_files(self, scan: Callable[[Path], T], files: list[Path]) -> list[T]:
+        """Apply scan to each file, keeping file order, on a thread pool."""
+        with closing(self._iter_files(scan, files)) as results:
+            return list(results)
 
-        return files
+    def _iter_files(self, scan: Callable[[Path], T], files: list[Path]) -> Generator[T, None, None]:
+        """
+        Lazily apply scan to each file, keeping file order.
+
+        Closing the iterator early cancels the files not yet started.
+        """
+        if len(files) <= 1:
+            yield from map(scan, files)
+            return
+        pool = ThreadPoolExecutor(max_workers=SCAN_WORKERS)
+        try:
+            yield from pool.map(scan, files)
+        finally:
+            pool.shutdown(cancel_futures=True)
 
     def _rename_symbol(
         self,
@@ -152,41 +597,20 @@ Operations:
             )
 
         changes = []
-        files_modified = set()
-
-        # Pattern to match whole word only
-        pattern = re.compile(rf'\b{re.escape(symbol)}\b')
-
-        for file in files:
-            try:
-                content = file.read_text(encoding="utf-8")
-                lines = content.split('\n')
-                file_changed = False
-
-                for i, line in enumerate(lines):
-                    if pattern.search(line):
-                        new_line = pattern.sub(new_name, line)
-                        if new_line != line:
-                            changes.append(RefactorChange(
-                                file_path=file,
-                                line_number=i + 1,
-                                old_text=line.strip(),
-                                new_text=new_line.strip(),
-                                change_type="replace"
-                            ))
-                            lines[i] = new_line
-                            file_changed = True
-
-                if file_changed:
-                    file.write_text('\n'.join(lines), encoding="utf-8")
-                    files_modified.add(file)
-
-            except Exception as e:
-                logger.warning(f"Error processing {file}: {e}")
+        files_modified = 0
+
+        # Each file reports its changes once, so counting needs no path set
+        for file_changes in self._map_files(
+            lambda file: _rename_in_file(file, symbol, new_name, self._read_bytes), files
+        ):
+            if file_changes:
+                self._forget(file_changes[0].file_path)
+                changes.extend(file_changes)
+                files_modified += 1
 
         output_lines = [
             f"Renamed '{symbol}' to '{new_name}'",
-            f"Files modified: {len(files_modified)}",
+            f"Files modified: {files_modified}",
             f"Changes made: {len(changes)}",
             "",
             "Changes:"
@@ -209,41 +633,44 @@ Operations:
         self,
         symbol: str,
         file_path: str,
-        scope: str
+        scope: str,
+        limit: int | None = MAX_USAGES_SHOWN
     ) -> ToolResult:
-        """Find all usages of a symbol."""
+        """
+        Find usages of a symbol.
+
+        Scanning stops once more than limit usages are found; pass None
+        to collect them all.
+        """
         if not symbol:
             return ToolResult(success=False, output="", error="Symbol is required")
 
         files = self._get_files_in_scope(file_path, scope)
-        pattern = re.compile(rf'\b{re.escape(symbol)}\b')
 
+        # One usage past the limit tells whether the search was cut short
+        wanted = None if limit is None else limit + 1
         usages = []
-
-        for file in files:
-            try:
-                content = file.read_text(encoding="utf-8")
-                lines = content.split('\n')
-
-                for i, line in enumerate(lines):
-                    matches = list(pattern.finditer(line))
-                    for match in matches:
-                        usages.append({
-                            "file": str(file),
-                            "line": i + 1,
-                            "column": match.start() + 1,
-                            "text": line.strip(),
-                        })
-
-            except Exception as e:
-                logger.warning(f"Error processing {file}: {e}")
+        scans = self._iter_files(
+            lambda file: _usages_in_file(file, symbol, wanted, self._read_bytes), files
+        )
+        with closing(scans):
+            for file_usages in scans:
+                usages.extend(file_usages)
+                if wanted is not None and len(usages) >= wanted:
+                    break
+
+        if limit is not None and len(usages) > limit:
+            del usages[limit:]
+            summary = f"Found more than {limit} usages of '{symbol}' (showing first {min(limit, MAX_USAGES_SHOWN)}; truncated)"
+        else:
+            summary = f"Found {len(usages)} usages of '{symbol}'"
 
         output_lines = [
-            f"Found {len(usages)} usages of '{symbol}'",
+            summary,
             ""
         ]
 
-        for usage in usages[:50]:
+        for usage in usages[:MAX_USAGES_SHOWN]:
             rel_path = Path(usage["file"]).relative_to(self.working_dir) \
                 if self.working_dir in Path(usage["file"]).parents else usage["file"]
             output_lines.append(
@@ -251,8 +678,8 @@ Operations:
             )
             output_lines.append(f"  {usage['text']}")
 
-        if len(usages) > 50:
-            output_lines.append(f"\n... and {len(usages) - 50} more usages")
+        if len(usages) > MAX_USAGES_SHOWN:
+            output_lines.append(f"\n... and {len(usages) - MAX_USAGES_SHOWN} more usages")
 
         return ToolResult(success=True, output="\n".join(output_lines))
 
@@ -275,7 +702,7 @@ Operations:
         if not path.exists():
             return ToolResult(success=False, output="", error="File not found")
 
-        content = path.read_text(encoding="utf-8")
+        content = self._read_text(path)
         lines = content.split('\n')
 
         if line_start < 1 or line_end > len(lines):
@@ -300,9 +727,8 @@ Operations:
             # Find variables used
             variables = set(re.findall(r'\b([a-zA-Z_]\w*)\b', extracted_code))
 
-            new_function = f"\ndef {function_name}():\n"
-            for line in extracted_lines:
-                new_function += f"    {line.strip()}\n"
+            body = "".join(f"    {line.strip()}\n" for line in extracted_lines)
+            new_function = f"\ndef {function_name}():\n{body}"
 
             # Replace original code with function call
             lines[line_start - 1] = f"{base_indent}{function_name}()"
@@ -316,14 +742,9 @@ Operations:
             indent = len(extracted_lines[0]) - len(extracted_lines[0].lstrip())
             base_indent = ' ' * indent
 
-            if ext == ".cs":
-                new_function = f"\nprivate void {function_name}()\n{{\n"
-            else:
-                new_function = f"\nvoid {function_name}()\n{{\n"
-
-            for line in extracted_lines:
-                new_function += f"    {line}\n"
-            new_function += "}\n"
+            signature = f"private void {function_name}()" if ext == ".cs" else f"void {function_name}()"
+            body = "".join(f"    {line}\n" for line in extracted_lines)
+            new_function = f"\n{signature}\n{{\n{body}}}\n"
 
             # Replace original code with function call
             lines[line_start - 1] = f"{base_indent}{function_name}();"
@@ -340,7 +761,7 @@ Operations:
             )
 
         # Write modified content
-        path.write_text('\n'.join(lines), encoding="utf-8")
+        self._write_text(path, '\n'.join(lines))
 
         return ToolResult(
             success=True,
@@ -367,7 +788,7 @@ Operations:
         if not path.exists():
             return ToolResult(success=False, output="", error="File not found")
 
-        content = path.read_text(encoding="utf-8")
+        content = self._read_text(path)
         lines = content.split('\n')
         ext = path.suffix.lower()
 
@@ -379,28 +800,36 @@ Operations:
             )
 
         extracted_lines = lines[line_start - 1:line_end]
+        if ext == ".py":
+            # Python indentation is rebuilt from scratch
+            extracted_lines = [line.strip() for line in extracted_lines]
+        # Method body level; blank lines are left without trailing spaces
+        body = textwrap.indent("\n".join(extracted_lines) + "\n", " " * 8)
 
         if ext == ".py":
-            new_class = f"\nclass {class_name}:\n"
-            new_class += "    def __init__(self):\n"
-            new_class += "        pass\n\n"
-            new_class += "    def execute(self):\n"
-            for line in extracted_lines:
-                new_class += f"        {line.strip()}\n"
+            new_class = (
+                f"\nclass {class_name}:\n"
+                "    def __init__(self):\n"
+                "        pass\n\n"
+                "    def execute(self):\n"
+                f"{body}"
+            )
 
         elif ext == ".cs":
-            new_class = f"\npublic class {class_name}\n{{\n"
-            new_class += "    public void Execute()\n    {\n"
-            for line in extracted_lines:
-                new_class += f"        {line}\n"
-            new_class += "    }\n}\n"
+            new_class = (
+                f"\npublic class {class_name}\n{{\n"
+                "    public void Execute()\n    {\n"
+                f"{body}"
+                "    }\n}\n"
+            )
 
         elif ext in [".cpp", ".h", ".hpp"]:
-            new_class = f"\nclass {class_name}\n{{\npublic:\n"
-            new_class += "    void Execute()\n    {\n"
-            for line in extracted_lines:
-                new_class += f"        {line}\n"
-            new_class += "    }\n};\n"
+            new_class = (
+                f"\nclass {class_name}\n{{\npublic:\n"
+                "    void Execute()\n    {\n"
+                f"{body}"
+                "    }\n};\n"
+            )
 
         else:
             return ToolResult(
@@ -411,7 +840,7 @@ Operations:
 
         # Write new class file
         new_file = path.parent / f"{class_name}{ext}"
-        new_file.write_text(new_class, encoding="utf-8")
+        self._write_text(new_file, new_class)
 
         return ToolResult(
             success=True,
@@ -438,31 +867,12 @@ Operations:
         if not source.exists():
             return ToolResult(success=False, output="", error="Source file not found")
 
-        content = source.read_text(encoding="utf-8")
+        content = self._read_text(source)
         ext = source.suffix.lower()
 
         # Pattern to find function/class definition
-        if ext == ".py":
-            # Match Python function or class
-            pattern = re.compile(
-                rf'^((?:def|class)\s+{re.escape(symbol)}[^:]*:.*?)(?=\n(?:def|class)\s|\Z)',
-                re.MULTILINE | re.DOTALL
-            )
-        elif ext in [".cpp", ".c", ".h", ".hpp"]:
-            # Match C++ function or class
-            pattern = re.compile(
-                rf'((?:class|struct)\s+{re.escape(symbol)}\s*[^{{]*\{{[^}}]*\}};?|'
-                rf'[^\n]*\s+{re.escape(symbol)}\s*\([^)]*\)\s*\{{[^}}]*\}})',
-                re.MULTILINE | re.DOTALL
-            )
-        elif ext == ".cs":
-            # Match C# method or class
-            pattern = re.compile(
-                rf'((?:public|private|protected|internal)?\s*(?:static)?\s*(?:class|struct)\s+{re.escape(symbol)}[^{{]*\{{[^}}]*\}}|'
-                rf'(?:public|private|protected|internal)?\s*(?:static)?\s*\w+\s+{re.escape(symbol)}\s*\([^)]*\)\s*\{{[^}}]*\}})',
-                re.MULTILINE | re.DOTALL
-            )
-        else:
+        pattern = _definition_re(ext, symbol)
+        if pattern is None:
             return ToolResult(
                 success=False,
                 output="",
@@ -481,16 +891,16 @@ Operations:
 
         # Remove from source
         new_source_content = content[:match.start()] + content[match.end():]
-        source.write_text(new_source_content.strip() + '\n', encoding="utf-8")
+        self._write_text(source, new_source_content.strip() + '\n')
 
         # Add to target
         if target.exists():
-            target_content = target.read_text(encoding="utf-8")
+            target_content = self._read_text(target)
             target_content += f"\n\n{extracted}"
         else:
             target_content = extracted
 
-        target.write_text(target_content, encoding="utf-8")
+        self._write_text(target, target_content)
 
         return ToolResult(
             success=True,
@@ -8,14 +8,15 @@ from pathlib import Path
 from typing import Any
 
 from src.agent.code_review import CodeReviewer
-from .base import BaseTool, ToolResult
+from .base import AllowedPathsMixin, BaseTool, PathPolicy, ToolResult
 
 
-class CodeReviewTool(BaseTool):
+class CodeReviewTool(AllowedPathsMixin, BaseTool):
     """Review Python code for quality issues."""
 
-    def __init__(self, allowed_paths: list[Path] | None = None):
-        self.allowed_paths = allowed_paths or []
+    def __init__(self, allowed_paths: list[Path] | PathPolicy | None = None):
+        # An empty list allows everything, like None
+        super().__init__(allowed_paths or None)
         self.reviewer = CodeReviewer()
 
     @property
@@ -57,17 +58,6 @@ Example:
             }
         }
 
-    def _check_path_allowed(self, path: Path) -> bool:
-        """Check if path is within allowed directories."""
-        if not self.allowed_paths:
-            return True
-
-        path = path.resolve()
-        return any(
-            path == allowed or path.is_relative_to(allowed)
-            for allowed in self.allowed_paths
-        )
-
     def execute(self, **kwargs: Any) -> ToolResult:
         """Execute code review."""
         path_str = kwargs.get("path")
@@ -81,7 +71,7 @@ Example:
         path = Path(path_str).resolve()
 
         # Security check
-        if not self._check_path_allowed(path):
+        if not self._is_path_allowed(path):
             return ToolResult(
                 success=False,
                 output="",
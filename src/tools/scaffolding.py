@@ -6,7 +6,13 @@ for various project types and frameworks.
 """
 
 import logging
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -14,8 +20,26 @@ from .base import BaseTool, ToolResult
 
 logger = logging.getLogger(__name__)
 
+# Threads writing a project's files; capped to bound open files
+WRITE_WORKERS = 8
 
-@dataclass
+# Most buffers handed to one os.writev call (POSIX guarantees at least 16;
+# Linux and macOS allow 1024)
+WRITEV_MAX_PARTS = 1024
+
+# Template placeholders, substituted in one pass over each file
+_PLACEHOLDER_RE = re.compile(r"\{(project_name|description)\}")
+
+# Rendered file paths that would land outside the project directory:
+# absolute, drive-qualified, or containing a ".." component
+_UNSAFE_PATH_RE = re.compile(r"^[/\\]|^[A-Za-z]:|(?:^|[/\\])\.\.(?:[/\\]|$)")
+
+# Project names that are not a single directory inside the output path;
+# the name also fills in file paths, so it must not be a path itself
+_UNSAFE_NAME_RE = re.compile(r"[/\\]|^[A-Za-z]:|^\.\.$")
+
+
+@dataclass(slots=True)
 class ProjectTemplate:
     """A project template definition."""
     name: str
@@ -27,6 +51,12 @@ class ProjectTemplate:
     dev_dependencies: list[str]
     scripts: dict[str, str]
 
+    def __post_init__(self) -> None:
+        # Few distinct values shared by many templates, including ones
+        # built at runtime from non-literal strings
+        self.language = sys.intern(self.language)
+        self.framework = sys.intern(self.framework)
+
 
 # Project templates
 TEMPLATES = {
@@ -718,6 +748,163 @@ public class RelayCommand : ICommand
 }
 
 
+def _write_file(path: Path, parts: tuple[bytes, ...]) -> None:
+    """
+    Write the concatenation of parts to path with raw os calls.
+
+    Where os.writev exists the kernel gathers the parts, so they are
+    never joined in Python; a short write falls back to plain writes.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        written = 0
+        if hasattr(os, "writev") and 0 < len(parts) <= WRITEV_MAX_PARTS:
+            written = os.writev(fd, parts)
+        if written < sum(map(len, parts)):
+            view = memoryview(b"".join(parts))[written:]
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _split_placeholders(text: str) -> tuple[str, ...]:
+    """
+    Split text around placeholders.
+
+    Even items are literal text and odd items are placeholder names,
+    so rendering is a join with no scanning.
+    """
+    return tuple(_PLACEHOLDER_RE.split(text))
+
+
+def _encode(text: str) -> bytes:
+    """Encode file text as written in text mode: platform newlines, UTF-8."""
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8")
+
+
+# Split template text with its literals encoded: (literals, placeholder
+# names), one more literal than names
+_EncodedSegments = tuple[tuple[bytes, ...], tuple[str, ...]]
+
+
+def _encode_segments(segments: tuple[str, ...]) -> _EncodedSegments:
+    """Encode the literal (even) items of split template text."""
+    return tuple(_encode(segment) for segment in segments[::2]), segments[1::2]
+
+
+def _fill(segments: tuple[str, ...], subs: dict[str, str]) -> str:
+    """Join split template text with placeholder values filled in."""
+    if len(segments) == 1:
+        return segments[0]
+    parts = list(segments)
+    parts[1::2] = [subs[name] for name in segments[1::2]]
+    return "".join(parts)
+
+
+def _fill_parts(segments: _EncodedSegments, subs: dict[str, bytes]) -> tuple[bytes, ...]:
+    """Encoded template segments with placeholder values filled in, unjoined."""
+    literals, names = segments
+    parts = [b""] * (len(literals) + len(names))
+    parts[::2] = literals
+    parts[1::2] = [subs[name] for name in names]
+    return tuple(part for part in parts if part)
+
+
+@lru_cache(maxsize=None)
+def _template_segments(template_name: str) -> tuple[tuple[tuple[str, ...], _EncodedSegments], ...]:
+    """
+    A template's (path, content) pairs, split around placeholders.
+
+    Prepared on first use of each template rather than at import, since
+    most sessions never scaffold. Contents are encoded here too, so
+    rendering never runs the UTF-8 codec over template text.
+    """
+    return tuple(
+        (_split_placeholders(file_path), _encode_segments(_split_placeholders(content)))
+        for file_path, content in TEMPLATES[template_name].files.items()
+    )
+
+
+@lru_cache(maxsize=128)
+def _render(
+    template_name: str, project_name: str, description: str
+) -> tuple[tuple[str, tuple[bytes, ...]], ...]:
+    """
+    Render a template's files as (path, encoded content parts) pairs.
+
+    Cached, since agents and tests often scaffold the same project
+    repeatedly; the result is an immutable tuple so it is safe to share.
+    """
+    subs = {"project_name": project_name, "description": description}
+    encoded_subs = {name: _encode(value) for name, value in subs.items()}
+    return tuple(
+        (_fill(path_segments, subs), _fill_parts(content_segments, encoded_subs))
+        for path_segments, content_segments in _template_segments(template_name)
+    )
+
+
+@lru_cache(maxsize=1)
+def _template_listing() -> str:
+    """The list operation's output; templates are static, so built once."""
+    lines = ["Available Project Templates:", "=" * 40]
+    for key, template in TEMPLATES.items():
+        lines.append(f"\n{key}")
+        lines.append(f"  {template.name}")
+        lines.append(f"  Language: {template.language}")
+        lines.append(f"  Framework: {template.framework}")
+        lines.append(f"  {template.description}")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _template_details(template_name: str) -> str:
+    """The info operation's output for a known template, built once."""
+    template = TEMPLATES[template_name]
+    lines = [
+        f"Template: {template.name}",
+        f"Language: {template.language}",
+        f"Framework: {template.framework}",
+        f"Description: {template.description}",
+        "",
+        "Files:",
+    ]
+    for file_path in template.files.keys():
+        lines.append(f"  - {file_path}")
+
+    if template.dependencies:
+        lines.append("\nDependencies:")
+        for dep in template.dependencies:
+            lines.append(f"  - {dep}")
+
+    if template.scripts:
+        lines.append("\nScripts:")
+        for name, cmd in template.scripts.items():
+            lines.append(f"  {name}: {cmd}")
+
+    return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class CreateSpec:
+    """One project to create with ScaffoldingTool.create_many."""
+    template: str
+    path: str = "."
+    project_name: str = "my_project"
+    description: str = "A new project"
+
+
+@dataclass
+class _ProjectPlan:
+    """A rendered project whose root directory exists, ready to write."""
+    template: ProjectTemplate
+    project_name: str
+    project_dir: Path
+    rendered: tuple[tuple[str, tuple[bytes, ...]], ...]
+
+
 class ScaffoldingTool(BaseTool):
     """Tool for generating project scaffolding."""
 
@@ -742,6 +929,11 @@ Use 'list' operation to see all templates.
         "description": "Project description",
     }
 
+    def __init__(self) -> None:
+        # Directories this tool has already created, so repeated
+        # scaffolds into the same place skip the mkdir round-trips
+        self._created_dirs: set[Path] = set()
+
     def execute(
         self,
         operation: str,
@@ -766,52 +958,22 @@ Use 'list' operation to see all templates.
                     error=f"Unknown operation: {operation}"
                 )
         except Exception as e:
-            logger.exception(f"Scaffolding error: {e}")
+            logger.exception("Scaffolding error: %s", e)
             return ToolResult(success=False, output="", error=str(e))
 
     def _list_templates(self) -> ToolResult:
         """List all available templates."""
-        lines = ["Available Project Templates:", "=" * 40]
-        for key, template in TEMPLATES.items():
-            lines.append(f"\n{key}")
-            lines.append(f"  {template.name}")
-            lines.append(f"  Language: {template.language}")
-            lines.append(f"  Framework: {template.framework}")
-            lines.append(f"  {template.description}")
-        return ToolResult(success=True, output="\n".join(lines))
+        return ToolResult(success=True, output=_template_listing())
 
     def _template_info(self, template_name: str) -> ToolResult:
         """Get detailed info about a template."""
-        template = TEMPLATES.get(template_name)
-        if not template:
+        if template_name not in TEMPLATES:
             return ToolResult(
                 success=False,
                 output="",
                 error=f"Template not found: {template_name}"
             )
-
-        lines = [
-            f"Template: {template.name}",
-            f"Language: {template.language}",
-            f"Framework: {template.framework}",
-            f"Description: {template.description}",
-            "",
-            "Files:",
-        ]
-        for file_path in template.files.keys():
-            lines.append(f"  - {file_path}")
-
-        if template.dependencies:
-            lines.append("\nDependencies:")
-            for dep in template.dependencies:
-                lines.append(f"  - {dep}")
-
-        if template.scripts:
-            lines.append("\nScripts:")
-            for name, cmd in template.scripts.items():
-                lines.append(f"  {name}: {cmd}")
-
-        return ToolResult(success=True, output="\n".join(lines))
+        return ToolResult(success=True, output=_template_details(template_name))
 
     def _create_project(
         self,
@@ -821,6 +983,53 @@ Use 'list' operation to see all templates.
         description: str
     ) -> ToolResult:
         """Create a new project from template."""
+        plan = self._plan_project(template_name, path, project_name, description)
+        if isinstance(plan, ToolResult):
+            return plan
+        error = self._write_projects([plan])[0]
+        if error is not None:
+            raise error
+        return self._created_result(plan)
+
+    def create_many(self, specs: list[CreateSpec]) -> list[ToolResult]:
+        """
+        Create several projects, returning one result per spec in order.
+
+        All projects' directories are created in one deduplicated pass
+        and all files are written on one shared thread pool, instead of
+        repeating both per project.
+        """
+        results: list[ToolResult] = []
+        plans: list[_ProjectPlan] = []
+        slots: list[int] = []
+        for spec in specs:
+            try:
+                plan = self._plan_project(spec.template, spec.path, spec.project_name, spec.description)
+            except Exception as e:
+                plan = ToolResult(success=False, output="", error=str(e))
+            if isinstance(plan, ToolResult):
+                results.append(plan)
+            else:
+                slots.append(len(results))
+                plans.append(plan)
+                # Replaced once the files are written
+                results.append(ToolResult(success=False, output=""))
+
+        for slot, plan, error in zip(slots, plans, self._write_projects(plans)):
+            if error is None:
+                results[slot] = self._created_result(plan)
+            else:
+                results[slot] = ToolResult(success=False, output="", error=str(error))
+        return results
+
+    def _plan_project(
+        self,
+        template_name: str,
+        path: str,
+        project_name: str,
+        description: str
+    ) -> _ProjectPlan | ToolResult:
+        """Render a project and create its root directory, or return an error result."""
         template = TEMPLATES.get(template_name)
         if not template:
             return ToolResult(
@@ -829,35 +1038,90 @@ Use 'list' operation to see all templates.
                 error=f"Template not found: {template_name}"
             )
 
-        project_dir = Path(path) / project_name
-        project_dir.mkdir(parents=True, exist_ok=True)
+        if _UNSAFE_NAME_RE.search(project_name):
+            return ToolResult(
+                success=False,
+                output="",
+                error=f"Project name {project_name!r} would write outside the project directory"
+            )
 
-        created_files = []
-        for file_path, content in template.files.items():
-            # Replace placeholders
-            file_path = file_path.replace("{project_name}", project_name)
-            content = content.replace("{project_name}", project_name)
-            content = content.replace("{description}", description)
+        rendered = _render(template_name, project_name, description)
+        for file_path, _ in rendered:
+            if _UNSAFE_PATH_RE.search(file_path):
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Project name {project_name!r} would write outside the project: {file_path}"
+                )
 
-            full_path = project_dir / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text(content, encoding="utf-8")
-            created_files.append(file_path)
+        project_dir = Path(path, project_name)
+        project_dir.mkdir(parents=True, exist_ok=True)
+        return _ProjectPlan(template, project_name, project_dir, rendered)
+
+    def _write_projects(self, plans: list[_ProjectPlan]) -> list[OSError | None]:
+        """Write every planned project's files, returning each project's first error."""
+        errors: list[OSError | None] = [None] * len(plans)
+        # Each full path is built once and reused for mkdir and write
+        all_writes = [
+            (index, plan.project_dir.joinpath(file_path), content)
+            for index, plan in enumerate(plans)
+            for file_path, content in plan.rendered
+        ]
 
+        # Create each directory once, parents first, rather than per file
+        users: dict[Path, list[int]] = {}
+        for index, full_path, _ in all_writes:
+            parent = full_path.parent
+            if parent != plans[index].project_dir:
+                users.setdefault(parent, []).append(index)
+        for directory in sorted(users.keys() - self._created_dirs, key=lambda d: len(d.parts)):
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                for index in users[directory]:
+                    errors[index] = errors[index] or e
+                continue
+            self._created_dirs.add(directory)
+
+        writes = [item for item in all_writes if errors[item[0]] is None]
+
+        def write(item: tuple[int, Path, tuple[bytes, ...]]) -> OSError | None:
+            _, full_path, content = item
+            try:
+                try:
+                    _write_file(full_path, content)
+                except FileNotFoundError:
+                    # A remembered directory was removed since; recreate it
+                    full_path.parent.mkdir(parents=True, exist_ok=True)
+                    _write_file(full_path, content)
+            except OSError as e:
+                return e
+            return None
+
+        if writes:
+            # Writes are syscall-bound, so threads overlap them
+            with ThreadPoolExecutor(max_workers=min(WRITE_WORKERS, len(writes))) as pool:
+                for (index, _, _), error in zip(writes, pool.map(write, writes)):
+                    if error is not None and errors[index] is None:
+                        errors[index] = error
+        return errors
+
+    def _created_result(self, plan: _ProjectPlan) -> ToolResult:
+        """Summarize a created project."""
+        template = plan.template
         output_lines = [
-            f"Created project: {project_name}",
-            f"Location: {project_dir}",
+            f"Created project: {plan.project_name}",
+            f"Location: {plan.project_dir}",
             f"Template: {template.name}",
             "",
             "Files created:",
         ]
-        for f in created_files:
-            output_lines.append(f"  - {f}")
+        output_lines.extend(f"  - {file_path}" for file_path, _ in plan.rendered)
 
         if template.scripts:
             output_lines.append("\nNext steps:")
-            output_lines.append(f"  cd {project_name}")
-            for name, cmd in list(template.scripts.items())[:3]:
+            output_lines.append(f"  cd {plan.project_name}")
+            for name, cmd in islice(template.scripts.items(), 3):
                 output_lines.append(f"  {cmd}  # {name}")
 
         return ToolResult(success=True, output="\n".join(output_lines))
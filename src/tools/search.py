@@ -2,41 +2,386 @@
 Code search tools.
 
 Provides grep-like functionality for searching code.
-Uses ripgrep if available, falls back to Python implementation.
+Uses ripgrep if available, falls back to Python implementation. The
+fallback uses hyperscan, when installed, to skip files that cannot match.
 """
 
+import codecs
+import fnmatch
+import io
+import mmap
+import os
 import re
+import shutil
 import subprocess
+import threading
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
-from .base import BaseTool, ToolResult
+from .base import AllowedPathsMixin, BaseTool, PathPolicy, ToolResult
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
 
-class CodeSearchTool(BaseTool):
+T = TypeVar("T")
+
+# Threads reading and scanning files in the Python fallback
+SEARCH_WORKERS = 8
+
+# Fewest files worth starting worker processes for a CPU-bound pattern
+PROCESS_POOL_MIN_FILES = 64
+
+# Files handed to a worker process at a time, to amortize the IPC
+PROCESS_CHUNK_SIZE = 16
+
+# Binary and other non-text files the Python fallback never opens
+_SKIPPED_SUFFIXES = frozenset({
+    # Compiled code and libraries
+    '.pyc', '.pyo', '.pyd', '.exe', '.dll', '.so', '.dylib', '.o', '.class', '.jar', '.whl',
+    # Raw data, archives and media
+    '.bin', '.dat', '.zip', '.gz', '.tar', '.pdf',
+    '.png', '.jpg', '.jpeg', '.gif', '.ico', '.woff', '.woff2', '.ttf', '.mp3', '.mp4',
+})
+
+# A NUL in the first block marks a binary file, as in ripgrep
+BINARY_SNIFF_BYTES = 8192
+
+# Seconds before a ripgrep search is abandoned
+SEARCH_TIMEOUT = 30
+
+# Stop reading ripgrep output past this size, however few matches it holds
+RIPGREP_MAX_OUTPUT_BYTES = 4 * 1024 * 1024
+
+# Trees with fewer files than this are searched in Python, which is
+# faster than starting rg for them; 0 always uses rg when installed
+try:
+    RIPGREP_MIN_FILES = int(os.environ.get("SOVEREIGN_RG_THRESHOLD", "50"))
+except ValueError:
+    RIPGREP_MIN_FILES = 50
+
+# Characters that make a pattern a regex rather than a plain string
+_REGEX_META_RE = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+# Constructs that can match a line on its own but not within the whole
+# file (\A, \Z, \B and $, which also match at the very end of a line,
+# after its newline; negative lookaround) or that hyperscan reads
+# differently ({,n}); patterns using them are always run line by line and
+# never prefiltered
+_LINE_ONLY_RE = re.compile(r"\\[AZB]|\$|\(\?<?!|\{,")
+
+# Constructs that stop a pattern from running with re.ASCII on ASCII text,
+# or from being prefiltered by hyperscan: \s also matches \x1c-\x1f in
+# Unicode mode (but never in hyperscan), and (?u) rejects the flag
+_UNICODE_ONLY_RE = re.compile(r"\\[sS]|\(\?[a-zA-Z]*u")
+
+# Constructs that can make re backtrack heavily on every line: groups
+# and lookaround, alternation, lazy and nested quantifiers
+_BACKTRACKING_RE = re.compile(r"\(\?|\||[*+?}]\?|\)[*+{]")
+
+
+@lru_cache(maxsize=1)
+def _ripgrep_available() -> bool:
     """
-    Search for patterns in code files.
+    Check if ripgrep is on PATH.
 
-    Supports regex patterns and file type filtering.
-    Uses ripgrep if available for performance, otherwise uses Python fallback.
+    Looked up once per process with shutil.which, which only stats PATH
+    entries instead of spawning `rg --version` for every tool instance.
     """
+    return shutil.which("rg") is not None
 
-    def __init__(self, allowed_paths: list[Path] | None = None):
-        self._allowed_paths = allowed_paths
-        self._has_ripgrep = self._check_ripgrep()
 
-    def _check_ripgrep(self) -> bool:
-        """Check if ripgrep is available."""
+@lru_cache(maxsize=32)
+def _hyperscan_prefilter(pattern: str, case_sensitive: bool) -> Any:
+    """
+    Compile pattern into a hyperscan database, or None if it cannot be used.
+
+    The database only answers whether a file may contain a match; lines
+    are still matched with re. Prefilter mode makes hyperscan accept
+    constructs it cannot run exactly (such as backreferences) by
+    matching a superset of what the pattern matches.
+    """
+    if (
+        not HYPERSCAN_AVAILABLE or not pattern.isascii()
+        or _LINE_ONLY_RE.search(pattern) or _UNICODE_ONLY_RE.search(pattern)
+    ):
+        return None
+
+    flags = (
+        hyperscan.HS_FLAG_PREFILTER
+        | hyperscan.HS_FLAG_MULTILINE
+        | hyperscan.HS_FLAG_ALLOWEMPTY
+        | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    if not case_sensitive:
+        flags |= hyperscan.HS_FLAG_CASELESS
+
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(expressions=[pattern.encode()], ids=[0], elements=1, flags=[flags])
+    except hyperscan.error:
+        return None
+    return database
+
+
+# Per-thread hyperscan scratch space, keyed by database
+_thread_state = threading.local()
+
+
+def _may_match(database: Any, data: bytes | mmap.mmap) -> bool:
+    """Scan data with a prefilter database; False means no line can match."""
+    # hyperscan needs scratch space per thread, so each keeps its own
+    scratches = _thread_state.__dict__.setdefault("scratches", {})
+    scratch = scratches.get(database)
+    if scratch is None:
+        scratch = scratches[database] = hyperscan.Scratch(database)
+
+    hits: list[int] = []
+    try:
+        database.scan(data, match_event_handler=lambda *match: hits.append(1), scratch=scratch)
+    except hyperscan.error:
+        # Fall back to scanning with re rather than risk missing a match
+        return True
+    return bool(hits)
+
+
+def _suffix(name: str) -> str:
+    """Return the file extension of name, with the same rules as Path.suffix."""
+    i = name.rfind('.')
+    return name[i:] if 0 < i < len(name) - 1 else ''
+
+
+@lru_cache(maxsize=32)
+def _name_regex(name_pattern: str) -> re.Pattern[str]:
+    """Compile a file name glob once; names compare case-insensitively on Windows, as in pathlib."""
+    return re.compile(fnmatch.translate(name_pattern), re.IGNORECASE if os.name == "nt" else 0)
+
+
+def _iter_files(root: str, name_re: re.Pattern[str] | None) -> Iterator[str]:
+    """
+    Yield the paths of searchable files under root whose names match name_re.
+
+    Walks with os.scandir, depth first and in the same order as Path.rglob,
+    without entering symlinked directories. DirEntry answers is_dir() and
+    is_file() from the directory listing, so most entries need no stat call
+    and no Path object.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
         try:
-            subprocess.run(
-                ["rg", "--version"],
-                capture_output=True,
-                check=True,
-                timeout=1
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif (
+                        _suffix(entry.name) not in _SKIPPED_SUFFIXES
+                        and (name_re is None or name_re.match(entry.name))
+                        and entry.is_file()
+                    ):
+                        yield entry.path
+        except OSError:
+            # Unreadable directory: skip it, as rglob does
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def _is_small_tree(root: str, limit: int) -> bool:
+    """
+    Check whether root holds fewer than limit entries, giving up at limit.
+
+    Trees with hidden entries never count as small: ripgrep skips those,
+    and reads .gitignore and .ignore files, so only it gives their results.
+    """
+    count = 0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    count += 1
+                    if count >= limit or entry.name.startswith("."):
+                        return False
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
             return False
+    return True
+
+
+@dataclass(frozen=True, slots=True)
+class _Matcher:
+    """A search pattern, compiled each way the fallback search uses it."""
+    line_regex: re.Pattern[str]
+    # Finds candidate lines across a whole file; None to go line by line
+    text_regex: re.Pattern[str] | None
+    # hyperscan database that rules out whole files, or None
+    prefilter: Any
+    # The same pattern compiled with re.ASCII, for ASCII text; or None
+    ascii: "_Matcher | None" = None
+
+
+def _compile_matcher(pattern: str, case_sensitive: bool, ascii_only: bool = False) -> _Matcher:
+    r"""
+    Compile pattern for the fallback search; raises re.error if invalid.
+
+    An ASCII pattern also gets an ASCII-only variant: on ASCII text it
+    finds the same lines, but \w, \b and case-insensitive matching skip
+    the Unicode character tests, which runs them up to about three times
+    faster.
+    """
+    flags = re.ASCII if ascii_only else 0
+    if not case_sensitive:
+        flags |= re.IGNORECASE
+    line_regex = re.compile(pattern, flags)
+    text_regex = None if _LINE_ONLY_RE.search(pattern) else re.compile(pattern, flags | re.MULTILINE)
+    ascii_matcher = None
+    if not ascii_only and pattern.isascii() and not _UNICODE_ONLY_RE.search(pattern):
+        ascii_matcher = _compile_matcher(pattern, case_sensitive, ascii_only=True)
+    return _Matcher(line_regex, text_regex, _hyperscan_prefilter(pattern, case_sensitive), ascii_matcher)
+
+
+def _matching_lines(text: str, matcher: _Matcher) -> Iterator[tuple[int, str]]:
+    """
+    Yield (line_number, line) for each line of text the pattern matches.
+
+    Lines are split on \n and keep it, like a text-mode file's lines.
+    Rather than trying every line, one search over the whole text jumps to
+    the next line that may match, and only that line is sliced out and
+    checked. A match that runs past its line means the pattern can span
+    lines; the rest of the text is then checked line by line, since
+    searching from every line could otherwise go quadratic.
+    """
+    pos = 0
+    line_num = 1
+    if matcher.text_regex is not None:
+        while (match := matcher.text_regex.search(text, pos)) is not None:
+            start = match.start()
+            if start > pos and text[start - 1] == '\n':
+                # The line before ends here, and the search has ruled out
+                # all of it but this last position, just past its newline,
+                # where only an empty match (such as a lookbehind) can be
+                prev_start = text.rfind('\n', 0, start - 1) + 1
+                line_num += text.count('\n', pos, prev_start)
+                line = text[prev_start:start]
+                if matcher.line_regex.match(line, len(line)):
+                    yield line_num, line
+                pos = start
+                line_num += 1
+
+            line_start = text.rfind('\n', 0, start) + 1
+            if line_start == len(text):
+                # Empty match after the final newline, not on any line
+                return
+            line_end = text.find('\n', start) + 1 or len(text)
+            line_num += text.count('\n', pos, line_start)
+            line = text[line_start:line_end]
+            if matcher.line_regex.search(line):
+                yield line_num, line
+            pos = line_end
+            line_num += 1
+            if pos == len(text):
+                return
+            if match.end() > line_end:
+                break
+
+    with io.StringIO(text[pos:] if pos else text) as lines:
+        for line_num, line in enumerate(lines, line_num):
+            if matcher.line_regex.search(line):
+                yield line_num, line
+
+
+def _search_file(file_path: str, matcher: _Matcher, limit: int) -> list[str]:
+    """Return up to limit "path:line_number:line" matches from one file."""
+    results: list[str] = []
+    try:
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data.find(b'\x00', 0, BINARY_SNIFF_BYTES) != -1:
+                return results
+            # Reject non-UTF-8 text before decoding the rest; final=False
+            # allows a character cut off at the end of the block
+            codecs.utf_8_decode(data[:BINARY_SNIFF_BYTES], 'strict', False)
+            text = str(data, 'utf-8')
+            # Only trust the prefilter's "no" on ASCII text, where \w, \d
+            # and case folding agree with re, split on \n alone (a bare
+            # \r also ends a line for re but not for hyperscan)
+            if (
+                matcher.prefilter is not None and text.isascii() and '\r' not in text
+                and not _may_match(matcher.prefilter, data)
+            ):
+                return results
+    except ValueError:
+        # Empty (unmappable) files, and text that is not UTF-8
+        return results
+    except PermissionError:
+        # Skip files we can't read
+        return results
+
+    # Same universal newlines as a text-mode open()
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    if matcher.ascii is not None and text.isascii():
+        matcher = matcher.ascii
+
+    for line_num, line in _matching_lines(text, matcher):
+        # Format: path:line_number:line_content
+        results.append(f"{Path(file_path)}:{line_num}:{line.rstrip()}")
+        if len(results) >= limit:
+            break
+    return results
+
+
+def _is_cpu_bound(pattern: str) -> bool:
+    """Guess whether scanning with pattern is limited by re rather than I/O."""
+    return (
+        not HYPERSCAN_AVAILABLE
+        and _REGEX_META_RE.search(pattern) is not None
+        and (len(pattern) > 20 or _BACKTRACKING_RE.search(pattern) is not None)
+    )
+
+
+def _cpu_count() -> int:
+    """Count the CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# Matcher and result limit of a search worker process, set by _init_worker
+_worker_search: tuple[_Matcher, int] | None = None
+
+
+def _init_worker(pattern: str, case_sensitive: bool, limit: int) -> None:
+    """Compile the pattern once in a new worker process."""
+    global _worker_search
+    _worker_search = (_compile_matcher(pattern, case_sensitive), limit)
+
+
+def _search_file_in_worker(file_path: str) -> list[str]:
+    """_search_file with the worker's matcher and limit."""
+    assert _worker_search is not None
+    matcher, limit = _worker_search
+    return _search_file(file_path, matcher, limit)
+
+
+class CodeSearchTool(AllowedPathsMixin, BaseTool):
+    """
+    Search for patterns in code files.
+
+    Supports regex patterns and file type filtering.
+    Uses ripgrep if available for performance, otherwise uses Python fallback.
+    """
+
+    def __init__(self, allowed_paths: list[Path] | PathPolicy | None = None):
+        super().__init__(allowed_paths)
+        self._has_ripgrep = _ripgrep_available()
 
     @property
     def name(self) -> str:
@@ -79,16 +424,6 @@ class CodeSearchTool(BaseTool):
             }
         }
 
-    def _is_path_allowed(self, path: Path) -> bool:
-        """Check if path is within allowed directories."""
-        if self._allowed_paths is None:
-            return True
-        resolved = path.resolve()
-        return any(
-            resolved.is_relative_to(allowed.resolve())
-            for allowed in self._allowed_paths
-        )
-
     def _search_with_ripgrep(
         self,
         pattern: str,
@@ -96,9 +431,26 @@ class CodeSearchTool(BaseTool):
         file_pattern: str | None,
         case_sensitive: bool,
         max_results: int
-    ) -> str:
-        """Search using ripgrep."""
-        cmd = ["rg", "--line-number", "--with-filename"]
+    ) -> tuple[str, int]:
+        """
+        Search using ripgrep.
+
+        Output is read line by line and rg is stopped as soon as
+        max_results lines (or RIPGREP_MAX_OUTPUT_BYTES) have arrived,
+        so large result sets are never buffered whole.
+
+        Returns:
+            The matching lines and how many there are
+        """
+        # Same plain path:line:text format on any terminal; skip unreadable-file noise
+        cmd = [
+            "rg", "--line-number", "--with-filename",
+            "--no-heading", "--color=never", "--no-messages",
+        ]
+
+        if not _REGEX_META_RE.search(pattern):
+            # Plain strings take rg's literal search path instead of the regex engine
+            cmd.append("--fixed-strings")
 
         if not case_sensitive:
             cmd.append("--ignore-case")
@@ -106,29 +458,60 @@ class CodeSearchTool(BaseTool):
         if file_pattern:
             cmd.extend(["--glob", file_pattern])
 
-        cmd.extend(["--max-count", str(max_results)])
-        cmd.append(pattern)
-        cmd.append(str(search_path))
+        cmd.extend(["--", pattern, str(search_path)])
 
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+        # Read bytes and decode the kept lines once, not every line read
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        assert proc.stdout is not None and proc.stderr is not None
+        stderr = proc.stderr
 
-            if result.returncode == 0:
-                return result.stdout
-            elif result.returncode == 1:
-                # No matches found
-                return ""
-            else:
-                # Error occurred
-                raise RuntimeError(f"ripgrep error: {result.stderr}")
+        # Drain stderr alongside stdout so rg never blocks writing errors
+        errors: list[bytes] = []
+        drain = threading.Thread(target=lambda: errors.append(stderr.read()), daemon=True)
+        drain.start()
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
 
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("Search timed out after 30 seconds")
+        timer = threading.Timer(SEARCH_TIMEOUT, kill_on_timeout)
+        timer.start()
+
+        lines: list[bytes] = []
+        size = 0
+        stopped_early = False
+        try:
+            # --max-count is per file, so the global cap is enforced here
+            for line in proc.stdout:
+                lines.append(line)
+                size += len(line)
+                if len(lines) >= max_results or size >= RIPGREP_MAX_OUTPUT_BYTES:
+                    stopped_early = True
+                    break
+        finally:
+            timer.cancel()
+            if stopped_early:
+                proc.terminate()
+            proc.stdout.close()
+            proc.wait()
+            drain.join()
+            stderr.close()
+
+        if timed_out.is_set():
+            raise RuntimeError(f"Search timed out after {SEARCH_TIMEOUT} seconds")
+        if stopped_early or proc.returncode == 0:
+            output = b"".join(lines).decode("utf-8", errors="replace")
+            return output.replace("\r\n", "\n"), len(lines)
+        if proc.returncode == 1:
+            # No matches found
+            return "", 0
+        raise RuntimeError(f"ripgrep error: {b''.join(errors).decode('utf-8', errors='replace')}")
 
     def _search_python_fallback(
         self,
@@ -137,46 +520,90 @@ class CodeSearchTool(BaseTool):
         file_pattern: str | None,
         case_sensitive: bool,
         max_results: int
-    ) -> str:
-        """Fallback search using Python."""
-        results = []
-        flags = 0 if case_sensitive else re.IGNORECASE
+    ) -> tuple[str, int]:
+        """
+        Fallback search using Python, scanning files on a thread pool.
+
+        Returns:
+            The matching lines and how many there are
+        """
+        results: list[str] = []
 
         try:
-            regex = re.compile(pattern, flags)
+            matcher = _compile_matcher(pattern, case_sensitive)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
 
         # Determine glob pattern
         glob_pat = file_pattern if file_pattern else "**/*"
+        name_pat = glob_pat.removeprefix("**/")
 
-        # Search files
-        count = 0
-        for file_path in search_path.rglob(glob_pat) if "**" in glob_pat else search_path.glob(glob_pat):
-            if not file_path.is_file():
-                continue
-
+        if name_pat != glob_pat and "/" not in name_pat and "**" not in name_pat:
+            # Any depth, chosen by file name alone: walk the tree directly
+            name_re = None if name_pat == "*" else _name_regex(name_pat)
+            files = list(_iter_files(str(search_path), name_re))
+        else:
             # Skip binary files and common non-text files
-            if file_path.suffix in {'.pyc', '.exe', '.dll', '.so', '.dylib', '.bin', '.dat'}:
-                continue
-
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for line_num, line in enumerate(f, 1):
-                        if regex.search(line):
-                            # Format: path:line_number:line_content
-                            results.append(f"{file_path}:{line_num}:{line.rstrip()}")
-                            count += 1
-                            if count >= max_results:
-                                break
-            except (UnicodeDecodeError, PermissionError):
-                # Skip binary files or files we can't read
-                continue
-
-            if count >= max_results:
-                break
+            files = [
+                str(file_path)
+                for file_path in (search_path.rglob(glob_pat) if "**" in glob_pat else search_path.glob(glob_pat))
+                if file_path.is_file() and file_path.suffix not in _SKIPPED_SUFFIXES
+            ]
+
+        # Search files
+        workers = _cpu_count()
+        if workers > 1 and len(files) >= PROCESS_POOL_MIN_FILES and _is_cpu_bound(pattern):
+            # re holds the GIL while matching, so threads would take turns
+            scans = self._scan_files_in_processes(
+                files, workers, initargs=(pattern, case_sensitive, max_results)
+            )
+        else:
+            scans = self._scan_files(
+                lambda file_path: _search_file(file_path, matcher, max_results), files
+            )
+        with closing(scans):
+            for file_results in scans:
+                results.extend(file_results)
+                if len(results) >= max_results:
+                    del results[max_results:]
+                    break
+
+        return "\n".join(results), len(results)
+
+    def _scan_files(self, scan: Callable[[str], T], files: list[str]) -> Generator[T, None, None]:
+        """
+        Lazily apply scan to each file, keeping file order.
+
+        Closing the iterator early cancels the files not yet started.
+        """
+        if len(files) <= 1:
+            yield from map(scan, files)
+            return
+        yield from self._map_on_pool(ThreadPoolExecutor(max_workers=SEARCH_WORKERS), scan, files)
+
+    def _scan_files_in_processes(
+        self, files: list[str], workers: int, initargs: tuple[str, bool, int]
+    ) -> Generator[list[str], None, None]:
+        """
+        Like _scan_files, but search files in worker processes.
+
+        Each worker compiles the pattern once, from initargs, and takes
+        PROCESS_CHUNK_SIZE files at a time.
+        """
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=initargs
+        )
+        yield from self._map_on_pool(pool, _search_file_in_worker, files, PROCESS_CHUNK_SIZE)
 
-        return "\n".join(results)
+    @staticmethod
+    def _map_on_pool(
+        pool: Executor, scan: Callable[[str], T], files: list[str], chunksize: int = 1
+    ) -> Generator[T, None, None]:
+        """Map scan over files on pool, shutting it down when done or closed."""
+        try:
+            yield from pool.map(scan, files, chunksize=chunksize)
+        finally:
+            pool.shutdown(cancel_futures=True)
 
     def execute(self, **kwargs: Any) -> ToolResult:
         pattern = kwargs.get("pattern")
@@ -229,13 +656,13 @@ class CodeSearchTool(BaseTool):
 
         # Perform search
         try:
-            if self._has_ripgrep:
-                output = self._search_with_ripgrep(
+            if self._has_ripgrep and not _is_small_tree(str(search_path), RIPGREP_MIN_FILES):
+                output, line_count = self._search_with_ripgrep(
                     pattern, search_path, file_pattern, case_sensitive, max_results
                 )
                 method = "ripgrep"
             else:
-                output = self._search_python_fallback(
+                output, line_count = self._search_python_fallback(
                     pattern, search_path, file_pattern, case_sensitive, max_results
                 )
                 method = "Python fallback"
@@ -247,7 +674,6 @@ class CodeSearchTool(BaseTool):
                 )
 
             # Add header
-            line_count = len(output.strip().split('\n'))
             header = f"Found {line_count} matches (using {method}):\n\n"
 
             return ToolResult(
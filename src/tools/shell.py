@@ -3,14 +3,98 @@ Shell command execution tool.
 
 WARNING: This tool can execute arbitrary commands on the system.
 Use allowed_commands and blocked_commands to restrict what can be run.
+Blocked patterns are matched in one pass with an Aho-Corasick automaton
+when pyahocorasick is installed.
 """
 
+import os
+import re
 import shlex
+import signal
 import subprocess
 from typing import Any
 
 from .base import BaseTool, ToolResult
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# First word of a command, split on the same whitespace as shlex
+_FIRST_WORD_RE = re.compile(r"[ \t\r\n]*([^ \t\r\n]*)")
+
+# Commands made only of these characters mean the same with or without a
+# shell: no quoting, globs, variables, redirection, pipes or separators
+_SIMPLE_COMMAND_RE = re.compile(r"[\w./\- ]+")
+
+# Builtins and keywords always go through the shell, even in simple
+# commands; some (echo, pwd, kill) also exist as programs that differ
+_SHELL_WORDS = frozenset({
+    ".", "alias", "bg", "break", "case", "cd", "command", "continue", "do", "done",
+    "echo", "elif", "else", "esac", "eval", "exec", "exit", "export", "false", "fc",
+    "fg", "fi", "for", "function", "getopts", "hash", "if", "in", "jobs", "kill",
+    "local", "printf", "pwd", "read", "readonly", "return", "select", "set", "shift",
+    "source", "test", "then", "time", "times", "trap", "true", "type", "ulimit",
+    "umask", "unalias", "unset", "until", "wait", "while",
+})
+
+
+def _build_automaton(patterns: list[str]) -> Any:
+    """Build an automaton finding any of patterns, or None to use plain substring checks."""
+    if not AHOCORASICK_AVAILABLE or not all(patterns):
+        # An empty pattern blocks everything; the automaton cannot hold one
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+def _direct_argv(command: str) -> list[str] | None:
+    """Return the argv to run command without a shell, or None if it needs one."""
+    if os.name != "posix" or not _SIMPLE_COMMAND_RE.fullmatch(command):
+        return None
+    argv = command.split()
+    if not argv or argv[0] in _SHELL_WORDS:
+        return None
+    return argv
+
+
+def _first_word(command: str) -> str:
+    """Return the command name, running shlex only when quoting requires it."""
+    match = _FIRST_WORD_RE.match(command)
+    head = match.group(1) if match else ""
+    if not any(quote in head for quote in "\"'\\"):
+        return head
+    try:
+        parts = shlex.split(command)
+        return parts[0] if parts else ""
+    except ValueError:
+        return command.split()[0] if command.split() else ""
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode command output once, with text-mode newlines."""
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _kill_group(proc: subprocess.Popen[bytes]) -> None:
+    """Kill proc and every process in its process group."""
+    if os.name != "posix":
+        proc.kill()
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        # Everything in the group has already exited
+        pass
+
 
 class ShellTool(BaseTool):
     """Execute shell commands."""
@@ -22,7 +106,8 @@ class ShellTool(BaseTool):
         blocked_commands: list[str] | None = None,
     ):
         self._timeout = timeout
-        self._allowed_commands = allowed_commands  # If set, ONLY these commands work
+        # If set, ONLY these commands work
+        self._allowed_commands = None if allowed_commands is None else frozenset(allowed_commands)
         self._blocked_commands = blocked_commands or [
             "rm -rf /",
             "rm -rf ~",
@@ -30,6 +115,7 @@ class ShellTool(BaseTool):
             "dd if=",
             ":(){:|:&};:",  # Fork bomb
         ]
+        self._blocked_automaton = _build_automaton(self._blocked_commands)
     
     @property
     def name(self) -> str:
@@ -52,23 +138,71 @@ class ShellTool(BaseTool):
     def _is_command_allowed(self, command: str) -> tuple[bool, str]:
         """Check if command is allowed to run."""
         # Check blocked patterns
-        for blocked in self._blocked_commands:
-            if blocked in command:
-                return False, f"Command contains blocked pattern: {blocked}"
+        if self._blocked_automaton is not None:
+            hit = next(self._blocked_automaton.iter(command), None)
+            if hit is not None:
+                return False, f"Command contains blocked pattern: {hit[1]}"
+        else:
+            for blocked in self._blocked_commands:
+                if blocked in command:
+                    return False, f"Command contains blocked pattern: {blocked}"
         
         # If allowlist is set, check against it
         if self._allowed_commands is not None:
-            try:
-                parts = shlex.split(command)
-                base_cmd = parts[0] if parts else ""
-            except ValueError:
-                base_cmd = command.split()[0] if command.split() else ""
+            base_cmd = _first_word(command)
             
             if base_cmd not in self._allowed_commands:
                 return False, f"Command '{base_cmd}' is not in the allowed list"
         
         return True, ""
     
+    def _run(self, command: str) -> subprocess.CompletedProcess[bytes]:
+        """
+        Run command, skipping /bin/sh when it is a plain program call.
+
+        A simple command runs the same without a shell, so it is executed
+        directly, saving one process per call. If the program cannot be
+        started, the shell runs it instead, so "not found" errors and exit
+        codes read as before.
+        """
+        argv = _direct_argv(command)
+        if argv is not None:
+            try:
+                return self._communicate(subprocess.Popen(
+                    argv,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    cwd=None,  # Uses current working directory
+                    start_new_session=True,
+                ))
+            except OSError:
+                pass
+        return self._communicate(subprocess.Popen(
+            command,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=None,  # Uses current working directory
+            start_new_session=True,
+        ))
+
+    def _communicate(self, proc: subprocess.Popen[bytes]) -> subprocess.CompletedProcess[bytes]:
+        """
+        Collect a command's raw output, killing its process group on timeout.
+
+        The command leads its own session, so the kill also reaches the
+        processes it started (pipelines, background jobs) instead of
+        leaving them running without a parent.
+        """
+        with proc:
+            try:
+                stdout, stderr = proc.communicate(timeout=self._timeout)
+            except BaseException:
+                _kill_group(proc)
+                proc.wait()
+                raise
+        return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+    
     def execute(self, **kwargs: Any) -> ToolResult:
         command = kwargs.get("command")
         
@@ -89,18 +223,11 @@ class ShellTool(BaseTool):
             )
         
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=self._timeout,
-                cwd=None,  # Uses current working directory
-            )
+            result = self._run(command)
             
-            output = result.stdout
+            output = _decode_output(result.stdout)
             if result.stderr:
-                output += f"\n[stderr]: {result.stderr}"
+                output += f"\n[stderr]: {_decode_output(result.stderr)}"
             
             return ToolResult(
                 success=result.returncode == 0,
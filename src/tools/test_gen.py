@@ -4,19 +4,29 @@ Test Generation Tool
 Allows the agent to automatically generate test scaffolds for Python code.
 """
 
+import os
+import stat
+import threading
 from pathlib import Path
 from typing import Any
 
 from src.agent.test_generator import TestGenerator
-from .base import BaseTool, ToolResult
+from .base import AllowedPathsMixin, BaseTool, PathPolicy, ToolResult
 
+# Source files whose generated tests are kept for repeat requests
+TEST_CACHE_FILES = 128
 
-class TestGenTool(BaseTool):
+
+class TestGenTool(AllowedPathsMixin, BaseTool):
     """Generate pytest-compatible test scaffolds for Python code."""
 
-    def __init__(self, allowed_paths: list[Path] | None = None):
-        self.allowed_paths = allowed_paths or []
+    def __init__(self, allowed_paths: list[Path] | PathPolicy | None = None):
+        # An empty list allows everything, like None
+        super().__init__(allowed_paths or None)
         self.generator = TestGenerator()
+        # source path -> ((mtime_ns, size, inode), generated tests) as last seen
+        self._test_cache: dict[str, tuple[tuple[int, int, int], str | None]] = {}
+        self._cache_lock = threading.Lock()
 
     @property
     def name(self) -> str:
@@ -60,16 +70,29 @@ Example:
             }
         }
 
-    def _check_path_allowed(self, path: Path) -> bool:
-        """Check if path is within allowed directories."""
-        if not self.allowed_paths:
-            return True
+    def _generate_tests(self, source_file: Path, st: os.stat_result) -> str | None:
+        """
+        Generate tests for source_file, reusing them while it is unchanged.
+
+        The file counts as unchanged while its modification time, size
+        and inode (from st) all match what was recorded, so it is only
+        parsed again after a write.
+        """
+        key = str(source_file)
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
 
-        path = path.resolve()
-        return any(
-            path == allowed or path.is_relative_to(allowed)
-            for allowed in self.allowed_paths
-        )
+        with self._cache_lock:
+            cached = self._test_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        test_code = self.generator.generate_tests_for_file(source_file)
+        with self._cache_lock:
+            self._test_cache.pop(key, None)
+            if len(self._test_cache) >= TEST_CACHE_FILES:
+                del self._test_cache[next(iter(self._test_cache))]
+            self._test_cache[key] = (stamp, test_code)
+        return test_code
 
     def execute(self, **kwargs: Any) -> ToolResult:
         """Execute test generation."""
@@ -84,20 +107,30 @@ Example:
         source_file = Path(source_file_str).resolve()
 
         # Security check
-        if not self._check_path_allowed(source_file):
+        if not self._is_path_allowed(source_file):
             return ToolResult(
                 success=False,
                 output="",
                 error=f"Path not allowed: {source_file}"
             )
 
-        if not source_file.exists():
+        # One stat answers both "exists" and "is a file", and stamps the cache
+        try:
+            st = os.stat(source_file)
+        except OSError:
             return ToolResult(
                 success=False,
                 output="",
                 error=f"Source file does not exist: {source_file}"
             )
 
+        if not stat.S_ISREG(st.st_mode):
+            return ToolResult(
+                success=False,
+                output="",
+                error=f"Source file is not a regular file: {source_file}"
+            )
+
         if source_file.suffix != ".py":
             return ToolResult(
                 success=False,
@@ -106,7 +139,7 @@ Example:
             )
 
         # Generate tests
-        test_code = self.generator.generate_tests_for_file(source_file)
+        test_code = self._generate_tests(source_file, st)
 
         if not test_code:
             return ToolResult(
@@ -121,7 +154,7 @@ Example:
             output_file = Path(output_file_str).resolve()
 
             # Security check for output path
-            if not self._check_path_allowed(output_file):
+            if not self._is_path_allowed(output_file):
                 return ToolResult(
                     success=False,
                     output="",
@@ -2,6 +2,7 @@
 Tests for code review functionality.
 """
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -172,6 +173,29 @@ def test_code_review_tool_directory():
         assert "reviewed" in result.output.lower()
 
 
+def test_code_reviewer_review_paths_matches_review_file():
+    """Test that batched review reports the same issues as per-file review."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        first = Path(tmpdir) / "first.py"
+        first.write_text('x: int = "a"\n')
+        nested = Path(tmpdir) / "pkg"
+        nested.mkdir()
+        # Same module name as the other file: mypy rejects such batches
+        second = nested / "first.py"
+        second.write_text("y: str = 1\n")
+        clean = nested / "clean.py"
+        clean.write_text("z = 1\n")
+
+        reviewer = CodeReviewer()
+        results = reviewer.review_paths([first, second, clean])
+
+        assert set(results) == {str(first), str(second), str(clean)}
+        for path in (first, second, clean):
+            expected = reviewer.review_file(path)
+            assert results[str(path)] == expected
+            assert all(issue.file == str(path) for issue in expected.issues)
+
+
 def test_code_review_tool_path_security():
     """Test that tool respects allowed paths."""
     with tempfile.NamedTemporaryFile(mode='w', suffix=".py", delete=False) as f:
@@ -194,6 +218,27 @@ def test_code_review_tool_path_security():
         temp_path.unlink()
 
 
+def test_code_review_tool_relative_allowed_path():
+    """Test that relative allowed paths are resolved against the working directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project = Path(tmpdir) / "project"
+        project.mkdir()
+        (project / "app.py").write_text("x = 1\n")
+        (Path(tmpdir) / "other.py").write_text("x = 1\n")
+
+        cwd = Path.cwd()
+        os.chdir(tmpdir)
+        try:
+            tool = CodeReviewTool(allowed_paths=[Path("project")])
+            inside = tool.execute(path=str(project / "app.py"))
+            outside = tool.execute(path=str(Path(tmpdir) / "other.py"))
+        finally:
+            os.chdir(cwd)
+
+        assert inside.success
+        assert not outside.success
+        assert "not allowed" in outside.error.lower()
+
 def test_review_result_has_errors():
     """Test ReviewResult error detection."""
     from src.agent.code_review import ReviewResult, CodeIssue
@@ -0,0 +1,154 @@
+"""
+Tests for the documentation generator.
+
+Run with: uv run pytest tests/test_docgen.py
+"""
+
+from pathlib import Path
+
+from src.tools.docgen import DocGenerator, DocGenTool
+
+
+class TestParseDocstring:
+    """Tests for DocGenerator._parse_docstring."""
+
+    def test_google_style_sections(self) -> None:
+        """Should split args, returns, raises and examples."""
+        docstring = """Do a thing.
+
+Args:
+    path (str): Where to look
+    recursive: Descend into folders
+
+Returns:
+    Number of files
+    found.
+
+Raises:
+    ValueError: If path is empty
+
+Example:
+    >>> count("src")
+"""
+        parameters, returns, raises, examples = DocGenerator()._parse_docstring(docstring)
+
+        assert parameters == [
+            {"name": "path", "type": "str", "description": "Where to look"},
+            {"name": "recursive", "type": "", "description": "Descend into folders"},
+        ]
+        assert returns == "Number of files found."
+        assert raises == ["ValueError: If path is empty"]
+        assert examples == ['    >>> count("src")']
+
+    def test_no_sections(self) -> None:
+        """Plain docstrings have no structured parts."""
+        assert DocGenerator()._parse_docstring("Just a summary.") == ([], "", [], [])
+
+
+class TestAnalyzePythonFile:
+    """Tests for DocGenerator.analyze_python_file."""
+
+    def test_extracts_top_level_items(self, tmp_path: Path) -> None:
+        """Should collect imports, classes, functions and constants."""
+        source = tmp_path / "sample.py"
+        source.write_text('''"""Sample module."""
+import os
+from typing import Any
+
+LIMIT = 10
+
+
+class Widget(Base):
+    """A widget."""
+    size: int
+
+    def grow(self, by: int = 1) -> int:
+        """Grow the widget."""
+        import math
+        return by
+
+
+async def fetch(url: str, **kwargs: Any) -> bytes:
+    """Fetch a URL."""
+''')
+
+        module = DocGenerator().analyze_python_file(source)
+
+        assert module is not None
+        assert module.description == "Sample module."
+        assert module.imports == ["os", "typing.Any"]
+        assert [c.name for c in module.constants] == ["LIMIT"]
+
+        widget = module.classes[0]
+        assert widget.signature == "class Widget(Base)"
+        assert [(c.kind, c.signature) for c in widget.children] == [
+            ("property", "size: int"),
+            ("method", "def grow(self, by: int) -> int"),
+        ]
+        assert module.functions[0].signature == "async def fetch(url: str, **kwargs) -> bytes"
+
+    def test_nested_imports_opt_in(self, tmp_path: Path) -> None:
+        """Imports inside functions are only collected when requested."""
+        source = tmp_path / "lazy.py"
+        source.write_text("import os\n\ndef f():\n    import json\n")
+
+        module = DocGenerator().analyze_python_file(source, nested_imports=True)
+
+        assert module is not None
+        assert module.imports == ["os", "json"]
+
+
+class TestAnalyzeCSharpFile:
+    """Tests for DocGenerator.analyze_csharp_file."""
+
+    def test_line_numbers_and_summaries(self, tmp_path: Path) -> None:
+        """Should report 1-based line numbers for each declaration."""
+        source = tmp_path / "Widget.cs"
+        source.write_text(
+            "namespace Shop.Models\n"
+            "{\n"
+            "    /// <summary>A widget.</summary>\n"
+            "    public class Widget : Item {\n"
+            "        public int Grow(int by) { return by; }\n"
+            "    }\n"
+            "}\n"
+        )
+
+        module = DocGenerator().analyze_csharp_file(source)
+
+        assert module is not None
+        assert module.description == "Namespace: Shop.Models"
+        assert [(c.name, c.line_number, c.docstring) for c in module.classes] == [
+            ("Widget", 3, "A widget."),
+        ]
+        assert [(f.name, f.line_number) for f in module.functions] == [("Grow", 5)]
+
+
+class TestDocGenTool:
+    """Tests for DocGenTool operations."""
+
+    def test_api_skips_private_names(self, tmp_path: Path) -> None:
+        """The api operation should only document the public surface."""
+        (tmp_path / "shop.py").write_text(
+            "class Cart:\n    pass\n\nclass _Cache:\n    pass\n\n"
+            "def checkout():\n    pass\n\ndef _helper():\n    pass\n"
+        )
+        (tmp_path / "_internal.py").write_text("def hidden():\n    pass\n")
+
+        result = DocGenTool().execute(operation="api", path=str(tmp_path))
+
+        assert result.success is True
+        assert "## Cart" in result.output
+        assert "checkout" in result.output
+        assert "_Cache" not in result.output
+        assert "_helper" not in result.output
+        assert "hidden" not in result.output
+
+    def test_html_escapes_signatures(self, tmp_path: Path) -> None:
+        """Source text must not leak raw markup into HTML output."""
+        (tmp_path / "cmp.py").write_text("def less(a: 'A<B', b) -> bool:\n    pass\n")
+
+        result = DocGenTool().execute(operation="generate", path=str(tmp_path), format="html")
+
+        assert result.success is True
+        assert "<pre>def less(a: &#x27;A&lt;B&#x27;, b) -&gt; bool</pre>" in result.output
@@ -241,3 +241,117 @@ def other():
 
         assert result.success is False
         assert "not found" in result.error.lower()
+
+    def test_diff_hunk_covers_only_edited_region(self, tmp_path: Path) -> None:
+        """Diff should show the changed line with three lines of context."""
+        test_file = tmp_path / "long.py"
+        test_file.write_text("".join(f"line {i}\n" for i in range(1, 101)))
+
+        tool = StrReplaceTool(allowed_paths=[tmp_path])
+        result = tool.execute(path=str(test_file), old_str="line 50\n", new_str="LINE 50\n")
+
+        assert result.success is True
+        diff = result.output.split("Diff:\n", 1)[1]
+        assert diff.splitlines() == [
+            f"--- {test_file} (before)",
+            f"+++ {test_file} (after)",
+            "@@ -47,7 +47,7 @@",
+            " line 47",
+            " line 48",
+            " line 49",
+            "-line 50",
+            "+LINE 50",
+            " line 51",
+            " line 52",
+            " line 53",
+        ]
+
+    def test_crlf_file_keeps_line_endings(self, tmp_path: Path) -> None:
+        """LF in old_str/new_str should match and preserve CRLF files."""
+        test_file = tmp_path / "win.cs"
+        test_file.write_bytes(b"class A\r\n{\r\n    int x;\r\n}\r\n")
+
+        tool = StrReplaceTool(allowed_paths=[tmp_path])
+        result = tool.execute(
+            path=str(test_file),
+            old_str="{\n    int x;",
+            new_str="{\n    int x;\n    int y;",
+        )
+
+        assert result.success is True
+        assert test_file.read_bytes() == b"class A\r\n{\r\n    int x;\r\n    int y;\r\n}\r\n"
+
+    def test_binary_file_rejected(self, tmp_path: Path) -> None:
+        """Should refuse to edit files containing NUL bytes."""
+        test_file = tmp_path / "blob.bin"
+        test_file.write_bytes(b"abc\x00def")
+
+        tool = StrReplaceTool(allowed_paths=[tmp_path])
+        result = tool.execute(path=str(test_file), old_str="abc", new_str="xyz")
+
+        assert result.success is False
+        assert "not a text file" in result.error
+        assert test_file.read_bytes() == b"abc\x00def"
+
+    def test_external_change_between_edits(self, tmp_path: Path) -> None:
+        """Edits made outside the tool must be seen by the next edit."""
+        test_file = tmp_path / "notes.txt"
+        test_file.write_text("alpha\nbeta\n")
+        tool = StrReplaceTool(allowed_paths=[tmp_path])
+
+        assert tool.execute(path=str(test_file), old_str="alpha", new_str="one").success
+        test_file.write_text("one\nbeta\ngamma-extra\n")
+        result = tool.execute(path=str(test_file), old_str="beta", new_str="two")
+
+        assert result.success is True
+        assert test_file.read_text() == "one\ntwo\ngamma-extra\n"
+
+    def test_replace_line_range(self, tmp_path: Path) -> None:
+        """Should replace lines by number without needing old_str."""
+        test_file = tmp_path / "lines.txt"
+        test_file.write_text("one\ntwo\nthree\nfour\n")
+
+        tool = StrReplaceTool(allowed_paths=[tmp_path])
+        result = tool.execute(path=str(test_file), new_str="TWO\nTHREE", start_line=2, end_line=3)
+
+        assert result.success is True
+        assert test_file.read_text() == "one\nTWO\nTHREE\nfour\n"
+        assert "-two" in result.output
+        assert "+THREE" in result.output
+
+    def test_line_range_outside_file(self, tmp_path: Path) -> None:
+        """Should reject ranges past the end of the file."""
+        test_file = tmp_path / "short.txt"
+        test_file.write_text("only\n")
+
+        tool = StrReplaceTool(allowed_paths=[tmp_path])
+        result = tool.execute(path=str(test_file), new_str="x", start_line=2)
+
+        assert result.success is False
+        assert test_file.read_text() == "only\n"
+
+    def test_line_range_must_be_integers(self, tmp_path: Path) -> None:
+        """Should reject line numbers that are not integers before touching the file."""
+        test_file = tmp_path / "short.txt"
+        test_file.write_text("only\n")
+
+        tool = StrReplaceTool(allowed_paths=[tmp_path])
+        result = tool.execute(path=str(test_file), new_str="x", start_line="one")
+
+        assert result.success is False
+        assert result.error == "start_line and end_line must be integers"
+        assert test_file.read_text() == "only\n"
+
+    def test_large_diff_is_truncated(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Diff previews should stop at MAX_DIFF_LINES."""
+        monkeypatch.setattr("src.tools.editor.MAX_DIFF_LINES", 5)
+        test_file = tmp_path / "many.txt"
+        test_file.write_text("".join(f"line {i}\n" for i in range(20)))
+
+        tool = StrReplaceTool(allowed_paths=[tmp_path])
+        result = tool.execute(path=str(test_file), new_str="gone\n", start_line=1, end_line=20)
+
+        assert result.success is True
+        assert test_file.read_text() == "gone\n"
+        assert result.output.endswith("... (diff truncated after 5 lines)")
+        assert "line 10" not in result.output
@@ -9,7 +9,7 @@ from pathlib import Path
 
 import pytest
 
-from src.tools import ReadFileTool, WriteFileTool, ListDirectoryTool
+from src.tools import ListDirectoryTool, PathPolicy, ReadFileTool, WriteFileTool
 
 
 class TestReadFileTool:
@@ -54,10 +54,41 @@ class TestReadFileTool:
         tool = ReadFileTool()
         
         result = tool.execute()
-        
+
         assert result.success is False
         assert "missing" in result.error.lower()
 
+    def test_read_utf16_with_bom(self, tmp_path: Path) -> None:
+        """Should decode UTF-16 files marked with a byte order mark."""
+        test_file = tmp_path / "wide.txt"
+        test_file.write_text("héllo\nworld", encoding="utf-16")
+
+        result = ReadFileTool().execute(path=str(test_file))
+
+        assert result.success is True
+        assert result.output == "[Read with utf-16 encoding]\nhéllo\nworld"
+
+    def test_read_latin1_fallback(self, tmp_path: Path) -> None:
+        """Should fall back to latin-1 when the file is not UTF-8."""
+        test_file = tmp_path / "legacy.txt"
+        test_file.write_bytes("café\r\n".encode("latin-1"))
+
+        result = ReadFileTool().execute(path=str(test_file))
+
+        assert result.success is True
+        assert result.output == "[Read with latin-1 encoding]\ncafé\n"
+
+    def test_read_binary_file(self, tmp_path: Path) -> None:
+        """Should refuse files containing NUL bytes."""
+        test_file = tmp_path / "blob.bin"
+        test_file.write_bytes(b"\x7fELF\x00\x01\x02")
+
+        result = ReadFileTool().execute(path=str(test_file))
+
+        assert result.success is False
+        assert "binary" in result.error.lower()
+        assert "7f454c46" in result.output
+
 
 class TestWriteFileTool:
     """Tests for WriteFileTool."""
@@ -72,7 +103,17 @@ class TestWriteFileTool:
         assert result.success is True
         assert test_file.exists()
         assert test_file.read_text() == "New content"
-    
+
+    def test_write_bytes_content(self, tmp_path: Path) -> None:
+        """Should write pre-encoded content as-is."""
+        tool = WriteFileTool(allowed_paths=[tmp_path])
+        test_file = tmp_path / "raw.bin"
+
+        result = tool.execute(path=str(test_file), content=b"\xff\x00\r\n")
+
+        assert result.success is True
+        assert test_file.read_bytes() == b"\xff\x00\r\n"
+
     def test_overwrite_existing_file(self, tmp_path: Path) -> None:
         """Should overwrite existing file."""
         test_file = tmp_path / "existing.txt"
@@ -141,3 +182,79 @@ class TestListDirectoryTool:
         
         assert result.success is False
         assert "not found" in result.error.lower()
+
+    def test_list_recursive_is_capped(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Huge listings should be truncated with a notice."""
+        from src.tools import filesystem
+
+        monkeypatch.setattr(filesystem, "MAX_LIST_ENTRIES", 3)
+        (tmp_path / "sub").mkdir()
+        for i in range(5):
+            (tmp_path / "sub" / f"f{i}.txt").write_text("x")
+
+        tool = ListDirectoryTool(allowed_paths=[tmp_path])
+        result = tool.execute(path=str(tmp_path), recursive=True)
+
+        lines = result.output.splitlines()
+        assert result.success is True
+        assert lines[0] == "[DIR]  sub"
+        assert len(lines) == 4
+        assert "truncated" in lines[-1]
+
+
+class TestAllowedPaths:
+    """Tests for the shared allowed-path check."""
+
+    def test_symlink_escape_denied(self, tmp_path: Path) -> None:
+        """A symlink inside the sandbox must not grant access outside it."""
+        sandbox = tmp_path / "sandbox"
+        sandbox.mkdir()
+        secret = tmp_path / "secret.txt"
+        secret.write_text("nope")
+        (sandbox / "link.txt").symlink_to(secret)
+
+        tool = ReadFileTool(allowed_paths=[sandbox])
+        result = tool.execute(path=str(sandbox / "link.txt"))
+
+        assert result.success is False
+        assert "denied" in result.error.lower()
+
+    def test_allowed_root_given_via_symlink(self, tmp_path: Path) -> None:
+        """Allowed roots are compared in resolved form."""
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "a.txt").write_text("ok")
+        alias = tmp_path / "alias"
+        alias.symlink_to(real)
+
+        tool = ReadFileTool(allowed_paths=[alias])
+        result = tool.execute(path=str(real / "a.txt"))
+
+        assert result.success is True
+        assert result.output == "ok"
+
+    def test_sibling_with_shared_prefix_denied(self, tmp_path: Path) -> None:
+        """'/x/proj2' is not inside '/x/proj'."""
+        allowed = tmp_path / "proj"
+        allowed.mkdir()
+        sibling = tmp_path / "proj2"
+        sibling.mkdir()
+        (sibling / "f.txt").write_text("x")
+
+        tool = ReadFileTool(allowed_paths=[allowed])
+        result = tool.execute(path=str(sibling / "f.txt"))
+
+        assert result.success is False
+
+    def test_shared_policy(self, tmp_path: Path) -> None:
+        """One PathPolicy instance can back several tools."""
+        policy = PathPolicy([tmp_path])
+        target = tmp_path / "shared.txt"
+
+        assert WriteFileTool(allowed_paths=policy).execute(path=str(target), content="hi").success
+        assert ReadFileTool(allowed_paths=policy).execute(path=str(target)).output == "hi"
+        assert not policy.is_allowed(tmp_path.parent / "elsewhere.txt")
+
+    def test_filesystem_root_allows_everything(self) -> None:
+        """An allowed root of '/' must not become the prefix '//'."""
+        assert PathPolicy([Path("/")]).is_allowed(Path("/etc/hosts"))
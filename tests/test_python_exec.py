@@ -0,0 +1,114 @@
+"""
+Tests for the Python execution tool.
+
+Run with: uv run pytest tests/test_python_exec.py
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.tools.python_exec import PythonExecTool
+
+
+@pytest.fixture
+def tool(tmp_path: Path):
+    tool = PythonExecTool(timeout=5, working_dir=tmp_path)
+    yield tool
+    tool.close()
+
+
+class TestPythonExecTool:
+    """Tests for PythonExecTool."""
+
+    def test_captures_stdout_and_stderr(self, tool: PythonExecTool) -> None:
+        """Should return both output streams."""
+        result = tool.execute(code="import sys\nprint('out')\nprint('err', file=sys.stderr)")
+
+        assert result.success is True
+        assert result.output == "out\n\n[stderr]: err"
+
+    def test_exit_code_reported(self, tool: PythonExecTool) -> None:
+        """Non-zero exits should fail with the exit code."""
+        result = tool.execute(code="raise SystemExit(3)")
+
+        assert result.success is False
+        assert result.error == "Exit code: 3"
+
+    def test_traceback_quotes_source(self, tool: PythonExecTool) -> None:
+        """Uncaught exceptions should print a normal traceback."""
+        result = tool.execute(code="x = 1\ny = x / 0\n")
+
+        assert result.success is False
+        assert "y = x / 0" in result.output
+        assert "ZeroDivisionError" in result.output
+
+    def test_calls_do_not_share_state(self, tool: PythonExecTool) -> None:
+        """Each call should start from a clean interpreter."""
+        tool.execute(code="import json\njson.marker = 1\nleak = 1")
+        result = tool.execute(code="import json\nprint(hasattr(json, 'marker'), 'leak' in globals())")
+
+        assert result.output == "False False"
+
+    def test_code_runs_as_main_module(self, tool: PythonExecTool) -> None:
+        """Names the code defines should be importable from __main__, as under `python -`."""
+        code = (
+            "import pickle, sys, unittest\n"
+            "def double(x):\n"
+            "    return 2 * x\n"
+            "print(pickle.loads(pickle.dumps(double))(4), __file__, __spec__)\n"
+            "class T(unittest.TestCase):\n"
+            "    def test_it(self):\n"
+            "        pass\n"
+            "unittest.main()\n"
+        )
+        result = tool.execute(code=code)
+
+        assert result.success is True
+        assert result.output.startswith("8 <stdin> None")
+        assert "Ran 1 test" in result.output
+
+    def test_runs_in_working_dir(self, tool: PythonExecTool, tmp_path: Path) -> None:
+        """Code should run in, and import from, the working directory."""
+        (tmp_path / "helper.py").write_text("VALUE = 42\n")
+
+        result = tool.execute(code="import helper, os\nprint(helper.VALUE, os.getcwd())")
+
+        assert result.output == f"42 {tmp_path}"
+
+    def test_follows_current_environment_and_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Each call should see the environment and directory as they are now."""
+        tool = PythonExecTool(timeout=5)
+        try:
+            code = "import os\nprint(os.environ.get('EXEC_TEST_VALUE'), os.getcwd())"
+            tool.execute(code=code)
+            monkeypatch.setenv("EXEC_TEST_VALUE", "changed")
+            monkeypatch.chdir(tmp_path)
+
+            assert tool._server is not None
+            assert tool.execute(code=code).output == f"changed {tmp_path}"
+        finally:
+            tool.close()
+
+    def test_timeout(self, tmp_path: Path) -> None:
+        """Code running past the timeout should be stopped."""
+        tool = PythonExecTool(timeout=1, working_dir=tmp_path)
+        try:
+            result = tool.execute(code="import time\ntime.sleep(30)")
+            assert result.success is False
+            assert "timed out" in result.error
+            assert tool.execute(code="print('still usable')").output == "still usable"
+        finally:
+            tool.close()
+
+    def test_fresh_interpreter_fallback(self, tool: PythonExecTool, tmp_path: Path) -> None:
+        """The spawn fallback should run code from stdin in the working directory."""
+        returncode, stdout, stderr, timed_out = tool._run_in_subprocess(
+            "import os, sys\nprint(sys.argv, os.getcwd())"
+        )
+
+        assert (returncode, stderr, timed_out) == (0, "", False)
+        assert stdout == f"['-'] {tmp_path}\n"
+        assert not list(tmp_path.iterdir())
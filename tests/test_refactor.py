@@ -0,0 +1,155 @@
+"""
+Tests for the refactoring tool.
+
+Run with: uv run pytest tests/test_refactor.py
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.tools.refactor import RefactorTool
+
+
+class TestRenameSymbol:
+    """Tests for the rename_symbol operation."""
+
+    def test_renames_whole_words_only(self, tmp_path: Path) -> None:
+        """Should rename the symbol but not identifiers containing it."""
+        source = tmp_path / "shop.py"
+        source.write_text("total = 1\nsubtotal = total + 2\n\nprint(total_x, total)\n")
+
+        tool = RefactorTool(working_dir=tmp_path)
+        result = tool.execute(operation="rename_symbol", symbol="total", new_name="amount")
+
+        assert result.success is True
+        assert source.read_text() == "amount = 1\nsubtotal = amount + 2\n\nprint(total_x, amount)\n"
+        assert "Changes made: 3" in result.output
+        assert "shop.py:4" in result.output
+
+    def test_python_comments_and_prose_untouched(self, tmp_path: Path) -> None:
+        """In Python files, comments and string prose should keep the old name."""
+        source = tmp_path / "report.py"
+        source.write_text(
+            '"""Compute the total."""\n'
+            '__all__ = ["total"]\n'
+            'total = 1  # the total\n'
+            'print(f"{total}", "total so far")\n'
+        )
+
+        tool = RefactorTool(working_dir=tmp_path)
+        result = tool.execute(operation="rename_symbol", symbol="total", new_name="amount")
+
+        assert result.success is True
+        assert source.read_text() == (
+            '"""Compute the total."""\n'
+            '__all__ = ["amount"]\n'
+            'amount = 1  # the total\n'
+            'print(f"{amount}", "total so far")\n'
+        )
+
+    def test_untouched_files_not_rewritten(self, tmp_path: Path) -> None:
+        """Files without the symbol should be left alone."""
+        other = tmp_path / "other.py"
+        other.write_text("x = 1\r\n")
+
+        tool = RefactorTool(working_dir=tmp_path)
+        result = tool.execute(operation="rename_symbol", symbol="total", new_name="amount")
+
+        assert result.success is True
+        assert "Files modified: 0" in result.output
+        assert other.read_bytes() == b"x = 1\r\n"
+
+    def test_sees_own_rewrites(self, tmp_path: Path) -> None:
+        """Cached file contents should not outlive a rename."""
+        source = tmp_path / "shop.py"
+        source.write_text("total = 1\n")
+
+        tool = RefactorTool(working_dir=tmp_path)
+        tool.execute(operation="find_usages", symbol="total")
+        tool.execute(operation="rename_symbol", symbol="total", new_name="other")
+        result = tool.execute(operation="find_usages", symbol="other")
+
+        assert result.output.startswith("Found 1 usages of 'other'")
+
+
+class TestMoveToFile:
+    """Tests for the move_to_file operation."""
+
+    def test_moves_exact_definition(self, tmp_path: Path) -> None:
+        """Should move the named definition, not one sharing its prefix."""
+        source = tmp_path / "utils.py"
+        source.write_text("def foobar(x):\n    return x\n\ndef foo(y):\n    return y\n")
+        target = tmp_path / "moved.py"
+
+        tool = RefactorTool(working_dir=tmp_path)
+        result = tool._move_to_file("foo", str(source), str(target))
+
+        assert result.success is True
+        assert source.read_text() == "def foobar(x):\n    return x\n"
+        assert target.read_text() == "def foo(y):\n    return y\n"
+
+
+    def test_moves_earlier_definition_on_shared_line(self, tmp_path: Path) -> None:
+        """A definition followed by another on the same line should still be found."""
+        source = tmp_path / "util.cpp"
+        source.write_text("int foo() { return 1; } int bar() { return 2; }\n")
+        target = tmp_path / "moved.cpp"
+
+        tool = RefactorTool(working_dir=tmp_path)
+        result = tool._move_to_file("foo", str(source), str(target))
+
+        assert result.success is True
+        assert target.read_text() == "int foo() { return 1; }"
+        assert source.read_text() == "int bar() { return 2; }\n"
+
+class TestFindUsages:
+    """Tests for the find_usages operation."""
+
+    def test_skips_binary_files(self, tmp_path: Path) -> None:
+        """Files that look binary should not be searched."""
+        (tmp_path / "real.py").write_text("total = 1\n")
+        (tmp_path / "blob.h").write_bytes(b"\x00\x01total\xff\xfe")
+
+        tool = RefactorTool(working_dir=tmp_path)
+        result = tool.execute(operation="find_usages", symbol="total")
+
+        assert result.success is True
+        assert "real.py:1" in result.output
+        assert "blob.h" not in result.output
+
+    def test_stops_at_limit(self, tmp_path: Path) -> None:
+        """Should stop early and say the result was truncated."""
+        (tmp_path / "many.py").write_text("total = 1\n" * 5)
+
+        tool = RefactorTool(working_dir=tmp_path)
+        limited = tool.execute(operation="find_usages", symbol="total", limit=3)
+        complete = tool.execute(operation="find_usages", symbol="total", limit=0)
+
+        assert limited.output.startswith("Found more than 3 usages of 'total' (showing first 3; truncated)")
+        assert "many.py:3:1" in limited.output
+        assert "many.py:4:1" not in limited.output
+        assert complete.output.startswith("Found 5 usages of 'total'")
+
+    def test_rejects_invalid_limit(self, tmp_path: Path) -> None:
+        """Negative or non-integer limits should be refused with a clear error."""
+        (tmp_path / "one.py").write_text("total = 1\n")
+
+        tool = RefactorTool(working_dir=tmp_path)
+        for limit in (-1, "many"):
+            result = tool.execute(operation="find_usages", symbol="total", limit=limit)
+
+            assert result.success is False
+            assert result.error == "limit must be a non-negative integer"
+
+    def test_large_files_streamed(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Streaming large files should report the same usages."""
+        (tmp_path / "gen.py").write_text("x = 1\r\ny = total\r\n\ttotal(total)\n")
+        tool = RefactorTool(working_dir=tmp_path)
+        expected = tool.execute(operation="find_usages", symbol="total")
+
+        monkeypatch.setattr("src.tools.refactor.STREAM_USAGES_BYTES", 0)
+        streamed = tool.execute(operation="find_usages", symbol="total")
+
+        assert streamed.output == expected.output
+        assert "gen.py:3:8" in streamed.output
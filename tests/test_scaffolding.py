@@ -0,0 +1,110 @@
+"""
+Tests for the project scaffolding tool.
+
+Run with: uv run pytest tests/test_scaffolding.py
+"""
+
+import shutil
+from pathlib import Path
+
+from src.tools.scaffolding import CreateSpec, ScaffoldingTool
+
+
+class TestCreateProject:
+    """Tests for the create operation."""
+
+    def test_placeholders_rendered(self, tmp_path: Path) -> None:
+        """Should substitute the project name and description everywhere."""
+        tool = ScaffoldingTool()
+
+        for _ in range(2):
+            result = tool.execute(
+                operation="create",
+                template="cpp-console",
+                path=str(tmp_path),
+                project_name="demo",
+                description="A {demo} tool",
+            )
+            assert result.success is True
+
+        project = tmp_path / "demo"
+        assert (project / "include" / "demo" / "config.hpp").is_file()
+        contents = "".join(p.read_text() for p in project.rglob("*") if p.is_file())
+        assert "{project_name}" not in contents
+        assert "{description}" not in contents
+
+    def test_recreates_removed_directories(self, tmp_path: Path) -> None:
+        """Scaffolding again after the project was deleted should still work."""
+        tool = ScaffoldingTool()
+        kwargs = {"operation": "create", "template": "python-cli", "path": str(tmp_path), "project_name": "demo"}
+
+        assert tool.execute(**kwargs).success is True
+        shutil.rmtree(tmp_path / "demo")
+        result = tool.execute(**kwargs)
+
+        assert result.success is True
+        assert (tmp_path / "demo" / "tests" / "test_main.py").is_file()
+
+    def test_rejects_escaping_project_name(self, tmp_path: Path) -> None:
+        """A project name that steers files outside the project should be refused."""
+        tool = ScaffoldingTool()
+        result = tool.execute(
+            operation="create",
+            template="cpp-console",
+            path=str(tmp_path / "out"),
+            project_name="../../escaped",
+        )
+
+        assert result.success is False
+        assert "outside the project" in result.error
+        assert not (tmp_path / "out").exists()
+
+
+    def test_rejects_absolute_project_name(self, tmp_path: Path) -> None:
+        """An absolute project name should be refused, not used as the project root."""
+        target = tmp_path / "elsewhere"
+        tool = ScaffoldingTool()
+        result = tool.execute(
+            operation="create",
+            template="cpp-console",
+            path=str(tmp_path / "out"),
+            project_name=str(target),
+        )
+
+        assert result.success is False
+        assert "outside the project" in result.error
+        assert not target.exists()
+
+    def test_rejects_escaping_name_without_name_in_paths(self, tmp_path: Path) -> None:
+        """The name should be checked even when no file path contains it."""
+        tool = ScaffoldingTool()
+        result = tool.execute(
+            operation="create",
+            template="python-cli",
+            path=str(tmp_path / "out"),
+            project_name="../escaped",
+        )
+
+        assert result.success is False
+        assert "outside the project" in result.error
+        assert not (tmp_path / "escaped").exists()
+
+class TestCreateMany:
+    """Tests for batch project creation."""
+
+    def test_results_in_spec_order(self, tmp_path: Path) -> None:
+        """Should create every valid project and report failures per spec."""
+        tool = ScaffoldingTool()
+        results = tool.create_many([
+            CreateSpec("python-cli", str(tmp_path), "one"),
+            CreateSpec("missing", str(tmp_path), "two"),
+            CreateSpec("dotnet-wpf", str(tmp_path), "three"),
+        ])
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "Template not found: missing"
+        assert (tmp_path / "one" / "src" / "main.py").is_file()
+        assert (tmp_path / "three" / "ViewModels" / "MainViewModel.cs").is_file()
+        assert results[2].output == ScaffoldingTool().execute(
+            operation="create", template="dotnet-wpf", path=str(tmp_path), project_name="three"
+        ).output
@@ -0,0 +1,146 @@
+"""
+Tests for the code search tool.
+
+Run with: uv run pytest tests/test_search.py
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.tools import search
+from src.tools.search import CodeSearchTool
+
+
+class TestPythonFallback:
+    """Tests for the search used when ripgrep is not installed."""
+
+    def test_reports_matching_lines(self, tmp_path: Path) -> None:
+        """Should give path, line number and text for each matching line."""
+        source = tmp_path / "app.py"
+        source.write_bytes(b"import os\r\nvalue = 1\rprint(value)\n")
+
+        tool = CodeSearchTool()
+        output, _ = tool._search_python_fallback(r"^\w+\(value", tmp_path, None, True, 100)
+
+        assert output == f"{source}:3:print(value)"
+
+    def test_skips_files_that_are_not_utf8(self, tmp_path: Path) -> None:
+        """Undecodable files should be skipped rather than failing the search."""
+        (tmp_path / "ok.txt").write_text("needle\n")
+        (tmp_path / "latin1.txt").write_bytes(b"needle \xe9\n")
+
+        tool = CodeSearchTool()
+        output, _ = tool._search_python_fallback("needle", tmp_path, None, True, 100)
+
+        assert output == f"{tmp_path / 'ok.txt'}:1:needle"
+
+    def test_stops_at_max_results_across_files(self, tmp_path: Path) -> None:
+        """Should return the first matches in walk order and no more."""
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (tmp_path / name).write_text("hit\nhit\n")
+
+        tool = CodeSearchTool()
+        output, _ = tool._search_python_fallback("hit", tmp_path, "*.txt", True, 3)
+
+        assert output.count("\n") == 2
+        assert output.splitlines()[0].endswith(":1:hit")
+
+    def test_skips_files_with_nul_bytes(self, tmp_path: Path) -> None:
+        """A NUL near the start marks a binary file, whatever its extension."""
+        (tmp_path / "data.txt").write_bytes(b"\x00\x01needle\n")
+
+        tool = CodeSearchTool()
+        output, _ = tool._search_python_fallback("needle", tmp_path, None, True, 100)
+
+        assert output == ""
+
+    def test_matches_stay_within_one_line(self, tmp_path: Path) -> None:
+        """A pattern that could span lines should still match line by line."""
+        source = tmp_path / "notes.txt"
+        source.write_text("a\nb\na b\nend\n")
+
+        tool = CodeSearchTool()
+        output, _ = tool._search_python_fallback(r"a\s+b", tmp_path, None, True, 100)
+
+        assert output == f"{source}:3:a b"
+
+    def test_ascii_text_matches_like_unicode(self, tmp_path: Path) -> None:
+        """The faster ASCII matching should find the same lines as Unicode matching."""
+        source = tmp_path / "sep.txt"
+        source.write_text("a\x1cb\nK\n")
+
+        tool = CodeSearchTool()
+        spaces, _ = tool._search_python_fallback(r"a\sb", tmp_path, None, True, 100)
+        words, _ = tool._search_python_fallback(r"\bk\b", tmp_path, None, False, 100)
+
+        assert spaces == f"{source}:1:a\x1cb"
+        assert words == f"{source}:2:K"
+
+    def test_process_pool_matches_threads(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A CPU-bound pattern searched in worker processes should give the same output."""
+        for i in range(6):
+            (tmp_path / f"m{i}.py").write_text("x = y\nvalue == other\n" * 3)
+        pattern = r"(\w+)\s*(=|==)\s*(\w+)"
+
+        tool = CodeSearchTool()
+        expected = tool._search_python_fallback(pattern, tmp_path, None, True, 100)
+        monkeypatch.setattr(search, "_cpu_count", lambda: 2)
+        monkeypatch.setattr(search, "PROCESS_POOL_MIN_FILES", 2)
+        monkeypatch.setattr(search, "HYPERSCAN_AVAILABLE", False)
+
+        assert tool._search_python_fallback(pattern, tmp_path, None, True, 100) == expected
+        assert tool._search_python_fallback(pattern, tmp_path, None, True, 4)[1] == 4
+
+
+class TestExecute:
+    """Tests for choosing between ripgrep and the Python search."""
+
+    def _tool(self, monkeypatch: pytest.MonkeyPatch) -> CodeSearchTool:
+        """A tool that believes ripgrep is installed and fakes its output."""
+        tool = CodeSearchTool()
+        tool._has_ripgrep = True
+        monkeypatch.setattr(tool, "_search_with_ripgrep", lambda *args: ("rg.py:1:needle", 1))
+        return tool
+
+    def test_small_tree_skips_ripgrep(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A tree with only a few files should be searched without starting rg."""
+        (tmp_path / "app.py").write_text("needle\n")
+
+        result = self._tool(monkeypatch).execute(pattern="needle", path=str(tmp_path))
+
+        assert "using Python fallback" in result.output
+
+    def test_large_or_hidden_tree_uses_ripgrep(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Trees at the threshold, or with ignore files, should still go to rg."""
+        (tmp_path / "app.py").write_text("needle\n")
+        (tmp_path / ".gitignore").write_text("app.py\n")
+        tool = self._tool(monkeypatch)
+
+        assert "using ripgrep" in tool.execute(pattern="needle", path=str(tmp_path)).output
+
+        (tmp_path / ".gitignore").unlink()
+        monkeypatch.setattr(search, "RIPGREP_MIN_FILES", 1)
+
+        assert "using ripgrep" in tool.execute(pattern="needle", path=str(tmp_path)).output
+
+
+class TestHyperscanPrefilter:
+    """Tests for skipping files with hyperscan before matching with re."""
+
+    def test_prefilter_never_drops_matches(self, tmp_path: Path) -> None:
+        """Files re would match should be searched; others skipped."""
+        pytest.importorskip("hyperscan")
+        (tmp_path / "sep.txt").write_text("a\x1cb\n")
+        (tmp_path / "code.py").write_text("x = 1\nfoo(bar)\n")
+        (tmp_path / "other.txt").write_text("nothing here\n")
+
+        assert search._hyperscan_prefilter(r"fo+\(", True) is not None
+        assert search._hyperscan_prefilter(r"a\sb", True) is None
+
+        tool = CodeSearchTool()
+        calls, _ = tool._search_python_fallback(r"fo+\(", tmp_path, None, True, 100)
+        spaces, _ = tool._search_python_fallback(r"a\sb", tmp_path, None, True, 100)
+
+        assert calls == f"{tmp_path / 'code.py'}:2:foo(bar)"
+        assert spaces == f"{tmp_path / 'sep.txt'}:1:a\x1cb"
@@ -0,0 +1,85 @@
+"""
+Tests for the shell tool.
+
+Run with: uv run pytest tests/test_shell.py
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.tools.shell import ShellTool
+
+
+class TestCommandPolicy:
+    """Tests for allowed and blocked command checks."""
+
+    def test_allowlist_uses_command_name(self) -> None:
+        """Only the first word, unquoted, should be checked against the allowlist."""
+        tool = ShellTool(allowed_commands=["ls", "git"])
+
+        assert tool._is_command_allowed("  ls -la")[0] is True
+        assert tool._is_command_allowed('"git" status')[0] is True
+        assert tool._is_command_allowed("lsblk") == (False, "Command 'lsblk' is not in the allowed list")
+
+    def test_blocked_pattern_anywhere(self) -> None:
+        """A blocked pattern should be refused wherever it appears."""
+        tool = ShellTool(blocked_commands=["mkfs"])
+
+        assert tool._is_command_allowed("echo hi && mkfs /dev/sda") == (
+            False, "Command contains blocked pattern: mkfs"
+        )
+        assert tool._is_command_allowed("echo hi")[0] is True
+
+
+    def test_blocked_patterns_with_automaton(self) -> None:
+        """The Aho-Corasick path should report the same blocked pattern as substring checks."""
+        pytest.importorskip("ahocorasick")
+        tool = ShellTool(blocked_commands=["mkfs", "dd if=", "rm -rf /"])
+
+        assert tool._blocked_automaton is not None
+        assert tool._is_command_allowed("sudo mkfs.ext4 /dev/sdb") == (
+            False, "Command contains blocked pattern: mkfs"
+        )
+        assert tool._is_command_allowed("dd if=/dev/zero of=x")[1] == "Command contains blocked pattern: dd if="
+        assert tool._is_command_allowed("rm -rf ./build") == (True, "")
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX shell semantics")
+class TestExecute:
+    """Tests for running commands."""
+
+    def test_simple_and_shell_commands(self) -> None:
+        """Plain program calls and shell syntax should both work."""
+        tool = ShellTool(timeout=10)
+
+        assert tool.execute(command="uname").success is True
+        assert tool.execute(command="echo one | tr o 0").output == "0ne"
+
+    def test_missing_program_reported_by_shell(self) -> None:
+        """A program that cannot be started should fail as the shell reports it."""
+        tool = ShellTool(timeout=10)
+        result = tool.execute(command="no_such_program_for_tests --version")
+
+        assert result.success is False
+        assert result.error == "Exit code: 127"
+        assert "not found" in result.output
+
+    def test_timeout_kills_started_processes(self, tmp_path: Path) -> None:
+        """A timed-out command should not leave its child processes running."""
+        marker = tmp_path / "survived"
+        tool = ShellTool(timeout=1)
+        result = tool.execute(command=f"(sleep 1.5; touch {marker}) & wait")
+
+        assert result.error == "Command timed out after 1 seconds"
+        time.sleep(1)
+        assert not marker.exists()
+
+    def test_output_decoded_leniently(self) -> None:
+        """Output that is not UTF-8 should be replaced, not fail the command."""
+        tool = ShellTool(timeout=10)
+        result = tool.execute(command="printf 'caf\\351\\r\\n'")
+
+        assert result.success is True
+        assert result.output == "caf\ufffd"
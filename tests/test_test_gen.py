@@ -0,0 +1,69 @@
+"""
+Tests for the test generation tool.
+
+Run with: uv run pytest tests/test_test_gen.py
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.tools import test_gen
+
+
+class TestGenerateTests:
+    """Tests for generating tests from a source file."""
+
+    def test_regenerates_after_source_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Cached tests should be reused only while the source is unchanged."""
+        source = tmp_path / "calc.py"
+        source.write_text("def add(a, b):\n    return a + b\n")
+
+        tool = test_gen.TestGenTool(allowed_paths=[tmp_path])
+        analyzed: list[Path] = []
+        analyze_file = tool.generator.analyze_file
+
+        def counting_analyze_file(path: Path) -> Any:
+            analyzed.append(path)
+            return analyze_file(path)
+
+        monkeypatch.setattr(tool.generator, "analyze_file", counting_analyze_file)
+
+        first = tool.execute(source_file=str(source))
+        again = tool.execute(source_file=str(source))
+        source.write_text("def multiply(a, b):\n    return a * b\n")
+        changed = tool.execute(source_file=str(source))
+
+        assert "def test_add" in first.output
+        assert again.output == first.output
+        assert "def test_multiply" in changed.output
+        assert "def test_add" not in changed.output
+        assert len(analyzed) == 2
+
+    def test_refuses_paths_outside_allowed(self, tmp_path: Path) -> None:
+        """Sources outside the allowed directories should be refused."""
+        allowed = tmp_path / "project"
+        allowed.mkdir()
+        outside = tmp_path / "other.py"
+        outside.write_text("def f():\n    pass\n")
+
+        tool = test_gen.TestGenTool(allowed_paths=[allowed])
+        result = tool.execute(source_file=str(outside))
+
+        assert result.success is False
+        assert result.error == f"Path not allowed: {outside.resolve()}"
+
+    def test_rejects_missing_and_non_files(self, tmp_path: Path) -> None:
+        """Missing sources and directories should be reported as such."""
+        package = tmp_path / "pkg.py"
+        package.mkdir()
+
+        tool = test_gen.TestGenTool()
+        missing = tool.execute(source_file=str(tmp_path / "nope.py"))
+        directory = tool.execute(source_file=str(package))
+
+        assert missing.error == f"Source file does not exist: {(tmp_path / 'nope.py').resolve()}"
+        assert directory.error == f"Source file is not a regular file: {package.resolve()}"